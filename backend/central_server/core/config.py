@@ -1,5 +1,6 @@
 # core/config.py
 import os
+from pathlib import Path
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
@@ -39,6 +40,35 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD")
     
 
+    # 인메모리 인용 그래프 설정 (추천 계산을 SQL 대신 CSR 희소 행렬 연산으로 처리)
+    CITATION_GRAPH_ENABLED: bool = True
+    CITATION_GRAPH_COMPACT_MIN_EDGES: int = 10000  # 델타 인용 수가 이 값과
+    CITATION_GRAPH_COMPACT_RATIO: float = 0.05  # 전체 인용 수 × 비율 중 큰 값을 넘으면 base CSR에 병합
+
+    # 사전 계산 유사 논문(paper_similarity) 설정
+    PAPER_SIMILARITY_ENABLED: bool = True
+    PAPER_SIMILARITY_TOP_K: int = 50  # 논문·알고리즘별 저장할 유사 논문 수 (/similar의 limit 최댓값)
+    PAPER_SIMILARITY_BLOCK_ROWS: int = 1024  # 전체 빌드 시 한 번에 곱할 행 수
+    PAPER_SIMILARITY_REFRESH_SECONDS: float = 300.0  # 증분 갱신 주기
+
+    # 저자 지표(author_metrics) 설정
+    AUTHOR_METRICS_ENABLED: bool = True
+    AUTHOR_METRICS_REFRESH_SECONDS: float = 300.0  # 증분 갱신 주기
+
+    # 공동 저자 그래프(coauthor_edge) 설정
+    COAUTHOR_GRAPH_ENABLED: bool = True
+
+    # 트렌딩 점수(paper_trending) 설정
+    PAPER_TRENDING_ENABLED: bool = True
+    PAPER_TRENDING_HALF_LIFE_YEARS: float = 2.0  # 인용 가중치가 절반이 되는 기간 (인용 논문 출판 연도 기준)
+    PAPER_TRENDING_REFRESH_SECONDS: float = 300.0  # 증분 갱신 주기
+
+    # 전문 검색 설정 (core.search_index)
+    SEARCH_TEXT_CONFIG: str = "english"  # PostgreSQL text search configuration
+
+    # 목록 API 페이지네이션 설정 (utils.pagination)
+    PAGINATION_EXACT_COUNT_THRESHOLD: int = 10000  # 예상 결과 수가 이 이상이면 COUNT(*) 대신 실행 계획 추정치 사용
+
     # Central Server 포트 설정
     CENTRAL_SERVER_PORT: int = 8000
     CENTRAL_SERVER_HOST: str = "0.0.0.0"
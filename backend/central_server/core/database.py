@@ -4,6 +4,7 @@ from typing import AsyncGenerator
 from core.config import settings
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from utils.dataloader import RequestLoaders
 
 async_engine = create_async_engine(settings.DATABASE_URL, echo=True)
 AsyncSessionLocal = sessionmaker(
@@ -13,6 +14,7 @@ Base = declarative_base()
 
 async def get_db() -> AsyncGenerator:
   async with AsyncSessionLocal() as db:
+    db.info["loaders"] = RequestLoaders(db)  # 요청 단위 Paper/Author 배치 로더 (utils.dataloader.get_loaders로 사용)
     try:
       yield db
       await db.commit()
@@ -26,10 +28,37 @@ async def get_db() -> AsyncGenerator:
 async def lifespan(app: FastAPI):
   from models import (
       User, Author, Paper, Citation, 
-      Collection, PaperAuthor, CollectionPaper
+      Collection, PaperAuthor, CollectionPaper, PaperSimilarity,
+      AuthorMetrics, CoauthorEdge, PaperTrending
   )
   print("Registered tables:", list(Base.metadata.tables.keys()))
   
   async with async_engine.begin() as conn:
     await conn.run_sync(Base.metadata.create_all)
-  yield
\ No newline at end of file
+
+  from core.search_index import ensure_search_indexes
+  async with async_engine.begin() as conn:
+    await ensure_search_indexes(conn)
+
+  from services.citation_graph import init_citation_graph
+  from services.paper_similarity_service import get_paper_similarity_refresher
+  from services.author_metrics_service import get_author_metrics_refresher
+  from services.coauthor_service import init_coauthor_graph
+  from services.trending_service import get_paper_trending_refresher
+  async with async_engine.connect() as conn:
+    await init_citation_graph(conn)
+  async with AsyncSessionLocal() as db:
+    await init_coauthor_graph(db)
+
+  refreshers = [
+      refresher for refresher in (
+          get_paper_similarity_refresher(AsyncSessionLocal),
+          get_author_metrics_refresher(AsyncSessionLocal),
+          get_paper_trending_refresher(AsyncSessionLocal),
+      ) if refresher
+  ]
+  for refresher in refreshers:
+    refresher.start()
+  yield
+  for refresher in refreshers:
+    await refresher.stop()
\ No newline at end of file
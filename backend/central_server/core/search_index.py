@@ -0,0 +1,127 @@
+# core/search_index.py
+"""
+논문/저자 전문 검색 인덱스 준비.
+
+PostgreSQL: paper.search_vector(Title + Abstract의 생성 tsvector 컬럼)와 GIN 인덱스, 출판 연도 B-tree 인덱스,
+            author.Name의 pg_trgm GIN 인덱스(유사 이름 검색).
+            컬럼 추가가 테이블 전체를 다시 쓰므로 scripts/migrate_search_index.py로 따로 적용하고,
+            서버 시작 시에는 적용 여부만 확인합니다 (미적용이면 LIKE 검색 사용).
+SQLite:     paper_fts / author_fts FTS5 외부 콘텐츠 테이블과 동기화 트리거 (로컬/테스트 환경용, 서버 시작 시 생성)
+"""
+import logging
+import re
+from typing import Dict, List
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PAPER_FTS_TABLE = "paper_fts"
+AUTHOR_FTS_TABLE = "author_fts"
+
+# ensure_search_indexes 결과. False면 검색 쿼리는 방언과 관계없이 LIKE 검색 사용
+_fts_available = True
+
+
+def postgres_migration_statements() -> List[str]:
+    language = settings.SEARCH_TEXT_CONFIG
+    return [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        f"""ALTER TABLE paper ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('{language}', coalesce("Title", '')), 'A') ||
+                setweight(to_tsvector('{language}', coalesce("Abstract", '')), 'B')
+            ) STORED""",
+        "CREATE INDEX IF NOT EXISTS ix_paper_search_vector ON paper USING GIN (search_vector)",
+        'CREATE INDEX IF NOT EXISTS ix_paper_publication_year ON paper ("PublicationYear")',
+        'CREATE INDEX IF NOT EXISTS ix_author_name_trgm ON author USING GIN ("Name" gin_trgm_ops)',
+    ]
+
+
+def _sqlite_statements() -> Dict[str, List[str]]:
+    """FTS 테이블별 생성 DDL. 'rebuild'(기존 행 색인)는 테이블을 새로 만들 때만 ensure_search_indexes가 실행"""
+    statements = {}
+    for table, source, key, columns, tokenizer in (
+        (PAPER_FTS_TABLE, "paper", "PaperId", ["Title", "Abstract"], "porter unicode61"),
+        (AUTHOR_FTS_TABLE, "author", "AuthorId", ["Name"], "trigram"),  # trigram: 부분 문자열 매칭
+    ):
+        column_list = ", ".join(f'"{c}"' for c in columns)
+        new_values = ", ".join(f'new."{c}"' for c in columns)
+        old_values = ", ".join(f'old."{c}"' for c in columns)
+        statements[table] = [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5("
+            f"{column_list}, content='{source}', content_rowid='{key}', tokenize='{tokenizer}')",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON {source} BEGIN "
+            f"INSERT INTO {table}(rowid, {column_list}) VALUES (new.\"{key}\", {new_values}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON {source} BEGIN "
+            f"INSERT INTO {table}({table}, rowid, {column_list}) VALUES ('delete', old.\"{key}\", {old_values}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE ON {source} BEGIN "
+            f"INSERT INTO {table}({table}, rowid, {column_list}) VALUES ('delete', old.\"{key}\", {old_values}); "
+            f"INSERT INTO {table}(rowid, {column_list}) VALUES (new.\"{key}\", {new_values}); END",
+        ]
+    return statements
+
+
+async def ensure_search_indexes(conn: AsyncConnection) -> bool:
+    """
+    현재 DB 방언의 전문 검색 인덱스를 준비(SQLite)하거나 마이그레이션 적용 여부를 확인(PostgreSQL).
+    사용할 수 없으면 False를 반환하고 이후 검색은 LIKE로 처리합니다.
+    """
+    global _fts_available
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        _fts_available = await _postgres_migrated(conn)
+        if not _fts_available:
+            logger.warning("Full-text search columns/extensions are missing. Run 'python -m scripts.migrate_search_index'. "
+                           "Falling back to LIKE search.")
+            return False
+    elif dialect == "sqlite":
+        await _ensure_sqlite_fts(conn)
+    else:
+        _fts_available = False
+        logger.warning(f"Full-text search is not supported on {dialect}. Falling back to LIKE search.")
+        return False
+    logger.info(f"Full-text search indexes ensured ({dialect}).")
+    return True
+
+
+async def _postgres_migrated(conn: AsyncConnection) -> bool:
+    """search_vector 컬럼과 pg_trgm 확장이 모두 있는지 확인 (DDL 없이 카탈로그만 조회)"""
+    result = await conn.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = 'paper' AND column_name = 'search_vector'), "
+        "EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"
+    ))
+    has_column, has_trgm = result.one()
+    return bool(has_column and has_trgm)
+
+
+async def _ensure_sqlite_fts(conn: AsyncConnection) -> None:
+    """FTS 테이블/트리거를 멱등 생성하고, 새로 만든 테이블만 기존 행으로 채움 (매 시작마다 전체 재색인하지 않음)"""
+    statements = _sqlite_statements()
+    result = await conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'table' AND name IN :names").bindparams(
+            bindparam("names", expanding=True)
+        ),
+        {"names": list(statements)}
+    )
+    existing = {name for (name,) in result}
+    for table, table_statements in statements.items():
+        for statement in table_statements:
+            await conn.execute(text(statement))
+        if table not in existing:
+            await conn.execute(text(f"INSERT INTO {table}({table}) VALUES ('rebuild')"))  # 트리거 생성 전에 있던 행 색인
+            logger.info(f"Created and populated FTS table '{table}'.")
+
+
+def search_dialect(dialect: str) -> str:
+    """검색 쿼리 생성에 사용할 방언. 전문 검색 인덱스를 사용할 수 없으면 'like'"""
+    return dialect if _fts_available else "like"
+
+
+def fts5_query(query: str) -> str:
+    """사용자 입력을 FTS5 MATCH 식으로 변환 (단어별 큰따옴표 구문, 모두 포함 조건)"""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in re.findall(r"\w+", query))
@@ -0,0 +1,116 @@
+# crud/author.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, select, func, delete, insert, or_, text, Integer, Float
+from typing import Dict, Iterable, List, Optional, Tuple
+from core.search_index import AUTHOR_FTS_TABLE
+from models import Author, AuthorMetrics, PaperAuthor
+from utils.pagination import SortKeys
+
+
+async def get_authors_by_ids(db: AsyncSession, author_ids: Iterable[int]) -> Dict[int, Author]:
+    """여러 저자를 IN 쿼리 한 번으로 조회하여 {AuthorId: Author} 반환 (없는 ID는 제외)"""
+    author_ids = list(dict.fromkeys(author_ids))
+    if not author_ids:
+        return {}
+    result = await db.execute(select(Author).where(Author.AuthorId.in_(author_ids)))
+    return {author.AuthorId: author for author in result.scalars()}
+
+
+async def get_author_with_metrics(db: AsyncSession, author_id: int) -> Optional[Tuple[Author, Optional[AuthorMetrics]]]:
+    """저자와 사전 계산 지표를 한 번의 쿼리로 조회 (지표가 아직 없으면 None, 저자가 없으면 None 반환)"""
+    result = await db.execute(
+        select(Author, AuthorMetrics)
+        .outerjoin(AuthorMetrics, AuthorMetrics.AuthorId == Author.AuthorId)
+        .where(Author.AuthorId == author_id)
+    )
+    row = result.first()
+    return (row[0], row[1]) if row else None
+
+
+async def get_author_paper_links(
+    db: AsyncSession,
+    author_ids: Optional[Iterable[int]] = None
+) -> List[Tuple[int, int]]:
+    """(AuthorId, PaperId) 저자-논문 연결 목록 (author_ids가 없으면 전체)"""
+    query = select(PaperAuthor.AuthorId, PaperAuthor.PaperId)
+    if author_ids is not None:
+        author_ids = list(dict.fromkeys(author_ids))
+        if not author_ids:
+            return []
+        query = query.where(PaperAuthor.AuthorId.in_(author_ids))
+    result = await db.execute(query)
+    return [(author_id, paper_id) for author_id, paper_id in result]
+
+
+async def get_author_ids_for_papers(db: AsyncSession, paper_ids: Iterable[int]) -> List[int]:
+    """주어진 논문들의 저자 ID 목록 (중복 제거)"""
+    paper_ids = list(dict.fromkeys(paper_ids))
+    if not paper_ids:
+        return []
+    result = await db.execute(
+        select(PaperAuthor.AuthorId).where(PaperAuthor.PaperId.in_(paper_ids)).distinct()
+    )
+    return [author_id for author_id, in result]
+
+
+async def count_author_metrics(db: AsyncSession) -> int:
+    return (await db.execute(select(func.count()).select_from(AuthorMetrics))).scalar_one()
+
+
+async def replace_author_metrics(
+    db: AsyncSession,
+    author_ids: Iterable[int],
+    metrics: Dict[int, Dict[str, int]],
+    chunk_size: int = 5000
+) -> int:
+    """author_ids의 지표 행을 metrics로 교체 (metrics에 없는 저자는 행 삭제). 커밋은 호출 측에서 합니다."""
+    author_ids = list(dict.fromkeys(author_ids))
+    for start in range(0, len(author_ids), chunk_size):
+        await db.execute(delete(AuthorMetrics).where(AuthorMetrics.AuthorId.in_(author_ids[start:start + chunk_size])))
+    rows = [{"AuthorId": author_id, **values} for author_id, values in metrics.items()]
+    for start in range(0, len(rows), chunk_size):
+        await db.execute(insert(AuthorMetrics), rows[start:start + chunk_size])
+    return len(rows)
+
+
+async def delete_all_author_metrics(db: AsyncSession) -> None:
+    await db.execute(delete(AuthorMetrics))
+
+
+def search_authors_statement(dialect: str, query: str) -> Tuple[Select, SortKeys]:
+    """
+    저자 이름 검색 SELECT와 정렬 키 (유사도 순, 동점은 AuthorId 순).
+    PostgreSQL은 pg_trgm 인덱스로 부분 일치(ILIKE)와 유사 이름(%)을 함께 찾아 similarity 순,
+    SQLite는 author_fts trigram MATCH의 bm25 순(3자 미만은 LIKE)입니다.
+    """
+    query = query.strip()
+    pattern = f"%{query}%"
+    if dialect == "postgresql":
+        statement = select(Author).where(or_(Author.Name.ilike(pattern), Author.Name.op("%")(query)))
+        return statement, [(func.similarity(Author.Name, query), True), (Author.AuthorId, False)]
+    if dialect == "sqlite" and len(query) >= 3:
+        matches = (
+            text(f"SELECT rowid AS author_id, bm25({AUTHOR_FTS_TABLE}) AS rank "
+                 f"FROM {AUTHOR_FTS_TABLE} WHERE {AUTHOR_FTS_TABLE} MATCH :match")
+            .bindparams(match='"' + query.replace('"', '""') + '"')
+            .columns(author_id=Integer, rank=Float)
+            .subquery()
+        )
+        statement = select(Author).join(matches, matches.c.author_id == Author.AuthorId)
+        return statement, [(matches.c.rank, False), (Author.AuthorId, False)]
+    return select(Author).where(Author.Name.ilike(pattern)), [(Author.Name, False), (Author.AuthorId, False)]
+
+
+async def get_paper_counts(db: AsyncSession, author_ids: Iterable[int]) -> Dict[int, int]:
+    """저자별 논문 수 (GROUP BY 한 번, 논문이 없는 저자는 0)"""
+    author_ids = list(dict.fromkeys(author_ids))
+    counts = {author_id: 0 for author_id in author_ids}
+    if not author_ids:
+        return counts
+    result = await db.execute(
+        select(PaperAuthor.AuthorId, func.count())
+        .where(PaperAuthor.AuthorId.in_(author_ids))
+        .group_by(PaperAuthor.AuthorId)
+    )
+    counts.update(dict(result.all()))
+    return counts
@@ -0,0 +1,135 @@
+# crud/coauthor.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, delete, insert, or_, and_, exists
+from sqlalchemy.orm import aliased
+from typing import List, Optional, Tuple
+from models import Author, CoauthorEdge, Paper, PaperAuthor
+
+
+def coauthor_pairs_select(author_ids: Optional[List[int]] = None, exclude_ids: Optional[List[int]] = None):
+    """
+    paper_author 자기 조인으로 (AuthorId, CoauthorId, 공유 논문 수, 최근 연도)를 집계하는 SELECT.
+    author_ids가 있으면 그 저자들에서 시작하는 쌍만, exclude_ids가 있으면 그 저자들과 이어지는 쌍은 제외합니다.
+    """
+    mine, theirs = aliased(PaperAuthor), aliased(PaperAuthor)
+    query = (
+        select(mine.AuthorId, theirs.AuthorId, func.count(), func.max(Paper.PublicationYear))
+        .join(theirs, and_(theirs.PaperId == mine.PaperId, theirs.AuthorId != mine.AuthorId))
+        .join(Paper, Paper.PaperId == mine.PaperId)
+        .group_by(mine.AuthorId, theirs.AuthorId)
+    )
+    if author_ids is not None:
+        query = query.where(mine.AuthorId.in_(author_ids))
+    if exclude_ids:
+        query = query.where(theirs.AuthorId.notin_(exclude_ids))
+    return query
+
+
+def insert_coauthor_pairs(select_query):
+    return insert(CoauthorEdge).from_select(
+        ["AuthorId", "CoauthorId", "SharedPapers", "LastYear"], select_query
+    )
+
+
+def refresh_statements(author_ids: List[int]) -> list:
+    """
+    author_ids가 포함된 모든 간선을 paper_author 기준으로 정확히 다시 만드는 문장들 (순서대로 실행).
+    삭제 후 (1) 이 저자들에서 나가는 간선과 (2) 다른 저자에서 이 저자들로 들어오는 간선을 다시 집계합니다.
+    """
+    mine, theirs = aliased(PaperAuthor), aliased(PaperAuthor)
+    incoming = (
+        select(mine.AuthorId, theirs.AuthorId, func.count(), func.max(Paper.PublicationYear))
+        .join(theirs, and_(theirs.PaperId == mine.PaperId, theirs.AuthorId != mine.AuthorId))
+        .join(Paper, Paper.PaperId == mine.PaperId)
+        .where(theirs.AuthorId.in_(author_ids), mine.AuthorId.notin_(author_ids))
+        .group_by(mine.AuthorId, theirs.AuthorId)
+    )
+    return [
+        delete(CoauthorEdge).where(
+            or_(CoauthorEdge.AuthorId.in_(author_ids), CoauthorEdge.CoauthorId.in_(author_ids))
+        ),
+        insert_coauthor_pairs(coauthor_pairs_select(author_ids)),
+        insert_coauthor_pairs(incoming),
+    ]
+
+
+async def rebuild_coauthor_edges(db: AsyncSession) -> int:
+    """공동 저자 간선 전체를 INSERT ... SELECT 한 번으로 다시 만듦. 커밋은 호출 측에서 합니다."""
+    await db.execute(delete(CoauthorEdge))
+    await db.execute(insert_coauthor_pairs(coauthor_pairs_select()))
+    return await count_coauthor_edges(db)
+
+
+async def count_coauthor_edges(db: AsyncSession) -> int:
+    return (await db.execute(select(func.count()).select_from(CoauthorEdge))).scalar_one()
+
+
+async def get_coauthors(
+    db: AsyncSession,
+    author_id: int,
+    limit: int = 20
+) -> List[Tuple[Author, int, Optional[int]]]:
+    """공동 저자를 공유 논문 수, 최근 연도 순으로 조회 (coauthor_edge 범위 조회)"""
+    result = await db.execute(
+        select(Author, CoauthorEdge.SharedPapers, CoauthorEdge.LastYear)
+        .join(Author, Author.AuthorId == CoauthorEdge.CoauthorId)
+        .where(CoauthorEdge.AuthorId == author_id)
+        .order_by(CoauthorEdge.SharedPapers.desc(), CoauthorEdge.LastYear.desc(), CoauthorEdge.CoauthorId)
+        .limit(limit)
+    )
+    return [(author, shared, last_year) for author, shared, last_year in result]
+
+
+async def get_coauthors_live(
+    db: AsyncSession,
+    author_id: int,
+    limit: int = 20
+) -> List[Tuple[Author, int, Optional[int]]]:
+    """coauthor_edge 없이 paper_author 자기 조인으로 공동 저자를 바로 집계 (공동 저자 그래프 비활성화 시)"""
+    pairs = coauthor_pairs_select([author_id]).subquery()
+    columns = list(pairs.c)
+    result = await db.execute(
+        select(Author, columns[2], columns[3])
+        .join(pairs, Author.AuthorId == columns[1])
+        .order_by(columns[2].desc(), columns[3].desc(), Author.AuthorId)
+        .limit(limit)
+    )
+    return [(author, shared, last_year) for author, shared, last_year in result]
+
+
+async def get_second_degree_coauthors(
+    db: AsyncSession,
+    author_id: int,
+    limit: int = 20,
+    min_shared_papers: int = 1
+) -> List[Tuple[Author, int, int]]:
+    """
+    공동 저자의 공동 저자(2-hop) 중 직접 공동 저자가 아닌 저자.
+    (저자, 중간 공동 저자 수, 경로 가중치 = 경로별 min(공유 논문 수)의 합)을 중간 공동 저자 수 순으로 반환합니다.
+    """
+    first, second, direct = aliased(CoauthorEdge), aliased(CoauthorEdge), aliased(CoauthorEdge)
+    mutual = func.count().label("mutual")
+    weight = func.sum(
+        func.min(first.SharedPapers, second.SharedPapers)
+        if db.bind.dialect.name == "sqlite" else func.least(first.SharedPapers, second.SharedPapers)
+    ).label("weight")
+    candidates = (
+        select(second.CoauthorId.label("AuthorId"), mutual, weight)
+        .join(second, second.AuthorId == first.CoauthorId)
+        .where(
+            first.AuthorId == author_id,
+            first.SharedPapers >= min_shared_papers,
+            second.SharedPapers >= min_shared_papers,
+            second.CoauthorId != author_id,
+            ~exists().where(direct.AuthorId == author_id, direct.CoauthorId == second.CoauthorId)
+        )
+        .group_by(second.CoauthorId)
+        .subquery()
+    )
+    result = await db.execute(
+        select(Author, candidates.c.mutual, candidates.c.weight)
+        .join(candidates, candidates.c.AuthorId == Author.AuthorId)
+        .order_by(candidates.c.mutual.desc(), candidates.c.weight.desc(), Author.AuthorId)
+        .limit(limit)
+    )
+    return [(author, mutual_count, int(path_weight)) for author, mutual_count, path_weight in result]
@@ -0,0 +1,196 @@
+# crud/paper.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, select, func, or_, text, literal_column, false, Integer, Float
+from typing import Dict, Iterable, List, Optional, Tuple
+from core.config import settings
+from core.search_index import PAPER_FTS_TABLE, fts5_query
+from models import Author, Citation, Paper, PaperAuthor
+from utils.pagination import SortKeys
+
+
+async def get_papers_by_ids(db: AsyncSession, paper_ids: Iterable[int]) -> Dict[int, Paper]:
+    """여러 논문을 IN 쿼리 한 번으로 조회하여 {PaperId: Paper} 반환 (없는 ID는 제외)"""
+    paper_ids = list(dict.fromkeys(paper_ids))
+    if not paper_ids:
+        return {}
+    result = await db.execute(select(Paper).where(Paper.PaperId.in_(paper_ids)))
+    return {paper.PaperId: paper for paper in result.scalars()}
+
+
+async def get_authors_for_papers(db: AsyncSession, paper_ids: Iterable[int]) -> Dict[int, List[str]]:
+    """
+    여러 논문의 저자 이름을 paper_author JOIN author 한 번의 쿼리로 조회하여 {PaperId: [저자 이름]} 반환.
+    paper_author에는 저자 순서 컬럼이 없으므로 논문별 저자는 AuthorId 순서로 고정됩니다 (get_paper_authors와 동일).
+    저자가 없는 논문도 빈 목록으로 포함됩니다.
+    """
+    paper_ids = list(dict.fromkeys(paper_ids))
+    authors: Dict[int, List[str]] = {paper_id: [] for paper_id in paper_ids}
+    if not paper_ids:
+        return authors
+    result = await db.execute(
+        select(PaperAuthor.PaperId, Author.Name)
+        .join(Author, Author.AuthorId == PaperAuthor.AuthorId)
+        .where(PaperAuthor.PaperId.in_(paper_ids))
+        .order_by(PaperAuthor.PaperId, PaperAuthor.AuthorId)
+    )
+    for paper_id, name in result:
+        authors[paper_id].append(name)
+    return authors
+
+
+async def get_paper_authors(db: AsyncSession, paper_id: int) -> List[str]:
+    """단일 논문의 저자 이름 목록 (AuthorId 순서)"""
+    return (await get_authors_for_papers(db, [paper_id]))[paper_id]
+
+
+async def get_citation_counts(db: AsyncSession, paper_ids: Iterable[int]) -> Dict[int, int]:
+    """여러 논문의 피인용 수를 GROUP BY 한 번의 쿼리로 조회 (인용되지 않은 논문은 0)"""
+    paper_ids = list(dict.fromkeys(paper_ids))
+    counts: Dict[int, int] = {paper_id: 0 for paper_id in paper_ids}
+    if not paper_ids:
+        return counts
+    result = await db.execute(
+        select(Citation.CitedPaperId, func.count())
+        .where(Citation.CitedPaperId.in_(paper_ids))
+        .group_by(Citation.CitedPaperId)
+    )
+    for paper_id, count in result:
+        counts[paper_id] = count
+    return counts
+
+
+async def get_paper_stats(db: AsyncSession, paper_id: int) -> Dict[str, int]:
+    """한 논문의 피인용 수 / 참고문헌 수 / 저자 수를 스칼라 서브쿼리 한 번으로 조회"""
+    result = await db.execute(select(
+        select(func.count()).select_from(Citation).where(Citation.CitedPaperId == paper_id).scalar_subquery(),
+        select(func.count()).select_from(Citation).where(Citation.CitingPaperId == paper_id).scalar_subquery(),
+        select(func.count()).select_from(PaperAuthor).where(PaperAuthor.PaperId == paper_id).scalar_subquery(),
+    ))
+    citation_count, reference_count, author_count = result.one()
+    return {"citation_count": citation_count, "reference_count": reference_count, "author_count": author_count}
+
+
+async def get_citation_edges(db: AsyncSession, paper_ids: Iterable[int]) -> List[Tuple[int, int]]:
+    """주어진 논문들이 인용하거나 인용된 모든 (CitingPaperId, CitedPaperId) 엣지를 한 번의 쿼리로 조회"""
+    paper_ids = list(dict.fromkeys(paper_ids))
+    if not paper_ids:
+        return []
+    result = await db.execute(
+        select(Citation.CitingPaperId, Citation.CitedPaperId)
+        .where(or_(Citation.CitingPaperId.in_(paper_ids), Citation.CitedPaperId.in_(paper_ids)))
+    )
+    return [(citing, cited) for citing, cited in result]
+
+
+async def get_citation_edges_within(db: AsyncSession, paper_ids: Iterable[int]) -> List[Tuple[int, int]]:
+    """주어진 논문들 사이의 (CitingPaperId, CitedPaperId) 엣지만 한 번의 쿼리로 조회 (양 끝이 모두 목록에 있는 경우)"""
+    paper_ids = list(dict.fromkeys(paper_ids))
+    if not paper_ids:
+        return []
+    result = await db.execute(
+        select(Citation.CitingPaperId, Citation.CitedPaperId)
+        .where(Citation.CitingPaperId.in_(paper_ids), Citation.CitedPaperId.in_(paper_ids))
+    )
+    return [(citing, cited) for citing, cited in result]
+
+
+async def get_publication_years(
+    db: AsyncSession,
+    paper_ids: Iterable[int],
+    min_year: int,
+    chunk_size: int = 5000
+) -> Dict[int, int]:
+    """후보 논문 중 min_year 이후 출판된 논문의 {PaperId: PublicationYear} (IN 목록은 chunk_size 단위로 나눠 조회)"""
+    paper_ids = list(dict.fromkeys(paper_ids))
+    years: Dict[int, int] = {}
+    for start in range(0, len(paper_ids), chunk_size):
+        result = await db.execute(
+            select(Paper.PaperId, Paper.PublicationYear)
+            .where(Paper.PaperId.in_(paper_ids[start:start + chunk_size]), Paper.PublicationYear >= min_year)
+        )
+        years.update({paper_id: year for paper_id, year in result})
+    return years
+
+
+async def get_all_citation_counts(db: AsyncSession) -> Dict[int, int]:
+    """인용된 적 있는 모든 논문의 피인용 수 (GROUP BY 한 번, 일괄 집계 작업용)"""
+    result = await db.execute(
+        select(Citation.CitedPaperId, func.count()).group_by(Citation.CitedPaperId)
+    )
+    return {paper_id: count for paper_id, count in result}
+
+
+def recent_first_sort_keys() -> SortKeys:
+    """최신 출판 연도 순 (연도 없는 논문은 마지막), 같은 연도는 PaperId 순"""
+    return [(func.coalesce(Paper.PublicationYear, -1), True), (Paper.PaperId, False)]
+
+
+def search_papers_statement(
+    dialect: str,
+    query: str,
+    year_min: Optional[int] = None,
+    year_max: Optional[int] = None
+) -> Tuple[Select, SortKeys]:
+    """
+    제목/초록 전문 검색 SELECT와 정렬 키 (관련도 순, 동점은 PaperId 순). 연도 조건은 전문 검색과 같은 쿼리에서 인덱스로 함께 거릅니다.
+    PostgreSQL은 search_vector @@ websearch_to_tsquery + ts_rank, SQLite는 paper_fts MATCH + bm25,
+    그 외 방언은 LIKE를 사용합니다 (core.search_index 참고). 빈 쿼리는 최신 논문 순입니다.
+    """
+    statement = select(Paper)
+    if year_min is not None:
+        statement = statement.where(Paper.PublicationYear >= year_min)
+    if year_max is not None:
+        statement = statement.where(Paper.PublicationYear <= year_max)
+
+    query = (query or "").strip()
+    if not query:
+        return statement, recent_first_sort_keys()
+    if dialect == "postgresql":
+        vector = literal_column("paper.search_vector")
+        ts_query = func.websearch_to_tsquery(settings.SEARCH_TEXT_CONFIG, query)
+        return statement.where(vector.op("@@")(ts_query)), [(func.ts_rank(vector, ts_query), True), (Paper.PaperId, False)]
+    if dialect == "sqlite":
+        match = fts5_query(query)
+        if not match:
+            return statement.where(false()), [(Paper.PaperId, False)]
+        matches = (
+            text(f"SELECT rowid AS paper_id, bm25({PAPER_FTS_TABLE}, 10.0, 1.0) AS rank "
+                 f"FROM {PAPER_FTS_TABLE} WHERE {PAPER_FTS_TABLE} MATCH :match")
+            .bindparams(match=match)
+            .columns(paper_id=Integer, rank=Float)
+            .subquery()
+        )
+        # bm25는 작을수록 관련도 높음, 제목 가중치 10
+        return statement.join(matches, matches.c.paper_id == Paper.PaperId), [(matches.c.rank, False), (Paper.PaperId, False)]
+    pattern = f"%{query}%"
+    return statement.where(or_(Paper.Title.ilike(pattern), Paper.Abstract.ilike(pattern))), [(Paper.PaperId, False)]
+
+
+def paper_references_statement(paper_id: int) -> Tuple[Select, SortKeys]:
+    """paper_id가 인용한 논문들 (최신 순)"""
+    statement = (
+        select(Paper)
+        .join(Citation, Citation.CitedPaperId == Paper.PaperId)
+        .where(Citation.CitingPaperId == paper_id)
+    )
+    return statement, recent_first_sort_keys()
+
+
+def paper_citations_statement(paper_id: int) -> Tuple[Select, SortKeys]:
+    """paper_id를 인용한 논문들 (최신 순)"""
+    statement = (
+        select(Paper)
+        .join(Citation, Citation.CitingPaperId == Paper.PaperId)
+        .where(Citation.CitedPaperId == paper_id)
+    )
+    return statement, recent_first_sort_keys()
+
+
+def author_papers_statement(author_id: int) -> Tuple[Select, SortKeys]:
+    """저자의 논문들 (최신 순)"""
+    statement = (
+        select(Paper)
+        .join(PaperAuthor, PaperAuthor.PaperId == Paper.PaperId)
+        .where(PaperAuthor.AuthorId == author_id)
+    )
+    return statement, recent_first_sort_keys()
@@ -0,0 +1,62 @@
+# crud/paper_similarity.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, insert, func
+from typing import Dict, List, Tuple
+from models import Paper, PaperSimilarity
+
+
+async def get_similar_papers(
+    db: AsyncSession,
+    paper_id: int,
+    algorithm: str,
+    limit: int
+) -> List[Tuple[Paper, float, int]]:
+    """사전 계산된 유사 논문 목록을 순위대로 조회 ((PaperId, Algorithm, Rank) 기본 키 범위 조회)"""
+    result = await db.execute(
+        select(Paper, PaperSimilarity.Score, PaperSimilarity.CommonCount)
+        .join(Paper, Paper.PaperId == PaperSimilarity.SimilarPaperId)
+        .where(PaperSimilarity.PaperId == paper_id, PaperSimilarity.Algorithm == algorithm)
+        .order_by(PaperSimilarity.Rank)
+        .limit(limit)
+    )
+    return [(paper, score, common_count) for paper, score, common_count in result]
+
+
+async def count_rows(db: AsyncSession, algorithm: str) -> int:
+    result = await db.execute(
+        select(func.count()).select_from(PaperSimilarity).where(PaperSimilarity.Algorithm == algorithm)
+    )
+    return result.scalar_one()
+
+
+async def replace_neighbors(
+    db: AsyncSession,
+    algorithm: str,
+    neighbors: Dict[int, List[Tuple[int, float, int]]],
+    chunk_size: int = 5000
+) -> int:
+    """
+    주어진 논문들의 유사 논문 목록을 통째로 교체. neighbors는 {PaperId: [(SimilarPaperId, Score, CommonCount)]} (순위 순).
+    이웃이 없는 논문은 빈 목록을 넘기면 기존 행만 삭제됩니다. 커밋은 호출 측에서 합니다.
+    """
+    paper_ids = list(neighbors)
+    for start in range(0, len(paper_ids), chunk_size):
+        await db.execute(
+            delete(PaperSimilarity).where(
+                PaperSimilarity.Algorithm == algorithm,
+                PaperSimilarity.PaperId.in_(paper_ids[start:start + chunk_size])
+            )
+        )
+    rows = [
+        {"PaperId": paper_id, "Algorithm": algorithm, "Rank": rank, "SimilarPaperId": similar_id,
+         "Score": score, "CommonCount": common_count}
+        for paper_id, items in neighbors.items()
+        for rank, (similar_id, score, common_count) in enumerate(items, start=1)
+    ]
+    for start in range(0, len(rows), chunk_size):
+        await db.execute(insert(PaperSimilarity), rows[start:start + chunk_size])
+    return len(rows)
+
+
+async def delete_algorithm(db: AsyncSession, algorithm: str) -> None:
+    await db.execute(delete(PaperSimilarity).where(PaperSimilarity.Algorithm == algorithm))
@@ -0,0 +1,86 @@
+# crud/paper_trending.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, insert, func
+from sqlalchemy.orm import aliased
+from typing import Dict, Iterable, List, Optional, Tuple
+from models import Citation, Paper, PaperTrending
+
+
+async def get_citation_year_counts(
+    db: AsyncSession,
+    paper_ids: Optional[Iterable[int]] = None,
+    chunk_size: int = 5000
+) -> List[Tuple[int, Optional[int], Optional[int], int]]:
+    """
+    피인용 논문별·인용 논문 출판 연도별 인용 수 (CitedPaperId, 피인용 논문 연도, 인용 논문 연도, 인용 수).
+    paper_ids가 없으면 전체 citation 테이블을 GROUP BY 한 번으로 집계합니다.
+    """
+    cited, citing = aliased(Paper), aliased(Paper)
+    statement = (
+        select(Citation.CitedPaperId, cited.PublicationYear, citing.PublicationYear, func.count())
+        .join(cited, cited.PaperId == Citation.CitedPaperId)
+        .join(citing, citing.PaperId == Citation.CitingPaperId)
+        .group_by(Citation.CitedPaperId, cited.PublicationYear, citing.PublicationYear)
+    )
+    if paper_ids is None:
+        return [tuple(row) for row in await db.execute(statement)]
+    paper_ids = list(dict.fromkeys(paper_ids))
+    rows = []
+    for start in range(0, len(paper_ids), chunk_size):
+        result = await db.execute(statement.where(Citation.CitedPaperId.in_(paper_ids[start:start + chunk_size])))
+        rows += [tuple(row) for row in result]
+    return rows
+
+
+async def get_referenced_paper_ids(db: AsyncSession, paper_ids: Iterable[int]) -> List[int]:
+    """주어진 논문들이 인용한 논문 ID (인용 논문의 출판 연도가 바뀌면 이 논문들의 점수가 달라짐)"""
+    paper_ids = list(dict.fromkeys(paper_ids))
+    if not paper_ids:
+        return []
+    result = await db.execute(
+        select(Citation.CitedPaperId).where(Citation.CitingPaperId.in_(paper_ids)).distinct()
+    )
+    return list(result.scalars())
+
+
+async def get_trending_papers(
+    db: AsyncSession,
+    limit: int,
+    year: Optional[int] = None,
+    year_min: Optional[int] = None
+) -> List[Tuple[Paper, float]]:
+    """점수 순 상위 논문 (year 지정 시 (PublicationYear, Score) 인덱스의 해당 연도 구간만 읽음)"""
+    statement = select(Paper, PaperTrending.Score).join(Paper, Paper.PaperId == PaperTrending.PaperId)
+    if year is not None:
+        statement = statement.where(PaperTrending.PublicationYear == year)
+    elif year_min is not None:
+        statement = statement.where(PaperTrending.PublicationYear >= year_min)
+    result = await db.execute(
+        statement.order_by(PaperTrending.Score.desc(), PaperTrending.PaperId.desc()).limit(limit)
+    )
+    return [(paper, score) for paper, score in result]
+
+
+async def get_score_year(db: AsyncSession) -> Optional[int]:
+    """저장된 점수의 감쇠 기준 연도 (테이블이 비어 있으면 None)"""
+    return (await db.execute(select(func.min(PaperTrending.ScoreYear)))).scalar_one()
+
+
+async def replace_trending(
+    db: AsyncSession,
+    paper_ids: Iterable[int],
+    scores: Dict[int, Dict],
+    chunk_size: int = 5000
+) -> int:
+    """paper_ids의 점수 행을 scores로 교체 (scores에 없는 논문은 행 삭제). 커밋은 호출 측에서 합니다."""
+    paper_ids = list(dict.fromkeys(paper_ids))
+    for start in range(0, len(paper_ids), chunk_size):
+        await db.execute(delete(PaperTrending).where(PaperTrending.PaperId.in_(paper_ids[start:start + chunk_size])))
+    rows = [{"PaperId": paper_id, **values} for paper_id, values in scores.items()]
+    for start in range(0, len(rows), chunk_size):
+        await db.execute(insert(PaperTrending), rows[start:start + chunk_size])
+    return len(rows)
+
+
+async def delete_all_trending(db: AsyncSession) -> None:
+    await db.execute(delete(PaperTrending))
@@ -5,6 +5,10 @@ from .citation_model import Citation
 from .collection_model import Collection
 from .paper_author_model import PaperAuthor
 from .collection_paper_model import CollectionPaper
+from .paper_similarity_model import PaperSimilarity
+from .author_metrics_model import AuthorMetrics
+from .coauthor_edge_model import CoauthorEdge
+from .paper_trending_model import PaperTrending
 
 __all__ = [
     "User",
@@ -14,4 +18,8 @@ __all__ = [
     "Collection",
     "PaperAuthor",
     "CollectionPaper",
+    "PaperSimilarity",
+    "AuthorMetrics",
+    "CoauthorEdge",
+    "PaperTrending",
 ]
\ No newline at end of file
@@ -0,0 +1,15 @@
+from datetime import datetime
+from sqlalchemy import Integer, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from core.database import Base
+
+class AuthorMetrics(Base):
+    """저자별 사전 계산 지표 (services.author_metrics_service가 갱신)"""
+    __tablename__ = 'author_metrics'
+
+    AuthorId: Mapped[int] = mapped_column(ForeignKey('author.AuthorId'), primary_key=True)
+    PaperCount: Mapped[int] = mapped_column(Integer, default=0)
+    TotalCitations: Mapped[int] = mapped_column(Integer, default=0)
+    HIndex: Mapped[int] = mapped_column(Integer, default=0)
+    I10Index: Mapped[int] = mapped_column(Integer, default=0)  # 피인용 10회 이상 논문 수
+    UpdatedAt: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,19 @@
+from typing import Optional
+from sqlalchemy import Integer, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from core.database import Base
+
+class CoauthorEdge(Base):
+    """공동 저자 가중 인접 리스트 (양방향 모두 저장, services.coauthor_service가 유지)"""
+    __tablename__ = 'coauthor_edge'
+
+    # 복합 기본 키: AuthorId로 시작하므로 저자별 공동 저자 조회는 인덱스 범위 조회 한 번
+    AuthorId: Mapped[int] = mapped_column(ForeignKey('author.AuthorId'), primary_key=True)
+    CoauthorId: Mapped[int] = mapped_column(ForeignKey('author.AuthorId'), primary_key=True)
+
+    SharedPapers: Mapped[int] = mapped_column(Integer)
+    LastYear: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # 함께 쓴 논문의 최근 출판 연도
+
+    __table_args__ = (
+        Index("ix_coauthor_edge_author_weight", "AuthorId", "SharedPapers"),
+    )
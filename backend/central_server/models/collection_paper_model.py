@@ -17,5 +17,5 @@ class CollectionPaper(Base):
     
     # Relationship: N:1 관계
     collection: Mapped["Collection"] = relationship(back_populates="collection_papers")
-    paper: Mapped["Paper"] = relationship(back_populates="collection_papers")
-    user: Mapped["User"] = relationship(back_populates="collection_papers")
\ No newline at end of file
+    paper: Mapped["Paper"] = relationship(back_populates="collections")
+    user: Mapped["User"] = relationship(back_populates="collected_papers")
\ No newline at end of file
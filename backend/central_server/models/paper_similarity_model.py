@@ -0,0 +1,22 @@
+from datetime import datetime
+from sqlalchemy import Integer, String, DateTime, ForeignKey, Float, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from core.database import Base
+
+class PaperSimilarity(Base):
+    """논문별·알고리즘별 사전 계산된 상위 K개 유사 논문 (services.paper_similarity_service가 갱신)"""
+    __tablename__ = 'paper_similarity'
+
+    # 복합 기본 키: (논문, 알고리즘, 순위) → /papers/{id}/similar는 이 키의 범위 조회 한 번
+    PaperId: Mapped[int] = mapped_column(ForeignKey('paper.PaperId'), primary_key=True)
+    Algorithm: Mapped[str] = mapped_column(String(32), primary_key=True)  # co_citation | bibliographic_coupling
+    Rank: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    SimilarPaperId: Mapped[int] = mapped_column(ForeignKey('paper.PaperId'))
+    Score: Mapped[float] = mapped_column(Float)
+    CommonCount: Mapped[int] = mapped_column(Integer)
+    UpdatedAt: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_paper_similarity_similar_paper", "SimilarPaperId"),
+    )
@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Integer, DateTime, ForeignKey, Float, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from core.database import Base
+
+class PaperTrending(Base):
+    """논문별 사전 계산 트렌딩 점수 (services.trending_service가 갱신, 인용된 적 있는 논문만 저장)"""
+    __tablename__ = 'paper_trending'
+
+    PaperId: Mapped[int] = mapped_column(ForeignKey('paper.PaperId'), primary_key=True)
+    Score: Mapped[float] = mapped_column(Float)  # 시간 감쇠 인용 속도: Σ 2^(-(기준 연도 - 인용 논문 연도) / 반감기)
+    CitationCount: Mapped[int] = mapped_column(Integer, default=0)
+    PublicationYear: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # 연도별 파티션 조회용 (paper에서 복사)
+    ScoreYear: Mapped[int] = mapped_column(Integer)  # 감쇠 기준 연도 (해가 바뀌면 전체 재계산)
+    UpdatedAt: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        # /papers/trending 상위 N개 조회는 두 인덱스 중 하나의 앞부분만 읽음
+        Index("ix_paper_trending_score", "Score", "PaperId"),
+        Index("ix_paper_trending_year_score", "PublicationYear", "Score", "PaperId"),
+    )
@@ -1,37 +1,49 @@
 # routers/author.py
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 
+from core.config import settings
 from core.database import get_db
-from schemas.author import AuthorResponse, AuthorDetailResponse
+from core.search_index import search_dialect
+from schemas.author import AuthorResponse, AuthorDetailResponse, SecondDegreeCoauthorResponse
 from schemas.paper import PaperResponse
 from crud import author as author_crud
 from services.paper_service import PaperService
+from services.author_metrics_service import AuthorMetricsService
+from services.coauthor_service import CoauthorService
+from utils.pagination import CursorPage, paginate_keyset
 
 router = APIRouter(prefix="/authors", tags=["authors"])
 
 
-@router.get("/search", response_model=List[AuthorResponse])
+@router.get("/search", response_model=CursorPage[AuthorResponse])
 async def search_authors(
     query: str = Query(..., min_length=2, description="Author name to search"),
-    limit: int = Query(20, le=100, description="Maximum results"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum results"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     db: AsyncSession = Depends(get_db)
 ):
     """저자 검색"""
-    authors_with_count = await author_crud.search_authors(
-        db, query, limit, offset
-    )
+    statement, sort_keys = author_crud.search_authors_statement(search_dialect(db.bind.dialect.name), query)
+    try:
+        page = await paginate_keyset(
+            db, statement, sort_keys, cursor, limit,
+            f"authors.search|{query.strip()}", settings.PAGINATION_EXACT_COUNT_THRESHOLD
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return [
+    paper_counts = await author_crud.get_paper_counts(db, [author.AuthorId for author in page["items"]])
+    page["items"] = [
         {
-            "author_id": author.AuthorId,
+            "author_id": str(author.AuthorId),
             "name": author.Name,
-            "paper_count": paper_count
+            "paper_count": paper_counts[author.AuthorId]
         }
-        for author, paper_count in authors_with_count
+        for author in page["items"]
     ]
+    return page
 
 
 @router.get("/{author_id}", response_model=AuthorDetailResponse)
@@ -39,31 +51,30 @@ async def get_author_detail(
     author_id: str,
     db: AsyncSession = Depends(get_db)
 ):
-    """저자 상세 정보"""
-    stats = await author_crud.get_author_stats(db, author_id)
+    """저자 상세 정보 (논문 수, 총 피인용 수, h-index, i10-index)"""
+    try:
+        detail = await AuthorMetricsService.get_author_detail(db, author_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid author id")
     
-    if not stats:
+    if not detail:
         raise HTTPException(status_code=404, detail="Author not found")
     
-    return {
-        **stats,
-        "h_index": None  # TODO: h-index 계산 구현
-    }
+    return detail
 
 
-@router.get("/{author_id}/papers", response_model=List[PaperResponse])
+@router.get("/{author_id}/papers", response_model=CursorPage[PaperResponse])
 async def get_author_papers(
     author_id: str,
-    limit: int = Query(50, le=200, description="Maximum results"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum results"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     db: AsyncSession = Depends(get_db)
 ):
-    """저자의 모든 논문"""
-    papers = await author_crud.get_author_papers(
-        db, author_id, limit, offset
-    )
-    
-    return await PaperService.get_papers_with_authors_batch(db, papers)
+    """저자의 모든 논문 (최신 순)"""
+    try:
+        return await PaperService.get_author_papers(db, author_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/{author_id}/coauthors", response_model=List[AuthorResponse])
@@ -72,16 +83,24 @@ async def get_coauthors(
     limit: int = Query(20, le=100, description="Maximum results"),
     db: AsyncSession = Depends(get_db)
 ):
-    """공동 저자 목록"""
-    coauthors_with_count = await author_crud.get_coauthors(
-        db, author_id, limit
-    )
-    
-    return [
-        {
-            "author_id": author.AuthorId,
-            "name": author.Name,
-            "paper_count": collaboration_count
-        }
-        for author, collaboration_count in coauthors_with_count
-    ]
\ No newline at end of file
+    """공동 저자 목록 (paper_count = 함께 쓴 논문 수)"""
+    try:
+        return await CoauthorService.get_coauthors(db, author_id, limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid author id")
+
+
+@router.get("/{author_id}/coauthors/second-degree", response_model=List[SecondDegreeCoauthorResponse])
+async def get_second_degree_coauthors(
+    author_id: str,
+    limit: int = Query(20, le=100, description="Maximum results"),
+    min_shared_papers: int = Query(1, ge=1, description="Minimum shared papers on each hop"),
+    db: AsyncSession = Depends(get_db)
+):
+    """공동 저자의 공동 저자 (네트워크 뷰용, 직접 공동 저자 제외)"""
+    try:
+        return await CoauthorService.get_second_degree_coauthors(db, author_id, limit, min_shared_papers)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid author id")
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
\ No newline at end of file
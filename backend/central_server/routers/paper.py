@@ -1,47 +1,55 @@
 # routers/paper.py
+import json
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
-from core.database import get_db
+from core.database import get_db, AsyncSessionLocal
 from utils.get_current_user import get_current_user
 from schemas.paper import (
     PaperResponse,
     PaperDetailResponse,
+    TrendingPaperResponse,
     PaperSearchParams,
     PaperStatsResponse
 )
-from services.recommendation_service import RecommendationService
 from services.paper_service import PaperService
-from crud import paper as paper_crud
+from services.hydration_service import PaperHydrationService
+from services.paper_similarity_service import ALGORITHMS, PaperSimilarityService
+from utils.dataloader import get_loaders
+from utils.pagination import CursorPage
 
 router = APIRouter(prefix="/papers", tags=["papers"])
 
 
-@router.get("/search", response_model=List[PaperResponse])
+@router.get("/search", response_model=CursorPage[PaperResponse])
 async def search_papers(
     query: str = Query(..., min_length=1, description="Search query"),
     year_min: Optional[int] = Query(None, description="Minimum year"),
     year_max: Optional[int] = Query(None, description="Maximum year"),
-    limit: int = Query(20, le=100, description="Maximum results"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum results"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     db: AsyncSession = Depends(get_db)
 ):
     """논문 검색"""
-    papers = await PaperService.search_papers_with_authors(
-        db, query, year_min, year_max, limit, offset
-    )
-    return papers
+    try:
+        return await PaperService.search_papers_with_authors(
+            db, query, year_min, year_max, limit, cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/trending", response_model=List[PaperResponse])
+@router.get("/trending", response_model=List[TrendingPaperResponse])
 async def get_trending_papers(
-    year_min: Optional[int] = Query(None, description="Minimum year"),
-    limit: int = Query(20, le=100, description="Maximum results"),
+    year: Optional[int] = Query(None, description="Publication year partition"),
+    year_min: Optional[int] = Query(None, description="Minimum year (ignored when year is given)"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum results"),
     db: AsyncSession = Depends(get_db)
 ):
-    """트렌딩 논문 (최근 + 많이 인용됨)"""
-    papers = await PaperService.get_trending_papers(db, year_min, limit)
+    """트렌딩 논문 (최근 인용에 큰 가중치를 준 시간 감쇠 인용 속도 순)"""
+    papers = await PaperService.get_trending_papers(db, year, year_min, limit)
     return papers
 
 
@@ -51,7 +59,10 @@ async def get_paper_detail(
     db: AsyncSession = Depends(get_db)
 ):
     """논문 상세 정보"""
-    paper_data = await PaperService.get_paper_with_details(db, paper_id)
+    try:
+        paper_data = await PaperService.get_paper_with_details(db, paper_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid paper id")
     if not paper_data:
         raise HTTPException(status_code=404, detail="Paper not found")
     
@@ -60,14 +71,14 @@ async def get_paper_detail(
     stats = paper_data["stats"]
     
     return {
-        "PaperId": paper.PaperId,
+        "PaperId": str(paper.PaperId),
         "Title": paper.Title,
-        "Year": paper.Year,
+        "Year": paper.PublicationYear,
         "Abstract": paper.Abstract,
-        "CitationCount": paper.CitationCount,
+        "CitationCount": stats["citation_count"],
         "authors": authors,
         "reference_count": stats["reference_count"],
-        "citation_count_direct": stats["direct_citations"]
+        "citation_count_direct": stats["citation_count"]
     }
 
 
@@ -77,32 +88,41 @@ async def get_paper_stats(
     db: AsyncSession = Depends(get_db)
 ):
     """논문 통계"""
-    stats = await paper_crud.get_paper_stats(db, paper_id)
+    try:
+        stats = await PaperService.get_paper_stats(db, paper_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid paper id")
     if not stats:
         raise HTTPException(status_code=404, detail="Paper not found")
     return stats
 
 
-@router.get("/{paper_id}/references", response_model=List[PaperResponse])
+@router.get("/{paper_id}/references", response_model=CursorPage[PaperResponse])
 async def get_paper_references(
     paper_id: str,
-    limit: int = Query(50, le=200, description="Maximum results"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum results"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     db: AsyncSession = Depends(get_db)
 ):
     """논문이 인용한 논문들 (References)"""
-    papers = await paper_crud.get_paper_references(db, paper_id, limit)
-    return await PaperService.get_papers_with_authors_batch(db, papers)
+    try:
+        return await PaperService.get_paper_references(db, paper_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/{paper_id}/citations", response_model=List[PaperResponse])
+@router.get("/{paper_id}/citations", response_model=CursorPage[PaperResponse])
 async def get_paper_citations(
     paper_id: str,
-    limit: int = Query(50, le=200, description="Maximum results"),
+    limit: int = Query(50, ge=1, le=200, description="Maximum results"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     db: AsyncSession = Depends(get_db)
 ):
     """논문을 인용한 논문들 (Citations)"""
-    papers = await paper_crud.get_paper_citations(db, paper_id, limit)
-    return await PaperService.get_papers_with_authors_batch(db, papers)
+    try:
+        return await PaperService.get_paper_citations(db, paper_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/{paper_id}/similar")
@@ -112,48 +132,50 @@ async def get_similar_papers(
     limit: int = Query(10, le=50, description="Maximum results"),
     db: AsyncSession = Depends(get_db)
 ):
-    """유사 논문 추천"""
-    if algorithm == "co_citation":
-        recommendations = await RecommendationService.get_similar_papers_by_co_citation(
-            db, paper_id, limit
-        )
-    elif algorithm == "bibliographic_coupling":
-        recommendations = await RecommendationService.get_similar_papers_by_bibliographic_coupling(
-            db, paper_id, limit
-        )
-    else:
+    """유사 논문 추천 (paper_similarity에 사전 계산된 목록 조회)"""
+    if algorithm not in ALGORITHMS:
         raise HTTPException(
             status_code=400,
             detail="Invalid algorithm. Choose 'co_citation' or 'bibliographic_coupling'"
         )
+    try:
+        recommendations = await PaperSimilarityService.get_similar_papers(db, paper_id, algorithm, limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid paper id")
     
-    results = []
-    for paper, score, reason in recommendations:
-        authors = await paper_crud.get_paper_authors(db, paper.PaperId)
-        results.append({
-            "paper": {
-                "PaperId": paper.PaperId,
-                "Title": paper.Title,
-                "Year": paper.Year,
-                "Abstract": paper.Abstract,
-                "CitationCount": paper.CitationCount,
-                "authors": authors
-            },
-            "score": score,
-            "reason": reason
-        })
-    
-    return results
+    return await PaperHydrationService.hydrate_recommendations(db, recommendations)
 
 
 @router.get("/{paper_id}/network")
 async def get_citation_network(
     paper_id: str,
-    depth: int = Query(1, ge=1, le=2, description="Network depth"),
+    depth: int = Query(1, ge=1, le=4, description="Network depth (BFS hops)"),
+    max_nodes_per_hop: int = Query(50, ge=1, le=500, description="Maximum new papers kept per hop (by citation count)"),
+    stream: bool = Query(False, description="Stream node/edge/hop events as NDJSON"),
     db: AsyncSession = Depends(get_db)
 ):
     """Citation 네트워크 (시각화용)"""
-    network = await PaperService.get_citation_network(db, paper_id, depth)
-    if not network:
+    if not stream:
+        try:
+            network = await PaperService.get_citation_network(db, paper_id, depth, max_nodes_per_hop)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid paper id")
+        if not network:
+            raise HTTPException(status_code=404, detail="Paper not found")
+        return network
+
+    # 스트리밍 시작 후에는 상태 코드를 바꿀 수 없으므로 ID 검증과 존재 확인을 먼저 수행
+    try:
+        center_paper = await get_loaders(db).papers.load(paper_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid paper id")
+    if not center_paper:
         raise HTTPException(status_code=404, detail="Paper not found")
-    return network
\ No newline at end of file
+
+    async def ndjson_events():
+        # 요청 세션은 응답 스트리밍 전에 닫힐 수 있으므로 스트림 전용 세션 사용
+        async with AsyncSessionLocal() as stream_db:
+            async for event in PaperService.iter_citation_network(stream_db, paper_id, depth, max_nodes_per_hop):
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(ndjson_events(), media_type="application/x-ndjson")
\ No newline at end of file
@@ -7,11 +7,19 @@ class AuthorResponse(BaseModel):
     author_id: str
     name: str
     paper_count: int = 0
+    last_collaboration_year: Optional[int] = None  # 공동 저자 목록에서만 사용
 
     class Config:
         from_attributes = True
 
 
+class SecondDegreeCoauthorResponse(BaseModel):
+    author_id: str
+    name: str
+    mutual_coauthors: int  # 이 저자와 이어지는 중간 공동 저자 수
+    path_weight: int  # 중간 공동 저자별 min(공유 논문 수)의 합
+
+
 class AuthorSearchParams(BaseModel):
     query: str = Field(..., min_length=2)
     limit: int = Field(20, le=100)
@@ -22,4 +30,5 @@ class AuthorDetailResponse(BaseModel):
     name: str
     paper_count: int
     total_citations: int
-    h_index: Optional[int] = None
\ No newline at end of file
+    h_index: Optional[int] = None
+    i10_index: Optional[int] = None
\ No newline at end of file
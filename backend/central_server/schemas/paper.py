@@ -25,6 +25,10 @@ class PaperResponse(PaperBase):
     authors: List[str] = []
 
 
+class TrendingPaperResponse(PaperResponse):
+    trending_score: float = 0.0
+
+
 class PaperDetailResponse(PaperResponse):
     reference_count: int = 0
     citation_count_direct: int = 0
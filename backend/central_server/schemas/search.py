@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Optional, Literal
 
 #공통부
 
@@ -22,6 +22,7 @@ class InternalSearchRequest(BaseModel):
     query_text: str = Field(..., description="사용자의 검색 질문 또는 쿼리")
     limit: int = Field(5, description="반환받을 최대 문서 청크 수")
     similarity_threshold: float = Field(0.1, description="유사도 검색 시 사용할 임계값")
+    summaries: Literal["none", "attach", "replace"] = Field("none", description="문서 요약 사용 방식 (attach: 청크 원문에 문서별 요약을 추가, replace: 요약이 있는 문서는 청크 대신 요약 사용)")
 
 class InternalDocumentReference(BaseModel):
     """그룹화된 내부 문서 참조 모델"""
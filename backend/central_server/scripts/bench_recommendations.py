@@ -0,0 +1,164 @@
+# scripts/bench_recommendations.py
+"""
+인용 기반 추천 벤치마크: SQL GROUP BY 경로와 인메모리 CSR 인용 그래프 경로의 지연 시간을 비교합니다.
+표본 논문마다 공동 인용/서지결합/컬렉션 추천을 두 경로로 실행해 p50/p95와 결과 일치 여부를 출력합니다.
+
+--synthetic N을 주면 임시 SQLite 파일에 논문 N편짜리 무작위 인용 그래프를 만들어 측정하고,
+주지 않으면 DATABASE_URL(또는 --database-url)의 실제 데이터를 읽기만 합니다.
+
+사용 예 (central_server 디렉토리에서 실행):
+    python -m scripts.bench_recommendations --samples 200
+    python -m scripts.bench_recommendations --synthetic 20000 --refs-per-paper 25
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from core.config import settings
+from core.database import Base
+from models import Citation, Paper
+from services import citation_graph
+from services.recommendation_service import RecommendationService
+
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("bench_recommendations")
+logger.setLevel(logging.INFO)
+
+
+def percentiles(latencies_ms: List[float]) -> Dict[str, float]:
+    values = np.asarray(latencies_ms)
+    return {
+        "p50_ms": round(float(np.percentile(values, 50)), 3),
+        "p95_ms": round(float(np.percentile(values, 95)), 3),
+        "mean_ms": round(float(values.mean()), 3),
+    }
+
+
+async def seed_synthetic(engine, papers: int, refs_per_paper: int, seed: int) -> None:
+    """선호적 연결(인기 논문이 더 많이 인용됨)에 가까운 무작위 인용 그래프 생성"""
+    rng = random.Random(seed)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(Paper), [
+            {"PaperId": pid, "Title": f"Synthetic paper {pid}", "PublicationYear": 1990 + pid * 35 // papers}
+            for pid in range(1, papers + 1)
+        ])
+        edges = set()
+        for citing in range(2, papers + 1):
+            for _ in range(min(refs_per_paper, citing - 1)):
+                cited = 1 + int((citing - 1) * rng.random() ** 2)  # 오래된(작은 ID) 논문일수록 자주 인용
+                edges.add((citing, cited))
+        rows = [{"CitingPaperId": a, "CitedPaperId": b} for a, b in edges]
+        for start in range(0, len(rows), 50000):
+            await conn.execute(insert(Citation), rows[start:start + 50000])
+    logger.info(f"Seeded {papers} papers, {len(edges)} citations")
+
+
+async def time_call(fn, *args) -> (float, list):
+    started = time.perf_counter()
+    result = await fn(*args)
+    return (time.perf_counter() - started) * 1000, result
+
+
+async def main_async(args) -> Dict:
+    workdir = None
+    url = args.database_url or settings.DATABASE_URL
+    if args.synthetic:
+        workdir = tempfile.TemporaryDirectory()
+        url = f"sqlite+aiosqlite:///{Path(workdir.name) / 'bench.db'}"
+    engine = create_async_engine(url)
+    Session = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        if args.synthetic:
+            await seed_synthetic(engine, args.synthetic, args.refs_per_paper, args.seed)
+
+        async with engine.connect() as conn:
+            graph = await citation_graph.init_citation_graph(conn)
+        if graph is None:
+            raise RuntimeError("Citation graph is unavailable (disabled or scipy missing).")
+
+        async with Session() as db:
+            citing_ids = [pid for pid, in await db.execute(
+                select(Citation.CitingPaperId).group_by(Citation.CitingPaperId).having(func.count() > 1)
+            )]
+        rng = random.Random(args.seed)
+        samples = rng.sample(citing_ids, min(args.samples, len(citing_ids)))
+        if not samples:
+            raise RuntimeError("No citing papers to sample.")
+
+        benchmarks = {
+            "co_citation": (
+                lambda db, pid: RecommendationService._co_citation_sql(db, pid, args.limit, [pid]),
+                lambda db, pid: RecommendationService.get_similar_papers_by_co_citation(db, pid, args.limit),
+            ),
+            "bibliographic_coupling": (
+                lambda db, pid: RecommendationService._bibliographic_coupling_sql(db, pid, args.limit, [pid]),
+                lambda db, pid: RecommendationService.get_similar_papers_by_bibliographic_coupling(db, pid, args.limit),
+            ),
+            "collection": (
+                lambda db, pids: RecommendationService._collection_recommendations_sql(db, pids, args.limit),
+                lambda db, pids: RecommendationService.get_collection_recommendations(db, pids, args.limit),
+            ),
+        }
+        report = {"database": url.split("://")[0], "graph": graph.stats(), "samples": len(samples), "methods": {}}
+        for name, (sql_fn, graph_fn) in benchmarks.items():
+            sql_ms, graph_ms, mismatches = [], [], 0
+            for pid in samples:
+                target = rng.sample(samples, min(args.collection_size, len(samples))) if name == "collection" else pid
+                # 세션마다 로더/identity map이 새로 시작되도록 경로별로 새 세션 사용
+                async with Session() as db:
+                    elapsed, sql_result = await time_call(sql_fn, db, target)
+                sql_ms.append(elapsed)
+                async with Session() as db:
+                    elapsed, graph_result = await time_call(graph_fn, db, target)
+                graph_ms.append(elapsed)
+                if [(p.PaperId, round(s, 6)) for p, s, _ in sql_result] != [(p.PaperId, round(s, 6)) for p, s, _ in graph_result]:
+                    mismatches += 1
+            sql_stats, graph_stats = percentiles(sql_ms), percentiles(graph_ms)
+            report["methods"][name] = {
+                "sql": sql_stats,
+                "graph": graph_stats,
+                "p50_speedup": round(sql_stats["p50_ms"] / max(graph_stats["p50_ms"], 1e-6), 1),
+                "mismatches": mismatches,
+            }
+        return report
+    finally:
+        await engine.dispose()
+        if workdir is not None:
+            workdir.cleanup()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare SQL and in-memory citation graph recommendation latency.")
+    parser.add_argument("--database-url", default=None, help="기본값: settings.DATABASE_URL")
+    parser.add_argument("--synthetic", type=int, default=0, help="임시 SQLite에 생성할 논문 수 (0이면 실제 DB 사용)")
+    parser.add_argument("--refs-per-paper", type=int, default=20)
+    parser.add_argument("--samples", type=int, default=100, help="측정할 표본 논문 수")
+    parser.add_argument("--collection-size", type=int, default=20, help="컬렉션 추천에 사용할 논문 수")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args(argv)
+
+    try:
+        report = asyncio.run(main_async(args))
+    except RuntimeError as e:
+        logger.error(str(e))
+        return 1
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
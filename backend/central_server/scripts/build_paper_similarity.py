@@ -0,0 +1,59 @@
+# scripts/build_paper_similarity.py
+"""
+paper_similarity 테이블 전체 빌드 (대량 인용 적재 직후 등 오프라인 실행용).
+citation 테이블로 인용 그래프를 만든 뒤 행 블록 단위 희소 행렬 곱으로 논문별 상위 K개 유사 논문을 다시 계산합니다.
+서버 실행 중의 증분 갱신은 PaperSimilarityRefresher가 처리합니다.
+
+사용 예 (central_server 디렉토리에서 실행):
+    python -m scripts.build_paper_similarity
+    python -m scripts.build_paper_similarity --top-k 100 --block-rows 4096
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from core.config import settings
+from core.database import AsyncSessionLocal, Base, async_engine
+from services.citation_graph import init_citation_graph
+from services.paper_similarity_service import PaperSimilarityService
+
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("build_paper_similarity")
+logger.setLevel(logging.INFO)
+logging.getLogger("services.paper_similarity_service").setLevel(logging.INFO)
+
+
+async def main_async(args) -> dict:
+    try:
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)  # paper_similarity 테이블이 없으면 생성
+        async with async_engine.connect() as conn:
+            graph = await init_citation_graph(conn)
+        if graph is None:
+            raise RuntimeError("Citation graph is unavailable (disabled or scipy missing).")
+        async with AsyncSessionLocal() as db:
+            written = await PaperSimilarityService.rebuild(db, graph, args.top_k, args.block_rows)
+        return {"graph": graph.stats(), "rows_written": written}
+    finally:
+        await async_engine.dispose()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Rebuild the precomputed paper_similarity table.")
+    parser.add_argument("--top-k", type=int, default=settings.PAPER_SIMILARITY_TOP_K)
+    parser.add_argument("--block-rows", type=int, default=settings.PAPER_SIMILARITY_BLOCK_ROWS)
+    args = parser.parse_args(argv)
+
+    try:
+        report = asyncio.run(main_async(args))
+    except RuntimeError as e:
+        logger.error(str(e))
+        return 1
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
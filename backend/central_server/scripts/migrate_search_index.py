@@ -0,0 +1,61 @@
+# scripts/migrate_search_index.py
+"""
+PostgreSQL 전문 검색 스키마 마이그레이션 (배포 시 한 번 실행하는 오프라인 작업).
+paper.search_vector 생성 컬럼 추가는 테이블 전체를 다시 쓰며 그동안 쓰기 잠금을 잡으므로
+서버 시작 경로에서 분리했습니다. 서버는 시작 시 적용 여부만 확인하고, 미적용이면 LIKE 검색을 사용합니다.
+모든 문장이 IF NOT EXISTS 형태라 여러 번 실행해도 안전합니다.
+
+사용 예 (central_server 디렉토리에서 실행):
+    python -m scripts.migrate_search_index --dry-run
+    python -m scripts.migrate_search_index
+"""
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from sqlalchemy import text
+
+from core.database import async_engine
+from core.search_index import postgres_migration_statements
+
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("migrate_search_index")
+logger.setLevel(logging.INFO)
+
+
+async def main_async(args) -> dict:
+    statements = postgres_migration_statements()
+    try:
+        dialect = async_engine.dialect.name
+        if dialect != "postgresql":
+            raise RuntimeError(f"Search index migration only applies to PostgreSQL (current dialect: {dialect}). "
+                               "SQLite FTS tables are created at server startup.")
+        if args.dry_run:
+            return {"dialect": dialect, "applied": False, "statements": statements}
+        async with async_engine.begin() as conn:
+            for statement in statements:
+                logger.info(f"Executing: {' '.join(statement.split())}")
+                await conn.execute(text(statement))
+        return {"dialect": dialect, "applied": True, "statements": len(statements)}
+    finally:
+        await async_engine.dispose()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Apply the PostgreSQL full-text search schema (search_vector, GIN/trigram indexes).")
+    parser.add_argument("--dry-run", action="store_true", help="실행하지 않고 적용할 DDL만 출력")
+    args = parser.parse_args(argv)
+
+    try:
+        report = asyncio.run(main_async(args))
+    except RuntimeError as e:
+        logger.error(str(e))
+        return 1
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
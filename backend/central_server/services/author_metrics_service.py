@@ -0,0 +1,171 @@
+# services/author_metrics_service.py
+import logging
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from crud import author as author_crud, paper as paper_crud
+from models import Citation, PaperAuthor
+from utils.periodic import PeriodicTask
+from utils.session_changes import PendingChanges, SessionChangeCollector
+
+logger = logging.getLogger(__name__)
+
+
+def compute_author_metrics(
+    link_authors: np.ndarray,
+    link_citations: np.ndarray
+) -> Dict[int, Dict[str, int]]:
+    """
+    저자-논문 연결별 (AuthorId, 해당 논문 피인용 수) 배열로 모든 저자의 지표를 한 번에 계산.
+    저자별로 피인용 수를 내림차순 정렬하면 h-index는 "피인용 수 >= 저자 내 순위"인 논문 수와 같으므로
+    정렬 한 번과 bincount만으로 계산됩니다.
+    """
+    if not len(link_authors):
+        return {}
+    order = np.lexsort((-link_citations, link_authors))
+    authors, citations = link_authors[order], link_citations[order]
+    author_ids, starts, paper_counts = np.unique(authors, return_index=True, return_counts=True)
+    group = np.repeat(np.arange(len(author_ids)), paper_counts)
+    rank = np.arange(len(authors)) - starts[group] + 1
+    h_index = np.bincount(group, weights=citations >= rank, minlength=len(author_ids))
+    i10_index = np.bincount(group, weights=citations >= 10, minlength=len(author_ids))
+    total_citations = np.bincount(group, weights=citations, minlength=len(author_ids))
+    return {
+        int(author_id): {
+            "PaperCount": int(paper_count),
+            "TotalCitations": int(total),
+            "HIndex": int(h),
+            "I10Index": int(i10),
+        }
+        for author_id, paper_count, total, h, i10 in zip(author_ids, paper_counts, total_citations, h_index, i10_index)
+    }
+
+
+class AuthorMetricsService:
+    """저자 지표(h-index, i10-index, 총 피인용 수, 논문 수) 계산 및 author_metrics 테이블 갱신"""
+
+    @staticmethod
+    def _metrics_from_links(links: List[Tuple[int, int]], citation_counts: Dict[int, int]) -> Dict[int, Dict[str, int]]:
+        link_authors = np.fromiter((author_id for author_id, _ in links), dtype=np.int64, count=len(links))
+        link_citations = np.fromiter(
+            (citation_counts.get(paper_id, 0) for _, paper_id in links), dtype=np.int64, count=len(links)
+        )
+        return compute_author_metrics(link_authors, link_citations)
+
+    @staticmethod
+    async def compute_for_authors(db: AsyncSession, author_ids: Iterable[int]) -> Dict[int, Dict[str, int]]:
+        """일부 저자의 지표를 DB에서 바로 계산 (저장하지 않음, 논문이 없는 저자는 결과에서 빠짐)"""
+        links = await author_crud.get_author_paper_links(db, author_ids)
+        citation_counts = await paper_crud.get_citation_counts(db, [paper_id for _, paper_id in links])
+        return AuthorMetricsService._metrics_from_links(links, citation_counts)
+
+    @staticmethod
+    async def rebuild(db: AsyncSession) -> int:
+        """전체 저자 지표를 한 번에 다시 계산해 교체"""
+        started = time.perf_counter()
+        links = await author_crud.get_author_paper_links(db)
+        citation_counts = await paper_crud.get_all_citation_counts(db)
+        metrics = AuthorMetricsService._metrics_from_links(links, citation_counts)
+        await author_crud.delete_all_author_metrics(db)  # 연결이 모두 사라진 저자의 행도 정리
+        written = await author_crud.replace_author_metrics(db, [], metrics)
+        await db.commit()
+        logger.info(f"author_metrics rebuilt: {written} authors from {len(links)} links "
+                    f"in {time.perf_counter() - started:.2f}s")
+        return written
+
+    @staticmethod
+    async def refresh(db: AsyncSession, paper_ids: Iterable[int], author_ids: Iterable[int]) -> int:
+        """피인용 수가 바뀐 논문들의 저자와 연결이 바뀐 저자들만 다시 계산"""
+        affected = set(author_ids) | set(await author_crud.get_author_ids_for_papers(db, paper_ids))
+        if not affected:
+            return 0
+        metrics = await AuthorMetricsService.compute_for_authors(db, affected)
+        await author_crud.replace_author_metrics(db, affected, metrics)
+        await db.commit()
+        return len(affected)
+
+    @staticmethod
+    async def get_author_detail(db: AsyncSession, author_id: str) -> Optional[Dict]:
+        """저자 상세 정보 (지표가 아직 계산되지 않은 저자는 즉석에서 계산)"""
+        row = await author_crud.get_author_with_metrics(db, int(author_id))
+        if row is None:
+            return None
+        author, stored = row
+        if stored is not None:
+            metrics = {
+                "PaperCount": stored.PaperCount,
+                "TotalCitations": stored.TotalCitations,
+                "HIndex": stored.HIndex,
+                "I10Index": stored.I10Index,
+            }
+        else:
+            metrics = (await AuthorMetricsService.compute_for_authors(db, [author.AuthorId])).get(author.AuthorId, {})
+        return {
+            "author_id": str(author.AuthorId),
+            "name": author.Name,
+            "paper_count": metrics.get("PaperCount", 0),
+            "total_citations": metrics.get("TotalCitations", 0),
+            "h_index": metrics.get("HIndex", 0),
+            "i10_index": metrics.get("I10Index", 0),
+        }
+
+
+class AuthorMetricsRefresher:
+    """
+    author_metrics 주기 갱신 작업. 테이블이 비어 있으면 전체 계산을, 이후에는 ORM 세션으로 커밋된
+    Citation(피인용 논문)·PaperAuthor(저자) 변경에 영향을 받는 저자만 다시 계산합니다.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession], interval_seconds: float):
+        self.session_factory = session_factory
+        self._changes = PendingChanges("papers", "authors")
+        self._task = PeriodicTask("author_metrics refresh", self.run_once, interval_seconds)
+        self._collector = SessionChangeCollector("author_metrics_changes", self._collect_changes, self._changes.update)
+        self._collector.register()
+
+    @staticmethod
+    def _collect_changes(session: Session) -> List[Tuple[str, int]]:
+        changes = []
+        for obj in list(session.new) + list(session.deleted):
+            if isinstance(obj, Citation):
+                changes.append(("papers", obj.CitedPaperId))
+            elif isinstance(obj, PaperAuthor):
+                changes.append(("authors", obj.AuthorId))
+        return changes
+
+    async def run_once(self) -> int:
+        async with self.session_factory() as db:
+            if not await author_crud.count_author_metrics(db):
+                self._changes.clear()
+                return await AuthorMetricsService.rebuild(db)
+            if not self._changes:
+                return 0
+            pending = self._changes.snapshot()
+            refreshed = await AuthorMetricsService.refresh(db, pending["papers"], pending["authors"])
+            self._changes.acknowledge(pending)
+            logger.info(f"author_metrics refreshed for {refreshed} authors")
+            return refreshed
+
+    def start(self) -> None:
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
+
+
+_refresher: Optional[AuthorMetricsRefresher] = None
+
+
+def get_author_metrics_refresher(session_factory: Callable[[], AsyncSession] = None) -> Optional[AuthorMetricsRefresher]:
+    """주기적 갱신 작업 싱글톤 (비활성화 시 None)"""
+    global _refresher
+    if not settings.AUTHOR_METRICS_ENABLED:
+        return None
+    if _refresher is None and session_factory is not None:
+        _refresher = AuthorMetricsRefresher(session_factory, settings.AUTHOR_METRICS_REFRESH_SECONDS)
+    return _refresher
@@ -0,0 +1,293 @@
+# services/citation_graph.py
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from models import Citation
+from utils.session_changes import SessionChangeCollector
+
+logger = logging.getLogger(__name__)
+
+try:
+    import scipy.sparse as sp
+except ImportError:  # scipy가 없으면 그래프 없이 SQL 경로로 동작
+    sp = None
+
+
+class CitationGraph:
+    """
+    citation 테이블 전체를 메모리에 올린 인용 그래프.
+    인용(citing → cited) 인접 행렬을 CSR(out: 행=인용한 논문)과 그 전치(in: 행=인용된 논문)로 보관하고,
+    추천에 필요한 공유 참조/공동 피인용/컬렉션 참조 수를 희소 벡터-행렬 곱 한 번으로 계산합니다.
+
+    로드 이후 추가/삭제된 인용은 별도의 델타(±1) 행렬로 유지해 조회 시 base + delta로 합산하고,
+    델타가 커지면 base CSR에 병합(compact)합니다. 노드 인덱스는 PaperId와 별개인 0..n-1 정수입니다.
+    """
+
+    def __init__(self, compact_min_edges: int = 10000, compact_ratio: float = 0.05):
+        self.compact_min_edges = compact_min_edges
+        self.compact_ratio = compact_ratio
+        self._ids: List[int] = []
+        self._index: Dict[int, int] = {}
+        self._out = sp.csr_matrix((0, 0), dtype=np.int32)
+        self._in = sp.csr_matrix((0, 0), dtype=np.int32)
+        self._delta: Dict[Tuple[int, int], int] = {}  # (citing 인덱스, cited 인덱스) → +1 추가 / -1 삭제
+        self._delta_out = None
+        self._delta_in = None
+        self._changed_edges: Set[Tuple[int, int]] = set()  # 마지막 drain 이후 추가/삭제된 (CitingPaperId, CitedPaperId)
+        self.loaded = False
+        self.load_seconds = 0.0
+
+    # ---------- 로드 / 델타 ----------
+
+    async def load(self, conn: AsyncConnection, partition_size: int = 100000) -> None:
+        """citation 테이블을 스트리밍으로 읽어 CSR을 새로 구성"""
+        started = time.perf_counter()
+        citing_parts, cited_parts = [], []
+        result = await conn.stream(select(Citation.CitingPaperId, Citation.CitedPaperId))
+        async for rows in result.partitions(partition_size):
+            edges = np.asarray(rows, dtype=np.int64).reshape(-1, 2)
+            citing_parts.append(edges[:, 0])
+            cited_parts.append(edges[:, 1])
+        citing = np.concatenate(citing_parts) if citing_parts else np.empty(0, dtype=np.int64)
+        cited = np.concatenate(cited_parts) if cited_parts else np.empty(0, dtype=np.int64)
+
+        ids, inverse = np.unique(np.concatenate([citing, cited]), return_inverse=True)
+        rows, cols = inverse[:len(citing)], inverse[len(citing):]
+        n = len(ids)
+        out = sp.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, cols)), shape=(n, n))
+        out.sum_duplicates()
+        out.data[:] = 1
+
+        self._ids = ids.tolist()
+        self._index = {paper_id: i for i, paper_id in enumerate(self._ids)}
+        self._out = out
+        self._in = out.transpose().tocsr()
+        self._delta.clear()
+        self._invalidate_delta()
+        self._changed_edges.clear()
+        self.loaded = True
+        self.load_seconds = time.perf_counter() - started
+        logger.info(f"Citation graph loaded: {n} papers, {out.nnz} citations in {self.load_seconds:.2f}s")
+
+    def add_citations(self, edges: Iterable[Tuple[int, int]]) -> None:
+        """(CitingPaperId, CitedPaperId) 인용 추가 반영 (이미 있는 인용은 무시)"""
+        for citing, cited in edges:
+            i, j = self._ensure_node(int(citing)), self._ensure_node(int(cited))
+            if not self._has_edge(i, j):
+                self._set_delta(i, j, +1)
+                self._changed_edges.add((int(citing), int(cited)))
+        self._maybe_compact()
+
+    def remove_citations(self, edges: Iterable[Tuple[int, int]]) -> None:
+        """(CitingPaperId, CitedPaperId) 인용 삭제 반영 (없는 인용은 무시)"""
+        for citing, cited in edges:
+            i, j = self._index.get(int(citing)), self._index.get(int(cited))
+            if i is not None and j is not None and self._has_edge(i, j):
+                self._set_delta(i, j, -1)
+                self._changed_edges.add((int(citing), int(cited)))
+        self._maybe_compact()
+
+    def drain_changed_edges(self) -> Set[Tuple[int, int]]:
+        """마지막 호출 이후 추가/삭제된 인용 목록을 반환하고 비움 (증분 갱신 작업용)"""
+        changed, self._changed_edges = self._changed_edges, set()
+        return changed
+
+    def snapshot(self) -> Tuple[np.ndarray, "sp.csr_matrix", "sp.csr_matrix"]:
+        """
+        델타를 병합한 (PaperId 배열, out CSR, in CSR) 복사본.
+        그래프는 이후에도 제자리에서 바뀔 수 있으므로, 다른 스레드에서 오래 계산할 때는 이 복사본을 사용합니다.
+        """
+        self.compact()
+        return np.asarray(self._ids, dtype=np.int64), self._out.copy(), self._in.copy()
+
+    def _ensure_node(self, paper_id: int) -> int:
+        index = self._index.get(paper_id)
+        if index is None:
+            index = self._index[paper_id] = len(self._ids)
+            self._ids.append(paper_id)
+        return index
+
+    def _has_edge(self, i: int, j: int) -> bool:
+        base = self._out[i, j] if i < self._out.shape[0] and j < self._out.shape[1] else 0
+        return base + self._delta.get((i, j), 0) > 0
+
+    def _set_delta(self, i: int, j: int, value: int) -> None:
+        if self._delta.get((i, j), 0) + value == 0:
+            self._delta.pop((i, j), None)  # 추가 후 삭제(또는 반대)는 상쇄
+        else:
+            self._delta[(i, j)] = value
+        self._invalidate_delta()
+
+    def _invalidate_delta(self) -> None:
+        self._delta_out = self._delta_in = None
+
+    def _sync_shape(self) -> None:
+        """로드 이후 새 논문이 생겼으면 base 행렬 크기를 노드 수에 맞춤"""
+        n = len(self._ids)
+        if self._out.shape[0] != n:
+            self._out.resize((n, n))
+            self._in.resize((n, n))
+
+    def _maybe_compact(self) -> None:
+        if len(self._delta) >= max(self.compact_min_edges, self.compact_ratio * self._out.nnz):
+            self.compact()
+
+    def compact(self) -> None:
+        """델타를 base CSR에 병합"""
+        self._sync_shape()
+        delta_out, _ = self._delta_matrices()
+        out = (self._out + delta_out).tocsr()
+        out.eliminate_zeros()
+        self._out = out
+        self._in = out.transpose().tocsr()
+        self._delta.clear()
+        self._invalidate_delta()
+
+    def _delta_matrices(self):
+        self._sync_shape()
+        if self._delta_out is None:
+            n = len(self._ids)
+            if self._delta:
+                rows, cols = zip(*self._delta.keys())
+                values = list(self._delta.values())
+                self._delta_out = sp.csr_matrix((np.asarray(values, dtype=np.int32), (rows, cols)), shape=(n, n))
+            else:
+                self._delta_out = sp.csr_matrix((n, n), dtype=np.int32)
+            self._delta_in = self._delta_out.transpose().tocsr()
+        return self._delta_out, self._delta_in
+
+    # ---------- 희소 벡터 연산 ----------
+
+    def _indicator(self, paper_ids: Iterable) -> "sp.csr_matrix":
+        """논문 집합의 1×n 지시 벡터 (그래프에 없는 논문은 제외)"""
+        self._sync_shape()
+        indexes = sorted({self._index[pid] for pid in map(int, paper_ids) if pid in self._index})
+        n = len(self._ids)
+        return sp.csr_matrix(
+            (np.ones(len(indexes), dtype=np.int32), (np.zeros(len(indexes), dtype=np.int32), indexes)), shape=(1, n)
+        )
+
+    def _product(self, vector: "sp.csr_matrix", use_in: bool) -> "sp.csr_matrix":
+        """vector @ (base + delta)"""
+        delta_out, delta_in = self._delta_matrices()
+        base, delta = (self._in, delta_in) if use_in else (self._out, delta_out)
+        result = vector @ base
+        if delta.nnz:
+            result = result + vector @ delta
+            result.eliminate_zeros()
+        return result
+
+    def _to_counts(self, vector: "sp.csr_matrix") -> Dict[int, int]:
+        vector = vector.tocsr()
+        return {self._ids[j]: int(v) for j, v in zip(vector.indices, vector.data) if v > 0}
+
+    def references(self, paper_id) -> List[int]:
+        """paper_id가 인용한 논문 ID 목록"""
+        return list(self._to_counts(self._product(self._indicator([paper_id]), use_in=False)))
+
+    def citers(self, paper_id) -> List[int]:
+        """paper_id를 인용한 논문 ID 목록"""
+        return list(self._to_counts(self._product(self._indicator([paper_id]), use_in=True)))
+
+    def citation_counts(self, paper_ids: Iterable) -> Dict[int, int]:
+        """논문별 피인용 수 (그래프에 없는 논문은 0)"""
+        paper_ids = [int(pid) for pid in paper_ids]
+        self._sync_shape()
+        delta_out, _ = self._delta_matrices()
+        indexes = [self._index.get(pid) for pid in paper_ids]
+        known = [i for i in indexes if i is not None]
+        degrees = np.asarray(self._in[known].sum(axis=1)).ravel() + np.asarray(delta_out[:, known].sum(axis=0)).ravel()
+        by_index = dict(zip(known, degrees.tolist()))
+        return {pid: int(by_index.get(i, 0)) if i is not None else 0 for pid, i in zip(paper_ids, indexes)}
+
+    def shared_reference_counts(self, paper_id) -> Dict[int, int]:
+        """paper_id와 같은 논문을 인용한 논문별 공유 참조 수 (references(p)의 지시 벡터 @ in 행렬)"""
+        refs = self._product(self._indicator([paper_id]), use_in=False)
+        return self._to_counts(self._product(refs.astype(bool).astype(np.int32), use_in=True))
+
+    def co_cited_counts(self, paper_id) -> Dict[int, int]:
+        """paper_id를 인용한 논문들이 함께 인용한 논문별 횟수 (citers(p)의 지시 벡터 @ out 행렬)"""
+        citers = self._product(self._indicator([paper_id]), use_in=True)
+        return self._to_counts(self._product(citers.astype(bool).astype(np.int32), use_in=False))
+
+    def referenced_by_counts(self, paper_ids: Iterable) -> Dict[int, int]:
+        """주어진 논문들 중 몇 편이 각 논문을 인용했는지 (지시 벡터 @ out 행렬)"""
+        return self._to_counts(self._product(self._indicator(paper_ids), use_in=False))
+
+    def cited_by_any_counts(self, paper_ids: Iterable) -> Dict[int, int]:
+        """주어진 논문들 중 몇 편을 각 논문이 인용했는지 (지시 벡터 @ in 행렬)"""
+        return self._to_counts(self._product(self._indicator(paper_ids), use_in=True))
+
+    @staticmethod
+    def top_k(counts: Dict[int, int], k: int, exclude: Iterable = ()) -> List[Tuple[int, int]]:
+        """(PaperId, count)를 count 내림차순, PaperId 오름차순으로 상위 k개"""
+        excluded = {int(pid) for pid in exclude}
+        candidates = [(pid, count) for pid, count in counts.items() if pid not in excluded]
+        if len(candidates) > k:
+            values = np.fromiter((count for _, count in candidates), dtype=np.int64, count=len(candidates))
+            keep = np.argpartition(-values, k - 1)[:k] if k > 0 else []
+            threshold = values[keep].min() if len(keep) else 0
+            candidates = [item for item in candidates if item[1] >= threshold]  # 동점 처리를 위해 경계값 포함
+        return sorted(candidates, key=lambda item: (-item[1], item[0]))[:k]
+
+    def stats(self) -> Dict:
+        return {
+            "loaded": self.loaded,
+            "papers": len(self._ids),
+            "citations": int(self._out.nnz) + sum(self._delta.values()),
+            "pending_delta_edges": len(self._delta),
+            "load_seconds": round(self.load_seconds, 3),
+        }
+
+
+_citation_graph: Optional[CitationGraph] = None
+
+
+def get_citation_graph() -> Optional[CitationGraph]:
+    """로드된 인용 그래프 반환 (비활성화, scipy 미설치, 로드 전이면 None → 호출 측은 SQL 경로 사용)"""
+    if _citation_graph is None or not _citation_graph.loaded:
+        return None
+    return _citation_graph
+
+
+async def init_citation_graph(conn: AsyncConnection) -> Optional[CitationGraph]:
+    """
+    서버 시작 시 인용 그래프를 로드하고, ORM 세션으로 커밋된 Citation 추가/삭제가 그래프에 반영되도록 등록.
+    ORM을 거치지 않는 일괄 INSERT/DELETE 문은 추적되지 않으므로 그 후에는 다시 로드해야 합니다.
+    """
+    global _citation_graph
+    if not settings.CITATION_GRAPH_ENABLED:
+        logger.info("Citation graph disabled. Recommendations will use SQL.")
+        return None
+    if sp is None:
+        logger.warning("scipy is not installed. Recommendations will use SQL.")
+        return None
+    graph = CitationGraph(settings.CITATION_GRAPH_COMPACT_MIN_EDGES, settings.CITATION_GRAPH_COMPACT_RATIO)
+    await graph.load(conn)
+    _citation_changes.register()
+    _citation_graph = graph
+    return graph
+
+
+def _collect_citation_changes(session: Session) -> List[Tuple[bool, Tuple[int, int]]]:
+    """flush된 Citation 추가/삭제를 (추가 여부, 엣지) 목록으로 반환"""
+    added = [(c.CitingPaperId, c.CitedPaperId) for c in session.new if isinstance(c, Citation)]
+    removed = [(c.CitingPaperId, c.CitedPaperId) for c in session.deleted if isinstance(c, Citation)]
+    return [(True, edge) for edge in added] + [(False, edge) for edge in removed]
+
+
+def _apply_citation_changes(changes: List[Tuple[bool, Tuple[int, int]]]) -> None:
+    if _citation_graph is None:
+        return
+    for added, edge in changes:  # 같은 트랜잭션 안의 추가/삭제 순서 유지
+        (_citation_graph.add_citations if added else _citation_graph.remove_citations)([edge])
+
+
+_citation_changes = SessionChangeCollector("citation_changes", _collect_citation_changes, _apply_citation_changes)
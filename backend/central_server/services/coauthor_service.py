@@ -0,0 +1,89 @@
+# services/coauthor_service.py
+import logging
+import time
+from typing import Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from crud import coauthor as coauthor_crud
+from models import PaperAuthor
+
+logger = logging.getLogger(__name__)
+
+_hooks_registered = False
+
+
+def _refresh_on_flush(session: Session, flush_context) -> None:
+    """
+    paper_author 추가/삭제가 flush되면 같은 트랜잭션 안에서 해당 저자의 간선을 다시 집계.
+    저자 A의 연결이 바뀌면 A가 포함된 간선(A→B, B→A)만 달라지므로 A 기준 재계산으로 충분합니다.
+    """
+    author_ids = sorted({
+        obj.AuthorId for obj in list(session.new) + list(session.deleted) if isinstance(obj, PaperAuthor)
+    })
+    if not author_ids:
+        return
+    connection = session.connection()  # session.execute는 flush 중 autoflush를 시도하므로 연결에서 직접 실행
+    for statement in coauthor_crud.refresh_statements(author_ids):
+        connection.execute(statement)
+
+
+async def init_coauthor_graph(db: AsyncSession) -> None:
+    """서버 시작 시 paper_author 변경 추적을 등록하고, coauthor_edge가 비어 있으면 일괄 생성"""
+    global _hooks_registered
+    if not settings.COAUTHOR_GRAPH_ENABLED:
+        logger.info("Coauthor graph disabled. Coauthor lists will use paper_author self-joins.")
+        return
+    if not _hooks_registered:
+        event.listen(Session, "after_flush", _refresh_on_flush)
+        _hooks_registered = True
+    if not await coauthor_crud.count_coauthor_edges(db):
+        started = time.perf_counter()
+        edges = await coauthor_crud.rebuild_coauthor_edges(db)
+        await db.commit()
+        logger.info(f"coauthor_edge built: {edges} directed edges in {time.perf_counter() - started:.2f}s")
+
+
+class CoauthorService:
+    """공동 저자 조회 (coauthor_edge 사전 계산 인접 리스트 사용)"""
+
+    @staticmethod
+    async def get_coauthors(db: AsyncSession, author_id: str, limit: int = 20) -> List[Dict]:
+        """공동 저자 목록 (공유 논문 수 순)"""
+        if settings.COAUTHOR_GRAPH_ENABLED:
+            rows = await coauthor_crud.get_coauthors(db, int(author_id), limit)
+        else:
+            rows = await coauthor_crud.get_coauthors_live(db, int(author_id), limit)
+        return [
+            {
+                "author_id": str(author.AuthorId),
+                "name": author.Name,
+                "paper_count": shared_papers,
+                "last_collaboration_year": last_year
+            }
+            for author, shared_papers, last_year in rows
+        ]
+
+    @staticmethod
+    async def get_second_degree_coauthors(
+        db: AsyncSession,
+        author_id: str,
+        limit: int = 20,
+        min_shared_papers: int = 1
+    ) -> List[Dict]:
+        """공동 저자의 공동 저자 (네트워크 뷰용, 직접 공동 저자는 제외)"""
+        if not settings.COAUTHOR_GRAPH_ENABLED:
+            raise RuntimeError("Coauthor graph is disabled.")
+        rows = await coauthor_crud.get_second_degree_coauthors(db, int(author_id), limit, min_shared_papers)
+        return [
+            {
+                "author_id": str(author.AuthorId),
+                "name": author.Name,
+                "mutual_coauthors": mutual_count,
+                "path_weight": path_weight
+            }
+            for author, mutual_count, path_weight in rows
+        ]
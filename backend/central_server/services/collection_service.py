@@ -1,8 +1,10 @@
 # services/collection.py
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Dict, Optional
-from crud import collection as collection_crud, paper as paper_crud
+from crud import collection as collection_crud
 from services.recommendation_service import RecommendationService
+from services.hydration_service import PaperHydrationService
+from utils.dataloader import get_loaders
 from fastapi import HTTPException
 
 
@@ -36,18 +38,8 @@ class CollectionService:
         
         papers = await collection_crud.get_collection_papers(db, collection_id)
         
-        # 각 논문의 저자 정보 추가
-        papers_with_authors = []
-        for paper in papers:
-            authors = await paper_crud.get_paper_authors(db, paper.PaperId)
-            papers_with_authors.append({
-                "PaperId": paper.PaperId,
-                "Title": paper.Title,
-                "Year": paper.Year,
-                "Abstract": paper.Abstract,
-                "CitationCount": paper.CitationCount,
-                "authors": authors
-            })
+        # 논문들의 저자 정보를 한 번에 추가
+        papers_with_authors = await PaperHydrationService.hydrate_papers(db, papers)
         
         return {
             "collection": collection,
@@ -71,7 +63,7 @@ class CollectionService:
             raise HTTPException(status_code=404, detail="Collection not found")
         
         # 논문 존재 확인
-        paper = await paper_crud.get_paper_by_id(db, paper_id)
+        paper = await get_loaders(db).papers.load(paper_id)
         if not paper:
             raise HTTPException(status_code=404, detail="Paper not found")
         
@@ -139,23 +131,7 @@ class CollectionService:
         )
         
         # 저자 정보 추가
-        results = []
-        for paper, score, reason in recommendations:
-            authors = await paper_crud.get_paper_authors(db, paper.PaperId)
-            results.append({
-                "paper": {
-                    "PaperId": paper.PaperId,
-                    "Title": paper.Title,
-                    "Year": paper.Year,
-                    "Abstract": paper.Abstract,
-                    "CitationCount": paper.CitationCount,
-                    "authors": authors
-                },
-                "score": score,
-                "reason": reason
-            })
-        
-        return results
+        return await PaperHydrationService.hydrate_recommendations(db, recommendations)
     
     @staticmethod
     async def get_collection_stats(
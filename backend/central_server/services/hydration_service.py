@@ -0,0 +1,51 @@
+# services/hydration_service.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Dict, Sequence, Tuple
+from models import Paper
+from crud import paper as paper_crud
+from utils.dataloader import get_loaders
+
+
+class PaperHydrationService:
+    """
+    논문 목록에 저자/피인용 수를 붙여 응답용 dict로 변환하는 공통 계층.
+    논문 수와 관계없이 저자 조회 1회 + 피인용 수 조회 1회로 처리하므로, 목록 API는 모두 이 서비스를 거쳐야 합니다.
+    """
+
+    @staticmethod
+    async def hydrate_papers(
+        db: AsyncSession,
+        papers: Sequence[Paper]
+    ) -> List[Dict]:
+        """논문 목록을 입력 순서대로 PaperResponse 형태의 dict로 변환 (PaperId는 문자열)"""
+        if not papers:
+            return []
+        paper_ids = [paper.PaperId for paper in papers]
+        loaders = get_loaders(db)
+        for paper in papers:
+            loaders.papers.prime(paper.PaperId, paper)  # 같은 요청의 이후 load(paper_id)는 쿼리 없이 반환
+        authors = await paper_crud.get_authors_for_papers(db, paper_ids)
+        citation_counts = await paper_crud.get_citation_counts(db, paper_ids)
+        return [
+            {
+                "PaperId": str(paper.PaperId),  # PaperResponse.paper_id는 문자열
+                "Title": paper.Title,
+                "Year": paper.PublicationYear,
+                "Abstract": paper.Abstract,
+                "CitationCount": citation_counts[paper.PaperId],
+                "authors": authors[paper.PaperId]
+            }
+            for paper in papers
+        ]
+
+    @staticmethod
+    async def hydrate_recommendations(
+        db: AsyncSession,
+        recommendations: Sequence[Tuple[Paper, float, str]]
+    ) -> List[Dict]:
+        """(논문, 점수, 사유) 추천 목록을 {"paper", "score", "reason"} 형태로 변환"""
+        papers = await PaperHydrationService.hydrate_papers(db, [paper for paper, _, _ in recommendations])
+        return [
+            {"paper": paper, "score": score, "reason": reason}
+            for paper, (_, score, reason) in zip(papers, recommendations)
+        ]
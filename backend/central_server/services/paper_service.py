@@ -1,9 +1,14 @@
 # services/paper.py
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
 from models import Paper
 from crud import paper as paper_crud
-from schemas.paper import PaperResponse
+from services.hydration_service import PaperHydrationService
+from services.trending_service import TrendingService
+from core.config import settings
+from core.search_index import search_dialect
+from utils.dataloader import get_loaders
+from utils.pagination import paginate_keyset
 
 
 class PaperService:
@@ -14,13 +19,13 @@ class PaperService:
         db: AsyncSession,
         paper_id: str
     ) -> Optional[Dict]:
-        """논문 상세 정보 조회 (저자, 통계 포함)"""
-        paper_data = await paper_crud.get_paper_with_authors(db, paper_id)
-        if not paper_data:
+        """논문 상세 정보 조회 (저자, 통계 포함). 숫자가 아닌 ID는 ValueError"""
+        paper = await get_loaders(db).papers.load(paper_id)
+        if not paper:
             return None
         
-        paper, authors = paper_data
-        stats = await paper_crud.get_paper_stats(db, paper_id)
+        authors = await paper_crud.get_paper_authors(db, paper.PaperId)
+        stats = await paper_crud.get_paper_stats(db, paper.PaperId)
         
         return {
             "paper": paper,
@@ -28,6 +33,51 @@ class PaperService:
             "stats": stats
         }
     
+    @staticmethod
+    async def get_paper_stats(
+        db: AsyncSession,
+        paper_id: str
+    ) -> Optional[Dict]:
+        """논문 통계 (PaperStatsResponse 형태). 숫자가 아닌 ID는 ValueError"""
+        paper = await get_loaders(db).papers.load(paper_id)
+        if not paper:
+            return None
+        
+        stats = await paper_crud.get_paper_stats(db, paper.PaperId)
+        return {
+            "paper_id": str(paper.PaperId),
+            "title": paper.Title,
+            "year": paper.PublicationYear,
+            "citation_count": stats["citation_count"],
+            "reference_count": stats["reference_count"],
+            "direct_citations": stats["citation_count"],
+            "author_count": stats["author_count"]
+        }
+    
+    @staticmethod
+    def _parse_id(value: str, kind: str) -> int:
+        """경로 파라미터 ID를 정수로 변환. 숫자가 아니면 응답에 그대로 쓸 수 있는 메시지의 ValueError"""
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid {kind} id") from None
+    
+    @staticmethod
+    async def _paginate_papers(
+        db: AsyncSession,
+        statement,
+        sort_keys,
+        cursor: Optional[str],
+        limit: int,
+        scope: str
+    ) -> Dict:
+        """논문 SELECT를 키셋 페이지네이션하고 페이지의 논문에 저자/피인용 수를 붙임 (CursorPage 형태)"""
+        page = await paginate_keyset(
+            db, statement, sort_keys, cursor, limit, scope, settings.PAGINATION_EXACT_COUNT_THRESHOLD
+        )
+        page["items"] = await PaperHydrationService.hydrate_papers(db, page["items"])
+        return page
+    
     @staticmethod
     async def search_papers_with_authors(
         db: AsyncSession,
@@ -35,109 +85,139 @@ class PaperService:
         year_min: Optional[int] = None,
         year_max: Optional[int] = None,
         limit: int = 20,
-        offset: int = 0
-    ) -> List[PaperResponse]:
-        """논문 검색 (저자 정보 포함)"""
-        papers = await paper_crud.search_papers(
-            db, query, year_min, year_max, limit, offset
-        )
-        
-        results = []
-        for paper in papers:
-            authors = await paper_crud.get_paper_authors(db, paper.PaperId)
-            results.append({
-                "PaperId": paper.PaperId,
-                "Title": paper.Title,
-                "Year": paper.Year,
-                "Abstract": paper.Abstract,
-                "CitationCount": paper.CitationCount,
-                "authors": authors
-            })
-        
-        return results
+        cursor: Optional[str] = None
+    ) -> Dict:
+        """논문 검색 (저자 정보 포함, 관련도 순 cursor 페이지)"""
+        statement, sort_keys = paper_crud.search_papers_statement(search_dialect(db.bind.dialect.name), query, year_min, year_max)
+        scope = f"papers.search|{query.strip()}|{year_min}|{year_max}"
+        return await PaperService._paginate_papers(db, statement, sort_keys, cursor, limit, scope)
     
     @staticmethod
-    async def get_citation_network(
+    async def get_paper_references(
         db: AsyncSession,
         paper_id: str,
-        depth: int = 1
+        limit: int = 50,
+        cursor: Optional[str] = None
     ) -> Dict:
-        """Citation 네트워크 데이터 생성 (시각화용)"""
-        if depth < 1:
-            depth = 1
-        
-        # 중심 논문
-        center_paper = await paper_crud.get_paper_by_id(db, paper_id)
+        """논문이 인용한 논문들 (최신 순 cursor 페이지). 잘못된 ID/cursor는 ValueError"""
+        statement, sort_keys = paper_crud.paper_references_statement(PaperService._parse_id(paper_id, "paper"))
+        return await PaperService._paginate_papers(db, statement, sort_keys, cursor, limit, f"papers.references|{paper_id}")
+    
+    @staticmethod
+    async def get_paper_citations(
+        db: AsyncSession,
+        paper_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Dict:
+        """논문을 인용한 논문들 (최신 순 cursor 페이지). 잘못된 ID/cursor는 ValueError"""
+        statement, sort_keys = paper_crud.paper_citations_statement(PaperService._parse_id(paper_id, "paper"))
+        return await PaperService._paginate_papers(db, statement, sort_keys, cursor, limit, f"papers.citations|{paper_id}")
+    
+    @staticmethod
+    async def get_author_papers(
+        db: AsyncSession,
+        author_id: str,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Dict:
+        """저자의 논문들 (최신 순 cursor 페이지). 잘못된 ID/cursor는 ValueError"""
+        statement, sort_keys = paper_crud.author_papers_statement(PaperService._parse_id(author_id, "author"))
+        return await PaperService._paginate_papers(db, statement, sort_keys, cursor, limit, f"authors.papers|{author_id}")
+    
+    @staticmethod
+    async def iter_citation_network(
+        db: AsyncSession,
+        paper_id: str,
+        depth: int = 1,
+        max_nodes_per_hop: int = 50
+    ) -> AsyncIterator[Dict]:
+        """
+        Citation 네트워크 BFS. hop마다 frontier 전체의 인용 엣지를 한 번에 조회하고,
+        새로 발견한 논문은 피인용 수 상위 max_nodes_per_hop개만 다음 frontier로 남깁니다.
+        {"type": "node" | "edge" | "hop", ...} 이벤트를 hop 순서대로 생성하므로 그대로 스트리밍할 수 있습니다.
+        엣지는 source가 target을 인용하는 방향이며, 양 끝 논문이 모두 네트워크에 포함된 경우에만 한 번씩 반환됩니다.
+        숫자가 아닌 paper_id는 ValueError.
+        """
+        loaders = get_loaders(db)
+        center_paper = await loaders.papers.load(paper_id)
         if not center_paper:
-            return None
-        
-        nodes = {paper_id: center_paper}
-        edges = []
-        
-        # References (이 논문이 인용한 논문들)
-        references = await paper_crud.get_paper_references(db, paper_id, limit=20)
-        for ref in references:
-            nodes[ref.PaperId] = ref
-            edges.append({
-                "source": paper_id,
-                "target": ref.PaperId,
-                "type": "references"
-            })
-        
-        # Citations (이 논문을 인용한 논문들)
-        citations = await paper_crud.get_paper_citations(db, paper_id, limit=20)
-        for cite in citations:
-            nodes[cite.PaperId] = cite
-            edges.append({
-                "source": cite.PaperId,
-                "target": paper_id,
-                "type": "cites"
-            })
-        
+            return
+        counts = await paper_crud.get_citation_counts(db, [center_paper.PaperId])
+        yield PaperService._network_node(center_paper, 0, counts[center_paper.PaperId])
+
+        visited = {center_paper.PaperId}
+        seen_edges = set()
+        frontier = [center_paper.PaperId]
+        depth = max(1, depth)
+        for hop in range(1, depth + 1):
+            if not frontier:
+                break
+            edges = await paper_crud.get_citation_edges(db, frontier)
+            neighbor_ids = {pid for edge in edges for pid in edge if pid not in visited}
+            counts = await paper_crud.get_citation_counts(db, neighbor_ids)
+            kept = sorted(neighbor_ids, key=lambda pid: (-counts[pid], pid))[:max_nodes_per_hop]
+            new_papers = [paper for paper in await loaders.papers.load_many(kept) if paper]
+
+            visited.update(paper.PaperId for paper in new_papers)
+            for paper in new_papers:
+                yield PaperService._network_node(paper, hop, counts[paper.PaperId])
+            if hop == depth:
+                # 마지막 hop에서 함께 발견된 논문끼리의 엣지는 다음 hop 조회가 없으므로 여기서 보충
+                edges = edges + await paper_crud.get_citation_edges_within(db, [paper.PaperId for paper in new_papers])
+            for citing, cited in edges:
+                if citing in visited and cited in visited and (citing, cited) not in seen_edges:
+                    seen_edges.add((citing, cited))
+                    yield {"type": "edge", "source": citing, "target": cited, "relation": "cites"}
+            yield {
+                "type": "hop",
+                "hop": hop,
+                "nodes": len(new_papers),
+                "truncated": len(neighbor_ids) - len(kept)
+            }
+            frontier = [paper.PaperId for paper in new_papers]
+
+    @staticmethod
+    def _network_node(paper: Paper, hop: int, citation_count: int) -> Dict:
         return {
-            "nodes": [
-                {
-                    "id": pid,
-                    "title": p.Title,
-                    "year": p.Year,
-                    "citation_count": p.CitationCount
-                }
-                for pid, p in nodes.items()
-            ],
-            "edges": edges
+            "type": "node",
+            "id": paper.PaperId,
+            "title": paper.Title,
+            "year": paper.PublicationYear,
+            "citation_count": citation_count,
+            "hop": hop
         }
+
+    @staticmethod
+    async def get_citation_network(
+        db: AsyncSession,
+        paper_id: str,
+        depth: int = 1,
+        max_nodes_per_hop: int = 50
+    ) -> Optional[Dict]:
+        """Citation 네트워크 데이터 생성 (시각화용). 논문이 없으면 None, 숫자가 아닌 paper_id는 ValueError"""
+        nodes, edges, hops = [], [], []
+        async for event in PaperService.iter_citation_network(db, paper_id, depth, max_nodes_per_hop):
+            kind = event.pop("type")
+            {"node": nodes, "edge": edges, "hop": hops}[kind].append(event)
+        if not nodes:
+            return None
+        return {"nodes": nodes, "edges": edges, "hops": hops}
     
     @staticmethod
     async def get_papers_with_authors_batch(
         db: AsyncSession,
         papers: List[Paper]
     ) -> List[Dict]:
-        """여러 논문의 저자 정보를 일괄 조회"""
-        results = []
-        for paper in papers:
-            authors = await paper_crud.get_paper_authors(db, paper.PaperId)
-            results.append({
-                "PaperId": paper.PaperId,
-                "Title": paper.Title,
-                "Year": paper.Year,
-                "Abstract": paper.Abstract,
-                "CitationCount": paper.CitationCount,
-                "authors": authors
-            })
-        return results
+        """여러 논문의 저자 정보를 일괄 조회 (논문 수와 무관하게 고정된 쿼리 수)"""
+        return await PaperHydrationService.hydrate_papers(db, papers)
     
     @staticmethod
     async def get_trending_papers(
         db: AsyncSession,
+        year: Optional[int] = None,
         year_min: Optional[int] = None,
         limit: int = 20
     ) -> List[Dict]:
-        """트렌딩 논문 (최근 + 많이 인용됨)"""
-        papers = await paper_crud.search_papers(
-            db,
-            query="",  # 빈 쿼리로 전체 검색
-            year_min=year_min,
-            limit=limit
-        )
-        
-        return await PaperService.get_papers_with_authors_batch(db, papers)
\ No newline at end of file
+        """트렌딩 논문 (시간 감쇠 인용 속도 순, paper_trending 상위 N개 조회)"""
+        return await TrendingService.get_trending_papers(db, year, year_min, limit)
\ No newline at end of file
@@ -0,0 +1,216 @@
+# services/paper_similarity_service.py
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from crud import paper_similarity as similarity_crud
+from models import Paper
+from services.citation_graph import CitationGraph, get_citation_graph
+from services.recommendation_service import RecommendationService
+from utils.periodic import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+Neighbors = Dict[int, List[Tuple[int, float, int]]]  # {PaperId: [(SimilarPaperId, Score, CommonCount)]} (순위 순)
+
+ALGORITHMS = ("co_citation", "bibliographic_coupling")
+REASONS = {
+    "co_citation": "Shares {count} references with the selected paper",
+    "bibliographic_coupling": "Cited by {count} papers that also cite the selected paper",
+}
+
+
+def _top_k_block(ids: np.ndarray, left, right, rows: np.ndarray, k: int) -> Neighbors:
+    """
+    행 블록 하나의 유사도 행렬(left[rows] @ right)을 계산해 행마다 상위 k개를 추림.
+    co_citation은 out @ in (공유 참조 수), bibliographic_coupling은 in @ out (공동 피인용 수)이며,
+    점수는 RecommendationService와 같이 공유 수 / 해당 논문의 참조(또는 피인용) 수입니다.
+    """
+    block = (left[rows] @ right).tocsr()
+    degrees = np.diff(left.indptr)[rows]
+    neighbors: Neighbors = {}
+    for r, row in enumerate(rows):
+        start, end = block.indptr[r], block.indptr[r + 1]
+        cols, counts = block.indices[start:end], block.data[start:end]
+        keep = (cols != row) & (counts > 0)
+        cols, counts = cols[keep], counts[keep]
+        if len(counts) > k:
+            threshold = np.partition(counts, len(counts) - k)[len(counts) - k]
+            keep = counts >= threshold  # 동점 처리를 위해 경계값 포함
+            cols, counts = cols[keep], counts[keep]
+        paper_ids = ids[cols]
+        order = np.lexsort((paper_ids, -counts))[:k]  # 공유 수 내림차순, PaperId 오름차순
+        degree = int(degrees[r])
+        neighbors[int(ids[row])] = [
+            (int(paper_ids[o]), float(counts[o]) / degree, int(counts[o])) for o in order
+        ] if degree else []
+    return neighbors
+
+
+class PaperSimilarityService:
+    """
+    paper_similarity 테이블(논문별 상위 K개 유사 논문) 관리.
+    전체 빌드는 인용 그래프 스냅샷으로 행 블록 단위 희소 행렬 곱을 계산하고,
+    증분 갱신은 새 인용의 영향을 받는 논문만 다시 계산합니다.
+    """
+
+    @staticmethod
+    async def get_similar_papers(
+        db: AsyncSession,
+        paper_id: str,
+        algorithm: str,
+        limit: int = 10
+    ) -> List[Tuple[Paper, float, str]]:
+        """사전 계산된 유사 논문 조회. 아직 계산되지 않은 논문이면 RecommendationService로 바로 계산"""
+        rows = await similarity_crud.get_similar_papers(db, int(paper_id), algorithm, limit)
+        if rows:
+            return [(paper, score, REASONS[algorithm].format(count=common_count)) for paper, score, common_count in rows]
+        if algorithm == "co_citation":
+            return await RecommendationService.get_similar_papers_by_co_citation(db, paper_id, limit)
+        return await RecommendationService.get_similar_papers_by_bibliographic_coupling(db, paper_id, limit)
+
+    @staticmethod
+    async def rebuild(
+        db: AsyncSession,
+        graph: CitationGraph,
+        top_k: int,
+        block_rows: int
+    ) -> Dict[str, int]:
+        """두 알고리즘의 유사 논문 목록 전체를 다시 계산 (알고리즘별 한 트랜잭션)"""
+        graph.drain_changed_edges()  # 스냅샷에 모두 반영되므로 대기 중인 증분 갱신은 불필요
+        ids, out, in_ = graph.snapshot()
+        written = {}
+        for algorithm, (left, right) in {"co_citation": (out, in_), "bibliographic_coupling": (in_, out)}.items():
+            started = time.perf_counter()
+            await similarity_crud.delete_algorithm(db, algorithm)
+            rows = np.flatnonzero(np.diff(left.indptr))  # 참조(피인용)가 하나라도 있는 논문만
+            written[algorithm] = 0
+            for start in range(0, len(rows), block_rows):
+                neighbors = await asyncio.to_thread(_top_k_block, ids, left, right, rows[start:start + block_rows], top_k)
+                written[algorithm] += await similarity_crud.replace_neighbors(db, algorithm, neighbors)
+            await db.commit()
+            logger.info(f"paper_similarity[{algorithm}] rebuilt: {len(rows)} papers, "
+                        f"{written[algorithm]} rows in {time.perf_counter() - started:.2f}s")
+        return written
+
+    @staticmethod
+    def affected_papers(graph: CitationGraph, changed_edges: Iterable[Tuple[int, int]]) -> Dict[str, Set[int]]:
+        """
+        인용 a → b가 바뀌었을 때 목록이 달라질 수 있는 논문.
+        co_citation(공유 참조): a 자신과 b를 인용한 논문들, bibliographic_coupling(공동 피인용): b 자신과 a가 인용한 논문들
+        """
+        affected = {"co_citation": set(), "bibliographic_coupling": set()}
+        for citing, cited in changed_edges:
+            affected["co_citation"].add(citing)
+            affected["co_citation"].update(graph.citers(cited))
+            affected["bibliographic_coupling"].add(cited)
+            affected["bibliographic_coupling"].update(graph.references(citing))
+        return affected
+
+    @staticmethod
+    async def refresh(
+        db: AsyncSession,
+        graph: CitationGraph,
+        changed_edges: Iterable[Tuple[int, int]],
+        top_k: int,
+        block_rows: int
+    ) -> Dict[str, int]:
+        """바뀐 인용의 영향을 받는 논문만 다시 계산 (영향 범위가 block_rows보다 크면 스냅샷 블록 계산)"""
+        affected = PaperSimilarityService.affected_papers(graph, changed_edges)
+        snapshot = None
+        recomputed = {}
+        for algorithm, paper_ids in affected.items():
+            if len(paper_ids) > block_rows:
+                if snapshot is None:
+                    snapshot = graph.snapshot()
+                ids, out, in_ = snapshot
+                left, right = (out, in_) if algorithm == "co_citation" else (in_, out)
+                index = {paper_id: i for i, paper_id in enumerate(ids.tolist())}
+                rows = np.asarray(sorted(index[pid] for pid in paper_ids if pid in index), dtype=np.int64)
+                neighbors: Neighbors = {pid: [] for pid in paper_ids}
+                for start in range(0, len(rows), block_rows):
+                    neighbors.update(await asyncio.to_thread(
+                        _top_k_block, ids, left, right, rows[start:start + block_rows], top_k
+                    ))
+            else:
+                neighbors = {pid: PaperSimilarityService._paper_neighbors(graph, algorithm, pid, top_k) for pid in paper_ids}
+            await similarity_crud.replace_neighbors(db, algorithm, neighbors)
+            recomputed[algorithm] = len(neighbors)
+        await db.commit()
+        return recomputed
+
+    @staticmethod
+    def _paper_neighbors(graph: CitationGraph, algorithm: str, paper_id: int, top_k: int) -> List[Tuple[int, float, int]]:
+        if algorithm == "co_citation":
+            degree, counts = len(graph.references(paper_id)), graph.shared_reference_counts(paper_id)
+        else:
+            degree, counts = len(graph.citers(paper_id)), graph.co_cited_counts(paper_id)
+        if not degree:
+            return []
+        return [(similar_id, count / degree, count) for similar_id, count in graph.top_k(counts, top_k, [paper_id])]
+
+
+class PaperSimilarityRefresher:
+    """
+    서버에서 주기적으로 paper_similarity를 갱신하는 백그라운드 작업.
+    테이블이 비어 있으면 전체 빌드를, 이후에는 인용 그래프에 쌓인 변경만 증분 갱신합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        top_k: int,
+        block_rows: int,
+        interval_seconds: float
+    ):
+        self.session_factory = session_factory
+        self.top_k = top_k
+        self.block_rows = block_rows
+        self._pending: Set[Tuple[int, int]] = set()  # 커밋 전에 실패해도 다음 주기에 다시 처리
+        self._task = PeriodicTask("paper_similarity refresh", self.run_once, interval_seconds)
+
+    async def run_once(self) -> Optional[Dict[str, int]]:
+        graph = get_citation_graph()
+        if graph is None:
+            return None
+        async with self.session_factory() as db:
+            counts = [await similarity_crud.count_rows(db, algorithm) for algorithm in ALGORITHMS]
+            if not all(counts) and graph.stats()["citations"]:
+                self._pending.clear()
+                return await PaperSimilarityService.rebuild(db, graph, self.top_k, self.block_rows)
+            self._pending |= graph.drain_changed_edges()
+            if not self._pending:
+                return {}
+            recomputed = await PaperSimilarityService.refresh(db, graph, self._pending, self.top_k, self.block_rows)
+            logger.info(f"paper_similarity refreshed for {len(self._pending)} changed citations: {recomputed}")
+            self._pending.clear()
+            return recomputed
+
+    def start(self) -> None:
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
+
+
+_refresher: Optional[PaperSimilarityRefresher] = None
+
+
+def get_paper_similarity_refresher(session_factory: Callable[[], AsyncSession] = None) -> Optional[PaperSimilarityRefresher]:
+    """주기적 갱신 작업 싱글톤 (비활성화 시 None)"""
+    global _refresher
+    if not settings.PAPER_SIMILARITY_ENABLED:
+        return None
+    if _refresher is None and session_factory is not None:
+        _refresher = PaperSimilarityRefresher(
+            session_factory,
+            settings.PAPER_SIMILARITY_TOP_K,
+            settings.PAPER_SIMILARITY_BLOCK_ROWS,
+            settings.PAPER_SIMILARITY_REFRESH_SECONDS
+        )
+    return _refresher
@@ -38,7 +38,7 @@ class QueryService:
             search_results = response.json()
             
             # 2. LLM 컨텍스트 구성 및 답변 생성
-            context = self._build_internal_context(search_results)
+            context = self._build_internal_context(search_results, request.summaries)
             llm_answer = await self.llm_service.get_final_response(context, request.query_text)
 
             # 3. 최종 응답 데이터 구성 (references)
@@ -165,9 +165,24 @@ class QueryService:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"외부 검색 처리 중 오류 발생: {str(e)}")
 
-    def _build_internal_context(self, chunks: List[Dict[str, Any]]) -> str:
-        """내부 검색 결과를 LLM 컨텍스트로 구성"""
-        return "\n\n---\n\n".join([chunk.get("content", "") for chunk in chunks])
+    def _build_internal_context(self, chunks: List[Dict[str, Any]], summaries: str = "none") -> str:
+        """
+        내부 검색 결과를 LLM 컨텍스트로 구성.
+        attach는 청크 원문을 모두 유지하고 문서별 요약을 처음 한 번만 앞에 추가하며,
+        replace는 요약이 있는 문서의 청크를 요약 한 번으로 대체합니다 (요약이 없는 문서는 청크 원문 사용).
+        """
+        context_parts = []
+        summarized = set()
+        for chunk in chunks:
+            summary = chunk.get("summary") if summaries != "none" else None
+            doc_id = chunk.get("doi")
+            if summary and doc_id not in summarized:
+                summarized.add(doc_id)
+                context_parts.append(f"제목: {chunk.get('title', '제목 없음')}\n\n요약:\n{summary}")
+            if summary and summaries == "replace":
+                continue
+            context_parts.append(chunk.get("content", ""))
+        return "\n\n---\n\n".join(context_parts)
 
     def _build_external_context(self, papers: List[Dict[str, Any]]) -> str:
         """외부 논문 검색 결과를 LLM 컨텍스트로 구성"""
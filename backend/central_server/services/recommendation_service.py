@@ -1,13 +1,28 @@
 # services/recommendation.py
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
-from typing import List, Dict, Tuple
-from models import Paper, Citation, Author, PaperAuthor
+from typing import List, Tuple
+from models import Paper, Citation, PaperAuthor
 from crud import paper as paper_crud
+from services.citation_graph import get_citation_graph
+from utils.dataloader import get_loaders
 
 
 class RecommendationService:
-    """논문 추천 서비스"""
+    """
+    논문 추천 서비스.
+    인용 그래프(services.citation_graph)가 로드되어 있으면 인용 관계 집계를 희소 행렬 연산으로 처리하고
+    논문 행만 요청 단위 로더로 한 번에 조회합니다. 그래프가 없으면 같은 결과를 SQL GROUP BY로 계산합니다.
+    """
+    
+    @staticmethod
+    async def _load_ranked(
+        db: AsyncSession,
+        ranked: List[Tuple[int, int]]
+    ) -> List[Tuple[Paper, int]]:
+        """(PaperId, count) 순위 목록의 Paper 행을 한 번에 조회 (순서 유지)"""
+        papers = await get_loaders(db).papers.load_many([paper_id for paper_id, _ in ranked])
+        return [(paper, count) for paper, (_, count) in zip(papers, ranked) if paper]
     
     @staticmethod
     async def get_similar_papers_by_co_citation(
@@ -16,14 +31,32 @@ class RecommendationService:
         limit: int = 10,
         exclude_ids: List[str] = None
     ) -> List[Tuple[Paper, float, str]]:
-        """공동 인용 기반 유사 논문 추천"""
-        exclude_ids = exclude_ids or []
-        exclude_ids.append(paper_id)
+        """공동 인용 기반 유사 논문 추천 (같은 논문을 참조하는 논문들)"""
+        exclude_ids = [int(pid) for pid in (exclude_ids or [])] + [int(paper_id)]
+        graph = get_citation_graph()
+        if graph is None:
+            return await RecommendationService._co_citation_sql(db, paper_id, limit, exclude_ids)
         
+        reference_count = len(graph.references(paper_id))
+        if not reference_count:
+            return []
+        ranked = graph.top_k(graph.shared_reference_counts(paper_id), limit, exclude_ids)
+        return [
+            (paper, float(common_count) / reference_count, f"Shares {common_count} references with the selected paper")
+            for paper, common_count in await RecommendationService._load_ranked(db, ranked)
+        ]
+    
+    @staticmethod
+    async def _co_citation_sql(
+        db: AsyncSession,
+        paper_id: str,
+        limit: int,
+        exclude_ids: List[int]
+    ) -> List[Tuple[Paper, float, str]]:
         # 1. 이 논문이 인용한 논문들
         cited_by_target = await db.execute(
-            select(Citation.cited_paper_id)
-            .where(Citation.citing_paper_id == paper_id)
+            select(Citation.CitedPaperId)
+            .where(Citation.CitingPaperId == paper_id)
         )
         cited_ids = [id for id, in cited_by_target]
         
@@ -34,17 +67,17 @@ class RecommendationService:
         result = await db.execute(
             select(
                 Paper,
-                func.count(Citation.cited_paper_id).label("common_citations")
+                func.count(Citation.CitedPaperId).label("common_citations")
             )
-            .join(Citation, Paper.PaperId == Citation.citing_paper_id)
+            .join(Citation, Paper.PaperId == Citation.CitingPaperId)
             .where(
                 and_(
-                    Citation.cited_paper_id.in_(cited_ids),
+                    Citation.CitedPaperId.in_(cited_ids),
                     Paper.PaperId.notin_(exclude_ids)
                 )
             )
             .group_by(Paper.PaperId)
-            .order_by(func.count(Citation.cited_paper_id).desc())
+            .order_by(func.count(Citation.CitedPaperId).desc(), Paper.PaperId)
             .limit(limit)
         )
         
@@ -63,14 +96,32 @@ class RecommendationService:
         limit: int = 10,
         exclude_ids: List[str] = None
     ) -> List[Tuple[Paper, float, str]]:
-        """서지결합 기반 유사 논문 추천 (같은 논문을 참조하는 논문들)"""
-        exclude_ids = exclude_ids or []
-        exclude_ids.append(paper_id)
+        """서지결합 기반 유사 논문 추천 (이 논문을 인용한 논문들이 함께 인용한 논문들)"""
+        exclude_ids = [int(pid) for pid in (exclude_ids or [])] + [int(paper_id)]
+        graph = get_citation_graph()
+        if graph is None:
+            return await RecommendationService._bibliographic_coupling_sql(db, paper_id, limit, exclude_ids)
         
+        citing_count = len(graph.citers(paper_id))
+        if not citing_count:
+            return []
+        ranked = graph.top_k(graph.co_cited_counts(paper_id), limit, exclude_ids)
+        return [
+            (paper, float(common_count) / citing_count, f"Cited by {common_count} papers that also cite the selected paper")
+            for paper, common_count in await RecommendationService._load_ranked(db, ranked)
+        ]
+    
+    @staticmethod
+    async def _bibliographic_coupling_sql(
+        db: AsyncSession,
+        paper_id: str,
+        limit: int,
+        exclude_ids: List[int]
+    ) -> List[Tuple[Paper, float, str]]:
         # 1. 이 논문을 인용한 논문들
         citing_papers = await db.execute(
-            select(Citation.citing_paper_id)
-            .where(Citation.cited_paper_id == paper_id)
+            select(Citation.CitingPaperId)
+            .where(Citation.CitedPaperId == paper_id)
         )
         citing_ids = [id for id, in citing_papers]
         
@@ -81,17 +132,17 @@ class RecommendationService:
         result = await db.execute(
             select(
                 Paper,
-                func.count(Citation.citing_paper_id).label("common_citations")
+                func.count(Citation.CitingPaperId).label("common_citations")
             )
-            .join(Citation, Paper.PaperId == Citation.cited_paper_id)
+            .join(Citation, Paper.PaperId == Citation.CitedPaperId)
             .where(
                 and_(
-                    Citation.citing_paper_id.in_(citing_ids),
+                    Citation.CitingPaperId.in_(citing_ids),
                     Paper.PaperId.notin_(exclude_ids)
                 )
             )
             .group_by(Paper.PaperId)
-            .order_by(func.count(Citation.citing_paper_id).desc())
+            .order_by(func.count(Citation.CitingPaperId).desc(), Paper.PaperId)
             .limit(limit)
         )
         
@@ -112,22 +163,37 @@ class RecommendationService:
         """컬렉션 기반 추천 (컬렉션 논문들이 많이 인용한 논문)"""
         if not collection_paper_ids:
             return []
+        graph = get_citation_graph()
+        if graph is None:
+            return await RecommendationService._collection_recommendations_sql(db, collection_paper_ids, limit)
         
+        ranked = graph.top_k(graph.referenced_by_counts(collection_paper_ids), limit, collection_paper_ids)
+        return [
+            (paper, float(count) / len(collection_paper_ids), f"Cited by {count} papers in your collection")
+            for paper, count in await RecommendationService._load_ranked(db, ranked)
+        ]
+    
+    @staticmethod
+    async def _collection_recommendations_sql(
+        db: AsyncSession,
+        collection_paper_ids: List[str],
+        limit: int
+    ) -> List[Tuple[Paper, float, str]]:
         # 컬렉션 논문들이 인용한 논문들
         result = await db.execute(
             select(
                 Paper,
-                func.count(Citation.citing_paper_id).label("citation_count")
+                func.count(Citation.CitingPaperId).label("citation_count")
             )
-            .join(Citation, Paper.PaperId == Citation.cited_paper_id)
+            .join(Citation, Paper.PaperId == Citation.CitedPaperId)
             .where(
                 and_(
-                    Citation.citing_paper_id.in_(collection_paper_ids),
+                    Citation.CitingPaperId.in_(collection_paper_ids),
                     Paper.PaperId.notin_(collection_paper_ids)
                 )
             )
             .group_by(Paper.PaperId)
-            .order_by(func.count(Citation.citing_paper_id).desc())
+            .order_by(func.count(Citation.CitingPaperId).desc(), Paper.PaperId)
             .limit(limit)
         )
         
@@ -148,44 +214,72 @@ class RecommendationService:
     ) -> List[Tuple[Paper, float, str]]:
         """최근 관련 논문 추천"""
         # 해당 논문이 인용한 논문들의 최근 인용 논문
-        target_paper = await paper_crud.get_paper_by_id(db, paper_id)
-        if not target_paper or not target_paper.Year:
+        target_paper = await get_loaders(db).papers.load(paper_id)
+        if not target_paper or not target_paper.PublicationYear:
             return []
         
-        min_year = target_paper.Year - years
+        min_year = target_paper.PublicationYear - years
+        graph = get_citation_graph()
+        if graph is None:
+            papers = await RecommendationService._recent_papers_in_field_sql(db, target_paper.PaperId, min_year, limit)
+        else:
+            # 참조 논문들을 인용한 논문 후보는 그래프에서, 출판 연도 필터만 SQL로
+            cited_list = graph.references(target_paper.PaperId)
+            if not cited_list:
+                return []
+            candidates = set(graph.cited_by_any_counts(cited_list)) - {target_paper.PaperId}
+            recent_years = await paper_crud.get_publication_years(db, candidates, min_year)
+            citation_counts = graph.citation_counts(recent_years)
+            ranked = sorted(recent_years, key=lambda pid: (-recent_years[pid], -citation_counts[pid], pid))[:limit]
+            papers = [paper for paper in await get_loaders(db).papers.load_many(ranked) if paper]
         
+        recommendations = []
+        for paper in papers:
+            score = 1.0 - (target_paper.PublicationYear - paper.PublicationYear) / years if paper.PublicationYear else 0.5
+            reason = f"Recent paper ({paper.PublicationYear}) citing related work"
+            recommendations.append((paper, score, reason))
+        
+        return recommendations
+    
+    @staticmethod
+    async def _recent_papers_in_field_sql(
+        db: AsyncSession,
+        paper_id: int,
+        min_year: int,
+        limit: int
+    ) -> List[Paper]:
         # 참조 논문들
         cited_ids = await db.execute(
-            select(Citation.cited_paper_id)
-            .where(Citation.citing_paper_id == paper_id)
+            select(Citation.CitedPaperId)
+            .where(Citation.CitingPaperId == paper_id)
         )
         cited_list = [id for id, in cited_ids]
         
         if not cited_list:
             return []
         
-        # 이 참조 논문들을 인용한 최근 논문들
+        # 이 참조 논문들을 인용한 최근 논문들 (피인용 수 집계 서브쿼리로 동순위 정렬)
+        citation_counts = (
+            select(Citation.CitedPaperId, func.count().label("cnt"))
+            .group_by(Citation.CitedPaperId)
+            .subquery()
+        )
         result = await db.execute(
             select(Paper)
-            .join(Citation, Paper.PaperId == Citation.citing_paper_id)
+            .outerjoin(citation_counts, citation_counts.c.CitedPaperId == Paper.PaperId)
             .where(
                 and_(
-                    Citation.cited_paper_id.in_(cited_list),
-                    Paper.Year >= min_year,
+                    Paper.PaperId.in_(
+                        select(Citation.CitingPaperId).where(Citation.CitedPaperId.in_(cited_list))
+                    ),
+                    Paper.PublicationYear >= min_year,
                     Paper.PaperId != paper_id
                 )
             )
-            .order_by(Paper.Year.desc(), Paper.CitationCount.desc())
+            .order_by(Paper.PublicationYear.desc(), func.coalesce(citation_counts.c.cnt, 0).desc(), Paper.PaperId)
             .limit(limit)
         )
-        
-        recommendations = []
-        for paper in result.scalars():
-            score = 1.0 - (target_paper.Year - paper.Year) / years if paper.Year else 0.5
-            reason = f"Recent paper ({paper.Year}) citing related work"
-            recommendations.append((paper, score, reason))
-        
-        return recommendations
+        return list(result.scalars())
     
     @staticmethod
     async def get_author_recommendations(
@@ -203,15 +297,12 @@ class RecommendationService:
             .limit(limit)
         )
         
+        # 저자 이름은 루프 밖에서 한 번만 (요청 단위 로더로 메모이즈)
+        author = await get_loaders(db).authors.load(author_id)
+        author_name = author.Name if author else None
+        
         recommendations = []
         for paper in result.scalars():
-            # 저자 이름 가져오기
-            author_result = await db.execute(
-                select(Author.Name)
-                .where(Author.AuthorId == author_id)
-            )
-            author_name = author_result.scalar()
-            
             score = 0.9  # 같은 저자이므로 높은 점수
             reason = f"By the same author: {author_name}"
             recommendations.append((paper, score, reason))
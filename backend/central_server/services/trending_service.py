@@ -0,0 +1,197 @@
+# services/trending_service.py
+import logging
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from crud import paper as paper_crud, paper_trending as trending_crud
+from models import Citation, Paper
+from services.hydration_service import PaperHydrationService
+from utils.periodic import PeriodicTask
+from utils.session_changes import PendingChanges, SessionChangeCollector
+
+logger = logging.getLogger(__name__)
+
+
+def compute_trending_scores(
+    rows: List[Tuple[int, Optional[int], Optional[int], int]],
+    score_year: int,
+    half_life_years: float
+) -> Dict[int, Dict]:
+    """
+    (CitedPaperId, 피인용 논문 연도, 인용 논문 연도, 인용 수) 집계 행으로 논문별 트렌딩 점수를 한 번에 계산.
+    인용 하나의 가중치는 2^(-(score_year - 인용 논문 연도) / 반감기)이며, 출판 연도를 모르는 인용은
+    피인용 수에만 포함되고 점수에는 더하지 않습니다.
+    """
+    if not rows:
+        return {}
+    cited = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+    citing_years = np.fromiter(
+        (np.nan if row[2] is None else row[2] for row in rows), dtype=np.float64, count=len(rows)
+    )
+    counts = np.fromiter((row[3] for row in rows), dtype=np.float64, count=len(rows))
+    ages = np.maximum(score_year - citing_years, 0.0)  # 기준 연도 이후 출판(미래 연도)은 가중치 1
+    weights = np.where(np.isnan(ages), 0.0, np.exp2(-ages / half_life_years)) * counts
+    paper_ids, first, group = np.unique(cited, return_index=True, return_inverse=True)
+    scores = np.bincount(group, weights=weights, minlength=len(paper_ids))
+    citation_counts = np.bincount(group, weights=counts, minlength=len(paper_ids))
+    return {
+        int(paper_id): {
+            "Score": float(score),
+            "CitationCount": int(citation_count),
+            "PublicationYear": rows[index][1],
+            "ScoreYear": score_year,
+        }
+        for paper_id, index, score, citation_count in zip(paper_ids, first, scores, citation_counts)
+    }
+
+
+class TrendingService:
+    """트렌딩 점수(최근 인용에 지수적으로 큰 가중치를 준 인용 속도) 계산 및 paper_trending 테이블 갱신"""
+
+    @staticmethod
+    async def rebuild(db: AsyncSession, score_year: int, half_life_years: float) -> int:
+        """전체 논문의 점수를 GROUP BY 한 번으로 다시 계산해 교체"""
+        started = time.perf_counter()
+        rows = await trending_crud.get_citation_year_counts(db)
+        scores = compute_trending_scores(rows, score_year, half_life_years)
+        await trending_crud.delete_all_trending(db)  # 인용이 모두 사라진 논문의 행도 정리
+        written = await trending_crud.replace_trending(db, [], scores)
+        await db.commit()
+        logger.info(f"paper_trending rebuilt: {written} papers (score year {score_year}) "
+                    f"in {time.perf_counter() - started:.2f}s")
+        return written
+
+    @staticmethod
+    async def refresh(
+        db: AsyncSession,
+        paper_ids: Iterable[int],
+        year_changed_ids: Iterable[int],
+        score_year: int,
+        half_life_years: float
+    ) -> int:
+        """
+        인용이 추가/삭제된 피인용 논문과 출판 연도가 바뀐 논문만 다시 계산.
+        연도가 바뀐 논문은 자기 행의 PublicationYear와, 그 논문이 인용한 논문들의 점수가 달라집니다.
+        """
+        year_changed_ids = set(year_changed_ids)
+        affected = set(paper_ids) | year_changed_ids
+        affected |= set(await trending_crud.get_referenced_paper_ids(db, year_changed_ids))
+        if not affected:
+            return 0
+        rows = await trending_crud.get_citation_year_counts(db, affected)
+        scores = compute_trending_scores(rows, score_year, half_life_years)
+        await trending_crud.replace_trending(db, affected, scores)
+        await db.commit()
+        return len(affected)
+
+    @staticmethod
+    async def get_trending_papers(
+        db: AsyncSession,
+        year: Optional[int] = None,
+        year_min: Optional[int] = None,
+        limit: int = 20
+    ) -> List[Dict]:
+        """
+        트렌딩 논문 (점수 순). paper_trending에서 상위 N개를 인덱스로 읽고,
+        비활성화되었거나 아직 계산되지 않았으면 전체 인용을 즉석에서 집계합니다.
+        """
+        rows, computed = [], False
+        if settings.PAPER_TRENDING_ENABLED:
+            rows = await trending_crud.get_trending_papers(db, limit, year, year_min)
+            # 결과가 비어도 점수가 계산된 상태면 (해당 연도에 트렌딩 논문이 없는 것) 빈 목록 그대로 반환
+            computed = bool(rows) or await trending_crud.get_score_year(db) is not None
+        if not computed:
+            rows = await TrendingService._trending_papers_live(db, year, year_min, limit)
+        papers = await PaperHydrationService.hydrate_papers(db, [paper for paper, _ in rows])
+        for paper, (_, score) in zip(papers, rows):
+            paper["trending_score"] = score
+        return papers
+
+    @staticmethod
+    async def _trending_papers_live(
+        db: AsyncSession,
+        year: Optional[int],
+        year_min: Optional[int],
+        limit: int
+    ) -> List[Tuple[Paper, float]]:
+        rows = await trending_crud.get_citation_year_counts(db)
+        if year is not None:
+            rows = [row for row in rows if row[1] == year]
+        elif year_min is not None:
+            rows = [row for row in rows if row[1] is not None and row[1] >= year_min]
+        scores = compute_trending_scores(rows, datetime.utcnow().year, settings.PAPER_TRENDING_HALF_LIFE_YEARS)
+        ranked = sorted(scores, key=lambda paper_id: (-scores[paper_id]["Score"], -paper_id))[:limit]
+        papers = await paper_crud.get_papers_by_ids(db, ranked)
+        return [(papers[paper_id], scores[paper_id]["Score"]) for paper_id in ranked if paper_id in papers]
+
+
+class PaperTrendingRefresher:
+    """
+    paper_trending 주기 갱신 작업. 테이블이 비어 있거나 해가 바뀌었으면 전체 계산을, 이후에는 ORM 세션으로 커밋된
+    Citation 변경(피인용 논문)과 Paper.PublicationYear 변경에 영향을 받는 논문만 다시 계산합니다.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession], half_life_years: float, interval_seconds: float):
+        self.session_factory = session_factory
+        self.half_life_years = half_life_years
+        self._changes = PendingChanges("papers", "year_changed")
+        self._task = PeriodicTask("paper_trending refresh", self.run_once, interval_seconds)
+        self._collector = SessionChangeCollector("paper_trending_changes", self._collect_changes, self._changes.update)
+        self._collector.register()
+
+    @staticmethod
+    def _collect_changes(session: Session) -> List[Tuple[str, int]]:
+        changes = []
+        for obj in list(session.new) + list(session.deleted):
+            if isinstance(obj, Citation):
+                changes.append(("papers", obj.CitedPaperId))
+        for obj in session.dirty:
+            if isinstance(obj, Paper) and inspect(obj).attrs.PublicationYear.history.has_changes():
+                changes.append(("year_changed", obj.PaperId))
+        return changes
+
+    async def run_once(self) -> int:
+        score_year = datetime.utcnow().year
+        async with self.session_factory() as db:
+            if await trending_crud.get_score_year(db) != score_year:
+                self._changes.clear()
+                return await TrendingService.rebuild(db, score_year, self.half_life_years)
+            if not self._changes:
+                return 0
+            pending = self._changes.snapshot()
+            refreshed = await TrendingService.refresh(
+                db, pending["papers"], pending["year_changed"], score_year, self.half_life_years
+            )
+            self._changes.acknowledge(pending)
+            logger.info(f"paper_trending refreshed for {refreshed} papers")
+            return refreshed
+
+    def start(self) -> None:
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
+
+
+_refresher: Optional[PaperTrendingRefresher] = None
+
+
+def get_paper_trending_refresher(session_factory: Callable[[], AsyncSession] = None) -> Optional[PaperTrendingRefresher]:
+    """주기적 갱신 작업 싱글톤 (비활성화 시 None)"""
+    global _refresher
+    if not settings.PAPER_TRENDING_ENABLED:
+        return None
+    if _refresher is None and session_factory is not None:
+        _refresher = PaperTrendingRefresher(
+            session_factory,
+            settings.PAPER_TRENDING_HALF_LIFE_YEARS,
+            settings.PAPER_TRENDING_REFRESH_SECONDS
+        )
+    return _refresher
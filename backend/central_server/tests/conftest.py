@@ -0,0 +1,15 @@
+# tests/conftest.py
+import os
+import sys
+from pathlib import Path
+
+# core.config의 필수 설정을 테스트용 값으로 채움 (실제 .env/환경변수가 있으면 그대로 사용)
+for name, value in {
+    "OPENAI_API_KEY": "test", "SECRET_KEY": "test", "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30", "REFRESH_TOKEN_EXPIRE_MINUTES": "60",
+    "DATABASE_URL": "sqlite+aiosqlite:///:memory:", "REDIS_URL": "redis://localhost:6379",
+    "SMTP_SERVER": "localhost", "SMTP_PORT": "25", "SMTP_USER": "test", "SMTP_PASSWORD": "test",
+}.items():
+    os.environ.setdefault(name, value)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,49 @@
+# tests/test_hydration_query_count.py
+import asyncio
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from core.database import Base
+from models import Author, Citation, Paper, PaperAuthor
+from services.paper_service import PaperService
+
+
+async def _seed(db: AsyncSession, paper_count: int) -> None:
+    db.add_all([Author(AuthorId=i, Name=f"Author {i}") for i in range(1, 4)])
+    db.add_all([Paper(PaperId=i, Title=f"Paper {i}", PublicationYear=2000 + i % 20) for i in range(1, paper_count + 1)])
+    await db.flush()
+    db.add_all([PaperAuthor(PaperId=i, AuthorId=i % 3 + 1) for i in range(1, paper_count + 1)])
+    db.add_all([Citation(CitingPaperId=i, CitedPaperId=1) for i in range(2, paper_count + 1)])
+    await db.commit()
+
+
+async def _hydrate_and_count(paper_count: int):
+    """논문 paper_count개를 일괄 조회한 뒤, 저자/피인용 수 부착 과정에서 실행된 SQL 문 수를 반환"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, parameters, context, executemany: statements.append(statement))
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            await _seed(db, paper_count)
+            papers = list((await db.execute(select(Paper).order_by(Paper.PaperId))).scalars())
+            statements.clear()
+            hydrated = await PaperService.get_papers_with_authors_batch(db, papers)
+        return hydrated, list(statements)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.parametrize("paper_count", [1, 5, 50])
+def test_batched_hydration_uses_constant_query_count(paper_count):
+    hydrated, statements = asyncio.run(_hydrate_and_count(paper_count))
+
+    # 저자 조회 1회 + 피인용 수 조회 1회 (논문 수와 무관)
+    assert len(statements) == 2, statements
+    assert len(hydrated) == paper_count
+    assert hydrated[0]["CitationCount"] == paper_count - 1
+    assert hydrated[0]["authors"] == ["Author 2"]
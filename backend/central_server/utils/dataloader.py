@@ -0,0 +1,98 @@
+# utils/dataloader.py
+import asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """
+    요청 단위 배치/중복 제거 로더 (DataLoader 패턴).
+    같은 이벤트 루프 tick 안에서 호출된 load()들을 모아 batch_fn 한 번(IN 쿼리)으로 조회하고,
+    결과(없는 키는 None 포함)를 요청이 끝날 때까지 메모이즈합니다. 실패한 키는 캐시하지 않아 다음 load에서 재시도합니다.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        key_fn: Optional[Callable[[Any], K]] = None,
+        lock: Optional[asyncio.Lock] = None
+    ):
+        self._batch_fn = batch_fn
+        self._key_fn = key_fn or (lambda key: key)
+        self._lock = lock or asyncio.Lock()  # 같은 세션을 쓰는 로더끼리 공유 (AsyncSession은 동시 쿼리 불가)
+        self._cache: Dict[K, asyncio.Future] = {}
+        self._pending: List[K] = []
+
+    def load(self, key: Any) -> "asyncio.Future[Optional[V]]":
+        """키 하나를 조회 예약. 현재 tick이 끝나면 대기 중인 키 전체가 한 번에 조회됨"""
+        key = self._key_fn(key)
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._cache[key] = future
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            self._pending.append(key)
+        return future
+
+    async def load_many(self, keys: Iterable[Any]) -> List[Optional[V]]:
+        """여러 키를 입력 순서대로 조회 (한 번의 배치로 처리)"""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: Any, value: V) -> None:
+        """다른 쿼리로 이미 가져온 값을 캐시에 등록 (이미 있으면 유지)"""
+        key = self._key_fn(key)
+        if key not in self._cache:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._cache[key] = future
+
+    def clear(self, key: Any) -> None:
+        """값이 바뀐 키를 캐시에서 제거"""
+        self._cache.pop(self._key_fn(key), None)
+
+    def _dispatch(self) -> None:
+        keys, self._pending = self._pending, []
+        asyncio.ensure_future(self._run(keys))
+
+    async def _run(self, keys: List[K]) -> None:
+        try:
+            async with self._lock:
+                values = await self._batch_fn(keys)
+        except Exception as e:
+            for key in keys:
+                future = self._cache.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+        for key in keys:
+            future = self._cache.get(key)
+            if future is not None and not future.done():
+                future.set_result(values.get(key))
+
+
+class RequestLoaders:
+    """요청(세션) 하나에 묶인 엔티티별 로더 모음"""
+
+    def __init__(self, db: AsyncSession):
+        from crud import author as author_crud, paper as paper_crud  # crud → models → core 순환 import 방지
+
+        lock = asyncio.Lock()
+        self.papers: DataLoader[int, Any] = DataLoader(
+            lambda ids: paper_crud.get_papers_by_ids(db, ids), key_fn=int, lock=lock
+        )
+        self.authors: DataLoader[int, Any] = DataLoader(
+            lambda ids: author_crud.get_authors_by_ids(db, ids), key_fn=int, lock=lock
+        )
+
+
+def get_loaders(db: AsyncSession) -> RequestLoaders:
+    """세션에 연결된 요청 단위 로더 반환 (get_db 밖에서 만든 세션이면 처음 호출 시 생성)"""
+    loaders = db.info.get("loaders")
+    if loaders is None:
+        loaders = db.info["loaders"] = RequestLoaders(db)
+    return loaders
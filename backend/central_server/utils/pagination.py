@@ -1,6 +1,14 @@
 # utils/pagination.py
-from typing import TypeVar, Generic, List
+import base64
+import hashlib
+import json
+from typing import Any, Dict, TypeVar, Generic, List, Optional, Sequence, Tuple
 from pydantic import BaseModel
+from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ClauseElement, ColumnElement
+from sqlalchemy.sql.expression import Executable
 
 
 T = TypeVar('T')
@@ -43,4 +51,116 @@ class PaginatedResponse(BaseModel, Generic[T]):
             page=page,
             page_size=page_size,
             total_pages=(total + page_size - 1) // page_size
-        )
\ No newline at end of file
+        )
+
+class CursorPage(BaseModel, Generic[T]):
+    """
+    키셋(cursor) 페이지네이션 응답.
+    next_cursor를 다음 요청의 cursor로 넘기면 이어지는 페이지를 받습니다 (None이면 마지막 페이지).
+    total은 첫 페이지(cursor 없음)에서만 계산하며, 결과가 많으면 실행 계획 추정치(total_is_estimate=True)입니다.
+    """
+    items: List[T]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+
+
+SortKeys = Sequence[Tuple[ColumnElement, bool]]  # (정렬 식, 내림차순 여부), 마지막 키는 고유해야 함 (PaperId 등)
+
+
+def encode_cursor(values: Sequence[Any], scope: str) -> str:
+    """마지막 행의 정렬 키 값을 불투명한 cursor 문자열로 인코딩 (scope: 같은 목록/조건에서만 유효)"""
+    payload = json.dumps({"s": _scope_hash(scope), "k": list(values)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, scope: str, key_count: int) -> List[Any]:
+    """cursor 문자열을 정렬 키 값으로 복원. 형식이 잘못됐거나 다른 목록의 cursor면 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = payload["k"]
+        valid = payload["s"] == _scope_hash(scope) and isinstance(values, list) and len(values) == key_count
+    except (ValueError, KeyError, TypeError, UnicodeError):
+        valid = False
+    if not valid:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def _scope_hash(scope: str) -> str:
+    return hashlib.sha1(scope.encode("utf-8")).hexdigest()[:12]
+
+
+def keyset_condition(sort_keys: SortKeys, values: Sequence[Any]):
+    """정렬 순서상 values 다음에 오는 행 조건 (방향이 섞인 키도 지원하도록 OR 전개)"""
+    clauses = []
+    for i, (expr, descending) in enumerate(sort_keys):
+        after = expr < values[i] if descending else expr > values[i]
+        clauses.append(and_(*[sort_keys[j][0] == values[j] for j in range(i)], after))
+    return or_(*clauses)
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def count_results(db: AsyncSession, statement: Select, exact_threshold: int) -> Tuple[int, bool]:
+    """
+    결과 수 (개수, 추정치 여부). PostgreSQL은 실행 계획의 예상 행 수가 exact_threshold 이상이면 그 추정치를 쓰고,
+    그보다 작을 때만 COUNT(*)를 실행합니다. 다른 DB는 항상 COUNT(*)입니다.
+    """
+    statement = statement.order_by(None)
+    if db.bind.dialect.name == "postgresql":
+        plan = (await db.execute(_Explain(statement))).scalar_one()
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+        if estimate >= exact_threshold:
+            return estimate, True
+    total = (await db.execute(select(func.count()).select_from(statement.subquery()))).scalar_one()
+    return total, False
+
+
+async def paginate_keyset(
+    db: AsyncSession,
+    statement: Select,
+    sort_keys: SortKeys,
+    cursor: Optional[str],
+    limit: int,
+    scope: str,
+    exact_count_threshold: int = 10000
+) -> Dict[str, Any]:
+    """
+    statement(첫 컬럼이 엔티티인 SELECT)를 sort_keys 순서로 키셋 페이지네이션.
+    OFFSET 없이 "마지막 행 다음" 조건으로 조회하므로 깊은 페이지도 비용이 같고, 중간 삽입에도 결과가 밀리지 않습니다.
+    CursorPage 필드 형태의 dict를 반환하며 items는 엔티티 목록입니다 (응답 변환은 호출 측에서).
+    """
+    total, total_is_estimate = None, False
+    if cursor is None:
+        total, total_is_estimate = await count_results(db, statement, exact_count_threshold)
+    else:
+        statement = statement.where(keyset_condition(sort_keys, decode_cursor(cursor, scope, len(sort_keys))))
+
+    statement = statement.add_columns(*[expr.label(f"_cursor_key_{i}") for i, (expr, _) in enumerate(sort_keys)])
+    statement = statement.order_by(None).order_by(*[expr.desc() if descending else expr for expr, descending in sort_keys])
+    rows = (await db.execute(statement.limit(limit + 1))).all()  # 한 행 더 조회해 다음 페이지 여부 판단
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(list(rows[-1][-len(sort_keys):]), scope) if has_more and rows else None
+    return {
+        "items": [row[0] for row in rows],
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+    }
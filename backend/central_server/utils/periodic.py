@@ -0,0 +1,42 @@
+# utils/periodic.py
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """
+    lifespan에서 시작/종료하는 주기 실행 백그라운드 작업.
+    한 번의 실행이 실패해도 로그만 남기고 다음 주기에 다시 실행합니다.
+    """
+
+    def __init__(self, name: str, run_once: Callable[[], Awaitable], interval_seconds: float):
+        self.name = name
+        self.run_once = run_once
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"{self.name} failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_forever(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,77 @@
+# utils/session_changes.py
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class SessionChangeCollector:
+    """
+    ORM 세션의 변경을 트랜잭션 단위로 모았다가 커밋된 것만 전달하는 공통 이벤트 훅.
+    flush마다 collect(session)가 반환한 항목을 session.info[key]에 순서대로 쌓고,
+    커밋되면 on_commit(항목 목록)을 호출하며, 롤백되면 버립니다.
+    ORM을 거치지 않는 일괄 INSERT/UPDATE/DELETE 문은 추적되지 않습니다.
+    """
+
+    def __init__(self, key: str, collect: Callable[[Session], Iterable[Any]], on_commit: Callable[[List[Any]], None]):
+        self.key = key
+        self.collect = collect
+        self.on_commit = on_commit
+        self._registered = False
+
+    def register(self) -> None:
+        if not self._registered:
+            event.listen(Session, "after_flush", self._after_flush)
+            event.listen(Session, "after_commit", self._after_commit)
+            event.listen(Session, "after_soft_rollback", self._after_soft_rollback)
+            self._registered = True
+
+    def unregister(self) -> None:
+        if self._registered:
+            event.remove(Session, "after_flush", self._after_flush)
+            event.remove(Session, "after_commit", self._after_commit)
+            event.remove(Session, "after_soft_rollback", self._after_soft_rollback)
+            self._registered = False
+
+    def _after_flush(self, session: Session, flush_context) -> None:
+        items = list(self.collect(session))
+        if items:
+            session.info.setdefault(self.key, []).extend(items)
+
+    def _after_commit(self, session: Session) -> None:
+        items = session.info.pop(self.key, None)
+        if items:
+            self.on_commit(items)
+
+    def _after_soft_rollback(self, session: Session, previous_transaction) -> None:
+        session.info.pop(self.key, None)
+
+
+class PendingChanges:
+    """
+    주기 갱신 작업이 처리할 변경 키를 이름별 집합으로 모아 두는 저장소.
+    snapshot()으로 이번 주기에 처리할 몫을 복사하고, 처리에 성공하면 acknowledge()로 그 몫만 제거합니다.
+    처리 중 새로 쌓인 변경은 남고, 실패하면 모두 다음 주기에 다시 처리됩니다.
+    """
+
+    def __init__(self, *names: str):
+        self._sets: Dict[str, Set[Hashable]] = {name: set() for name in names}
+
+    def update(self, items: Iterable[Tuple[str, Hashable]]) -> None:
+        """(이름, 키) 항목들을 추가 (SessionChangeCollector의 on_commit으로 사용)"""
+        for name, key in items:
+            self._sets[name].add(key)
+
+    def snapshot(self) -> Dict[str, Set[Hashable]]:
+        return {name: set(keys) for name, keys in self._sets.items()}
+
+    def acknowledge(self, snapshot: Dict[str, Set[Hashable]]) -> None:
+        for name, keys in snapshot.items():
+            self._sets[name] -= keys
+
+    def clear(self) -> None:
+        for keys in self._sets.values():
+            keys.clear()
+
+    def __bool__(self) -> bool:
+        return any(self._sets.values())
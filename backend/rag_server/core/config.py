@@ -20,6 +20,7 @@ class Settings(BaseSettings):
     EMBEDDING_MODEL_NAME: str = "allenai/specter"
     EMBEDDING_DEVICE: str = "cpu"
     NORMALIZE_EMBEDDINGS: bool = True
+    EMBEDDING_BATCH_SIZE: int = 64  # 한 번의 forward pass에 넣을 청크 수
 
     # 텍스트 분할 설정
     CHUNK_SIZE: int = 1000
@@ -29,10 +30,87 @@ class Settings(BaseSettings):
     UPLOAD_DIR: Path = Path("uploads")
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
     ALLOWED_EXTENSIONS: set[str] = {".txt", ".pdf", ".docx", ".md"}
+    MAX_BATCH_UPLOAD_FILES: int = 50
+    INGEST_PARSE_WORKERS: int = 4  # 수집 파이프라인의 동시 파싱 스레드 수
+    INGEST_QUEUE_SIZE: int = 4  # 파이프라인 단계 사이 큐에 쌓아둘 최대 배치 수 (backpressure)
+
+    # 검색/수집 실행 레인 설정 (레인별 스레드 풀 분리, 수집 임베딩은 워커 프로세스에서 실행해 torch 스레드 예산 분리)
+    EXECUTOR_LANES_ENABLED: bool = True
+    SEARCH_LANE_WORKERS: int = 8  # 동시에 처리할 검색 요청 수
+    SEARCH_TORCH_THREADS: int = 2  # 메인(검색) 프로세스의 torch intra-op 스레드 수 (INGEST_LANE_PROCESSES > 0일 때만 적용)
+    INGEST_LANE_WORKERS: int = 1  # 동시에 실행할 수집 파이프라인 수 (초과 업로드는 대기)
+    INGEST_LANE_PROCESSES: int = 1  # 수집 임베딩 워커 프로세스 수 (프로세스마다 모델 로드, 0 = 메인 프로세스에서 임베딩)
+    INGEST_TORCH_THREADS: int = 0  # 워커 프로세스별 torch 스레드 수 (0 = (CPU 코어 수 - SEARCH_TORCH_THREADS) / INGEST_LANE_PROCESSES)
+    INGEST_YIELD_MAX_MS: float = 2000.0  # 검색 부하 중 수집 임베딩 배치 하나가 양보하며 기다리는 최대 시간
+
+    # 추출 텍스트 캐시 설정 (파일 sha256 + 로더 버전 기준)
+    TEXT_CACHE_ENABLED: bool = True
+    TEXT_CACHE_DIR: Path = Path("cache/parsed_text")
+    TEXT_CACHE_MAX_BYTES: int = 512 * 1024 * 1024  # 512MB
+
+    # 근사 중복 문서 감지 설정 (MinHash LSH)
+    DEDUP_ENABLED: bool = True
+    DEDUP_ACTION: str = "link"  # link: 저장 후 기존 문서에 연결(duplicate_of), skip: 저장하지 않음
+    DEDUP_JACCARD_THRESHOLD: float = 0.8
+    DEDUP_NUM_PERM: int = 128
+    DEDUP_BANDS: int = 16  # bands x rows = num_perm, 후보 임계값 ~ (1/bands)^(1/rows)
+    DEDUP_SHINGLE_SIZE: int = 5  # 단어 단위 shingle 길이
+    DEDUP_INDEX_DIR: Path = Path("cache/minhash")
+
+    # 추출 요약 설정 (수집 시 문장 임베딩 TextRank로 문서별 요약 사전 계산)
+    SUMMARY_ENABLED: bool = True
+    SUMMARY_SENTENCES: int = 5  # 요약에 포함할 문장 수
+    SUMMARY_MAX_INPUT_SENTENCES: int = 300  # 문서당 임베딩할 최대 후보 문장 수 (초과 시 균등 표본)
+    SUMMARY_MIN_SENTENCE_CHARS: int = 40
+    SUMMARY_DAMPING: float = 0.85
 
     # 검색 설정
     DEFAULT_SEARCH_LIMIT: int = 5
     DEFAULT_SIMILARITY_THRESHOLD: float = 0.7
+    MAX_BATCH_SEARCH_QUERIES: int = 2000
+    SEARCH_FANOUT_WORKERS: int = 8  # /search/batch에서 동시에 실행할 벡터 검색 수
+    MMR_LAMBDA: float = 0.5  # 1.0 = 관련도만, 0.0 = 다양성만
+    MMR_FETCH_FACTOR: int = 4  # MMR/인접 청크 병합 시 limit 대비 과다 조회 배수
+    MAX_CONTEXT_WINDOW: int = 5  # context_window 최댓값 (결과당 앞뒤 청크 수)
+
+    # 시맨틱 쿼리 캐시 설정
+    # SPECTER 쿼리 임베딩은 서로 매우 가깝게 모여 있어 넓은 반경에서는 다른 쿼리의 결과가 반환됨.
+    # 반경은 보정된 값이 아니므로, 켜기 전에 실제 쿼리 로그에서 서로 다른 쿼리 쌍의 코사인 거리 분포를 확인하고
+    # 그보다 충분히 작게 잡은 뒤 /cache/stats의 적중 유사도 분포로 검증해야 합니다.
+    SEMANTIC_CACHE_ENABLED: bool = False
+    SEMANTIC_CACHE_RADIUS: float = 0.002  # 코사인 거리 기준 (1 - 코사인 유사도), 사실상 같은 쿼리만 적중
+    SEMANTIC_CACHE_CAPACITY: int = 2048
+    SEMANTIC_CACHE_TTL_SECONDS: float = 600.0
+
+    # 벡터 인덱스 양자화 설정 (Weaviate HNSW 내장 PQ/BQ, 압축 벡터로 탐색 후 원본 벡터로 재점수화)
+    # none: 양자화 없음, pq: 기존 컬렉션에도 적용 가능 (training_limit개 이상 적재 후 코드북 학습),
+    # bq: 컬렉션 생성 시에만 설정 가능 (기존 컬렉션은 스냅샷 후 재생성·복원 필요)
+    # 설정별 recall@k와 벡터 메모리는 scripts/bench_quantization.py로 측정한 뒤 선택
+    VECTOR_QUANTIZATION: str = "none"
+    PQ_SEGMENTS: int = 0  # 0이면 Weaviate 기본값 (벡터 차원에 따라 자동)
+    PQ_CENTROIDS: int = 256
+    PQ_TRAINING_LIMIT: int = 100000
+    BQ_RESCORE_LIMIT: int = 200  # BQ 후보 중 원본 벡터로 재점수화할 개수
+    VECTOR_CACHE_MAX_OBJECTS: int = 0  # 0이면 Weaviate 기본값, 양자화 시에는 압축 벡터 캐시 크기
+
+    # 크로스 인코더 재순위화(rerank) 설정
+    # 켜면 요청에서 rerank=True를 쓰지 않더라도 시작 시 두 번째 모델을 내려받아 로드하므로 기본값은 꺼 둡니다.
+    RERANK_ENABLED: bool = False
+    RERANK_MODEL_NAME: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    RERANK_DEVICE: str = "cpu"
+    RERANK_CANDIDATES: int = 30  # 재순위화를 위해 밀집 검색에서 과다 조회할 후보 수
+    RERANK_BUDGET_MS: float = 300.0  # 요청별 재순위화 시간 예산
+    RERANK_BATCH_SIZE: int = 16
+    RERANK_MAX_LENGTH: int = 512
+    RERANK_CACHE_SIZE: int = 20000  # (쿼리 해시, 청크 ID) 점수 캐시 항목 수
+
+    # 내보내기(export) 설정
+    EXPORT_BATCH_SIZE: int = 1000  # NDJSON 라인 묶음 및 Arrow/Parquet 레코드 배치 크기
+
+    # 스냅샷/복원 설정
+    SNAPSHOT_BATCH_SIZE: int = 500
+    SNAPSHOT_CONCURRENT_REQUESTS: int = 4
+    SNAPSHOT_VERIFY_SAMPLE_SIZE: int = 200
 
     # FastAPI 설정
     API_HOST: str = "0.0.0.0"
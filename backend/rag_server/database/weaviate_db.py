@@ -1,6 +1,7 @@
 # database/weaviate_db.py
+import dataclasses
 import weaviate
-from weaviate.classes.config import Configure, Property, DataType
+from weaviate.classes.config import Configure, Reconfigure, Property, DataType
 from typing import Optional
 import logging
 from core.config import settings
@@ -14,6 +15,7 @@ class WeaviateManager:
     def __init__(self):
         self.client: Optional[weaviate.WeaviateClient] = None
         self.collection_name = "ResearchPapers"
+        self.summary_collection_name = "DocumentSummaries"  # 문서(DOI)당 하나의 추출 요약
 
     def connect(self) -> weaviate.WeaviateClient:
         # Weaviate 클라이언트에 연결
@@ -50,16 +52,108 @@ class WeaviateManager:
                         Property(name="published", data_type=DataType.DATE),
                         Property(name="doi", data_type=DataType.TEXT),
                         Property(name="chunk_index", data_type=DataType.NUMBER),
-                    ]
+                        Property(name="duplicate_of", data_type=DataType.TEXT),  # 근사 중복으로 연결된 원본 문서 DOI
+                    ],
+                    vector_index_config=Configure.VectorIndex.hnsw(
+                        quantizer=self._quantizer_config(),
+                        vector_cache_max_objects=settings.VECTOR_CACHE_MAX_OBJECTS or None
+                    )
                 )
                 logger.info(f"Collection '{self.collection_name}' created successfully.")
             else:
                 logger.info(f"Collection '{self.collection_name}' already exists.")
+                self._add_missing_properties()
+                self._ensure_quantization()
+            self._ensure_summary_collection()
 
         except Exception as e:
             logger.error(f"Collection initialization failed: {str(e)}")
             raise
 
+    @staticmethod
+    def _quantizer_config():
+        """VECTOR_QUANTIZATION 설정에 맞는 HNSW 양자화 설정 (none이면 None)"""
+        mode = settings.VECTOR_QUANTIZATION
+        if mode == "none":
+            return None
+        if mode == "pq":
+            return Configure.VectorIndex.Quantizer.pq(
+                segments=settings.PQ_SEGMENTS or None,
+                centroids=settings.PQ_CENTROIDS,
+                training_limit=settings.PQ_TRAINING_LIMIT
+            )
+        if mode == "bq":
+            return Configure.VectorIndex.Quantizer.bq(rescore_limit=settings.BQ_RESCORE_LIMIT)
+        raise ValueError(f"Unsupported vector quantization: {mode}. Allowed: none, pq, bq")
+
+    @staticmethod
+    def _quantization_mode(vector_index_config) -> str:
+        quantizer = getattr(vector_index_config, "quantizer", None)
+        if quantizer is None:
+            return "none"
+        return "bq" if hasattr(quantizer, "rescore_limit") else "pq"
+
+    def _ensure_quantization(self) -> None:
+        """기존 컬렉션에 양자화 설정을 반영 (PQ는 활성화 가능, BQ는 생성 시에만 가능하므로 경고만)"""
+        mode = settings.VECTOR_QUANTIZATION
+        collection = self.client.collections.get(self.collection_name)
+        current_mode = self._quantization_mode(collection.config.get().vector_index_config)
+        if current_mode == mode:
+            return
+        if mode == "pq" and current_mode == "none":
+            collection.config.update(vector_index_config=Reconfigure.VectorIndex.hnsw(
+                quantizer=Reconfigure.VectorIndex.Quantizer.pq(
+                    segments=settings.PQ_SEGMENTS or None,
+                    centroids=settings.PQ_CENTROIDS,
+                    training_limit=settings.PQ_TRAINING_LIMIT
+                )
+            ))
+            logger.info(f"Enabled PQ compression on collection '{self.collection_name}'.")
+            return
+        logger.warning(
+            f"Collection '{self.collection_name}' uses '{current_mode}' quantization but VECTOR_QUANTIZATION='{mode}'. "
+            "Changing it requires re-creating the collection (snapshot, delete, restore)."
+        )
+
+    def vector_index_stats(self) -> dict:
+        """컬렉션 벡터 인덱스의 양자화 설정"""
+        config = self.get_collection().config.get().vector_index_config
+        quantizer = getattr(config, "quantizer", None)
+        return {
+            "index_type": type(config).__name__,
+            "quantization": self._quantization_mode(config),
+            "quantizer": dataclasses.asdict(quantizer) if quantizer is not None else None,
+            "vector_cache_max_objects": getattr(config, "vector_cache_max_objects", None),
+        }
+
+    def _ensure_summary_collection(self) -> None:
+        """문서 요약 컬렉션이 없으면 생성 (벡터 없이 DOI 기준 UUID로 저장)"""
+        if self.client.collections.exists(self.summary_collection_name):
+            return
+        self.client.collections.create(
+            name=self.summary_collection_name,
+            vectorizer_config=Configure.Vectorizer.none(),
+            properties=[
+                Property(name="doi", data_type=DataType.TEXT),
+                Property(name="title", data_type=DataType.TEXT),
+                Property(name="authors", data_type=DataType.TEXT),
+                Property(name="published", data_type=DataType.DATE),
+                Property(name="summary", data_type=DataType.TEXT),
+                Property(name="sentences", data_type=DataType.TEXT_ARRAY),
+                Property(name="sentence_indexes", data_type=DataType.INT_ARRAY),
+                Property(name="total_sentences", data_type=DataType.INT),
+            ]
+        )
+        logger.info(f"Collection '{self.summary_collection_name}' created successfully.")
+
+    def _add_missing_properties(self) -> None:
+        """이전 버전에서 생성된 컬렉션에 이후 추가된 속성을 보충 (기존 객체는 값 없음)"""
+        collection = self.client.collections.get(self.collection_name)
+        existing = {prop.name for prop in collection.config.get().properties}
+        if "duplicate_of" not in existing:
+            collection.config.add_property(Property(name="duplicate_of", data_type=DataType.TEXT))
+            logger.info(f"Added 'duplicate_of' property to collection '{self.collection_name}'.")
+
     def get_collection(self):
         # 컬렉션 객체 반환
         if not self.client or not self.client.is_connected():
@@ -80,6 +174,13 @@ class WeaviateManager:
 
         return self.client.collections.get(self.collection_name)
 
+    def get_summary_collection(self):
+        # 문서 요약 컬렉션 객체 반환
+        self.get_collection()  # 연결 확인 및 본 컬렉션 자동 생성
+        if not self.client.collections.exists(self.summary_collection_name):
+            self._ensure_summary_collection()
+        return self.client.collections.get(self.summary_collection_name)
+
     def close(self) -> None:
         # 클라이언트 연결 종료
         if self.client and self.client.is_connected():
@@ -1,17 +1,26 @@
 # main.py
-from fastapi import FastAPI, UploadFile, File, HTTPException, Depends
+from fastapi import FastAPI, UploadFile, File, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from datetime import datetime, timezone
 import logging
-from typing import List
+from typing import List, Optional
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from core.config import settings
-from models.schemas import UploadResponse, SimilarityResult, SearchRequest, TitleSearchRequest, AuthorSearchRequest
+from models.schemas import UploadResponse, SimilarityResult, DocumentSummary, SearchRequest, BatchSearchRequest, BatchSearchResponse, TitleSearchRequest, AuthorSearchRequest, BatchUploadResponse, BatchUploadFileResult
 from database.weaviate_db import db_manager_instance as db_manager, get_db_manager, WeaviateManager
 from utils.file_handler import FileHandler, get_file_handler
 from service.document_service import DocumentService, get_document_service
+from service.ingest_pipeline import get_last_pipeline_metrics
+from utils.exporter import EXPORT_FORMATS, export_collection
+from repository.document_repository import DocumentRepository, get_repository
+from utils.semantic_cache import SemanticCache, get_semantic_cache
+from utils.reranker import CrossEncoderReranker, get_reranker
+from utils.minhash import MinHashLSH, get_dedup_index
+from utils.executors import ExecutorLanes, get_executor_lanes, run_search, run_ingest
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -24,6 +33,8 @@ async def lifespan(app: FastAPI):
         logger.info("Application startup: Connecting to Weaviate...")
         db_manager.connect()
         db_manager.ensure_collection_exists()
+        if (reranker := get_reranker()) is not None:
+            reranker.load()  # 첫 검색 요청이 모델 로드 시간을 부담하지 않도록 시작 시 로드 (실패해도 서버는 시작)
         logger.info("Application startup successful. Weaviate connected.")
         yield
     except Exception as e:
@@ -33,6 +44,8 @@ async def lifespan(app: FastAPI):
         #  yield
     finally:
         logger.info("Application shutdown: Closing Weaviate connection...")
+        if (lanes := get_executor_lanes()) is not None:
+            lanes.shutdown()
         db_manager.close()
         logger.info("Application shutdown complete.")
 
@@ -67,7 +80,8 @@ async def health_check(db: WeaviateManager = Depends(get_db_manager)):
 async def upload_file(
     file: UploadFile = File(...),
     handler: FileHandler = Depends(get_file_handler),
-    service: DocumentService = Depends(get_document_service)
+    service: DocumentService = Depends(get_document_service),
+    lanes: Optional[ExecutorLanes] = Depends(get_executor_lanes)
 ):
     file_path: Path | None = None
     original_filename = file.filename if file else "unknown_file"
@@ -80,21 +94,25 @@ async def upload_file(
         # 2. Save Temporarily (Handler)
         file_path = await handler.save_uploaded_file(file)
 
-        # 3. Process and Store Document (Service)
-        # Assuming sync for now:
-        stored_ids = service.process_and_store_document(file_path, original_filename)
+        # 3. Process and Store Document (Service, 수집 레인에서 실행)
+        result = await run_ingest(lanes, service.ingest_document, file_path, original_filename)
 
         # 4. Create Response
-        response_message = f"File '{original_filename}' uploaded and processed successfully."
-        if isinstance(stored_ids, list):
-             response_message += f" Stored {len(stored_ids)} chunks."
+        if result.dedup_action == "skip":
+            response_message = f"File '{original_filename}' was not stored: {result.error}"
         else:
-             logger.warning("Processing did not return a list of stored IDs.")
+            response_message = f"File '{original_filename}' uploaded and processed successfully."
+            response_message += f" Stored {len(result.stored_ids)} chunks."
+            if result.duplicate_of:
+                response_message += f" Linked as a near-duplicate of '{result.duplicate_of}'."
 
         response = UploadResponse(
             filename=original_filename,
             message=response_message,
-            upload_timestamp=datetime.now(timezone.utc)
+            upload_timestamp=datetime.now(timezone.utc),
+            duplicate_of=result.duplicate_of,
+            duplicate_similarity=result.duplicate_similarity,
+            dedup_action=result.dedup_action
         )
         logger.info(f"File upload completed successfully for: {original_filename}")
         return response
@@ -121,10 +139,72 @@ async def upload_file(
                 logger.error(f"Error deleting temporary file {file_path}: {e}")
 
 
+@app.post("/upload/batch", response_model=BatchUploadResponse)
+async def upload_files_batch(
+    files: List[UploadFile] = File(...),
+    handler: FileHandler = Depends(get_file_handler),
+    service: DocumentService = Depends(get_document_service),
+    lanes: Optional[ExecutorLanes] = Depends(get_executor_lanes)
+):
+    """Uploads many files at once through the pipelined ingest (concurrent parsing, pooled embedding batches, overlapped storage)."""
+    if not files:
+        raise HTTPException(status_code=400, detail="No files provided.")
+    if len(files) > settings.MAX_BATCH_UPLOAD_FILES:
+        raise HTTPException(status_code=413, detail=f"Too many files. Max: {settings.MAX_BATCH_UPLOAD_FILES}")
+    logger.info(f"Received batch upload request for {len(files)} files.")
+
+    results: List[BatchUploadFileResult | None] = [None] * len(files)
+    saved: List[tuple[int, Path, str]] = []
+    metrics = None
+    try:
+        # 1. 파일별 검증 및 임시 저장 (실패한 파일만 제외하고 계속 진행)
+        for i, file in enumerate(files):
+            original_filename = file.filename if file and file.filename else "unknown_file"
+            try:
+                handler.validate_file(file)
+                saved.append((i, await handler.save_uploaded_file(file), original_filename))
+            except HTTPException as http_exc:
+                logger.warning(f"Batch upload: rejected '{original_filename}': {http_exc.detail}")
+                results[i] = BatchUploadFileResult(filename=original_filename, status="failed", error=str(http_exc.detail))
+
+        # 2. 문서 처리 및 저장 (Service, 블로킹 작업이므로 수집 레인에서 실행)
+        if saved:
+            processed, metrics = await run_ingest(
+                lanes, service.process_and_store_batch, [(path, name) for _, path, name in saved]
+            )
+            for (i, _, _), result in zip(saved, processed):
+                results[i] = BatchUploadFileResult(**result)
+
+        succeeded = sum(1 for r in results if r.status == "success")
+        logger.info(f"Batch upload completed: {succeeded}/{len(files)} files stored.")
+        return BatchUploadResponse(
+            total_files=len(files),
+            succeeded=succeeded,
+            failed=len(files) - succeeded,
+            results=results,
+            pipeline_metrics=metrics,
+            upload_timestamp=datetime.now(timezone.utc)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error during batch upload orchestration: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Unexpected internal server error during batch upload.")
+    finally:
+        # 3. 임시 파일 정리
+        for _, file_path, _ in saved:
+            if file_path.exists():
+                try:
+                    file_path.unlink()
+                except OSError as e:
+                    logger.error(f"Error deleting temporary file {file_path}: {e}")
+
+
 @app.post("/search", response_model=List[SimilarityResult])
 async def search_documents(
     request: SearchRequest,
-    service: DocumentService = Depends(get_document_service)
+    service: DocumentService = Depends(get_document_service),
+    lanes: Optional[ExecutorLanes] = Depends(get_executor_lanes)
 ):
     """Performs text-based similarity search using the DocumentService."""
     if not request.query_text:
@@ -132,10 +212,20 @@ async def search_documents(
 
     logger.info(f"Received text search request: '{request.query_text[:50]}...'")
     try:
-        results = service.search_by_text(
+        results = await run_search(
+            lanes, service.search_by_text,
             query_text=request.query_text,
             limit=request.limit,
-            similarity_threshold=request.similarity_threshold
+            similarity_threshold=request.similarity_threshold,
+            filters=request.filters,
+            rerank=request.rerank,
+            rerank_candidates=request.rerank_candidates,
+            rerank_budget_ms=request.rerank_budget_ms,
+            mmr=request.mmr,
+            mmr_lambda=request.mmr_lambda,
+            merge_adjacent=request.merge_adjacent,
+            context_window=request.context_window,
+            summaries=request.summaries
         )
         logger.info(f"Text search completed: {len(results)} results found.")
         return results
@@ -148,6 +238,37 @@ async def search_documents(
         logger.error(f"Unexpected error during text search: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="Internal error during search processing.")
 
+@app.post("/search/batch", response_model=BatchSearchResponse)
+async def search_documents_batch(
+    request: BatchSearchRequest,
+    service: DocumentService = Depends(get_document_service),
+    lanes: Optional[ExecutorLanes] = Depends(get_executor_lanes)
+):
+    """Embeds all queries in one batched forward pass and runs the vector searches concurrently."""
+    if len(request.queries) > settings.MAX_BATCH_SEARCH_QUERIES:
+        raise HTTPException(status_code=400, detail=f"Too many queries. Maximum is {settings.MAX_BATCH_SEARCH_QUERIES}.")
+
+    logger.info(f"Received batch search request with {len(request.queries)} queries.")
+    started = datetime.now(timezone.utc)
+    try:
+        items, embed_ms = await run_search(lanes, service.search_batch, request.queries)
+    except HTTPException:
+        raise
+    except ValueError as ve:
+        logger.warning(f"Invalid batch search request: {ve}")
+        raise HTTPException(status_code=400, detail=str(ve))
+    except Exception as e:
+        logger.error(f"Unexpected error during batch search: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal error during batch search processing.")
+
+    return BatchSearchResponse(
+        total_queries=len(items),
+        failed=sum(item["error"] is not None for item in items),
+        embed_ms=round(embed_ms, 2),
+        total_ms=round((datetime.now(timezone.utc) - started).total_seconds() * 1000, 2),
+        results=items
+    )
+
 @app.post("/search/title", response_model=List[SimilarityResult])
 async def search_by_title(
     request: TitleSearchRequest,
@@ -192,6 +313,21 @@ async def search_by_author(
         logger.error(f"Unexpected error during author search: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="Internal error during author search.")
 
+@app.get("/documents/{doi:path}/summary", response_model=DocumentSummary)
+async def get_document_summary(
+    doi: str,
+    service: DocumentService = Depends(get_document_service)
+):
+    """Returns the extractive summary precomputed for the document at ingest time."""
+    logger.info(f"Received summary request for document: '{doi}'")
+    try:
+        return await run_in_threadpool(service.get_document_summary, doi)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error fetching summary for '{doi}': {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal error fetching document summary.")
+
 @app.get("/stats")
 async def get_stats(db: WeaviateManager = Depends(get_db_manager)):
     """Retrieves basic statistics about the document collection."""
@@ -211,6 +347,78 @@ async def get_stats(db: WeaviateManager = Depends(get_db_manager)):
         logger.error(f"Failed to get stats: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="Error retrieving system statistics.")
 
+@app.get("/ingest/metrics")
+async def get_ingest_metrics():
+    """Per-stage utilization and queue depth of the most recent ingest pipeline run."""
+    metrics = get_last_pipeline_metrics()
+    if metrics is None:
+        return {"message": "No ingest pipeline run yet."}
+    return metrics
+
+@app.get("/cache/stats")
+async def get_cache_stats(cache: Optional[SemanticCache] = Depends(get_semantic_cache)):
+    """Reports semantic query cache hit rate and the similarity distribution of hits."""
+    if cache is None:
+        return {"enabled": False}
+    return cache.stats()
+
+@app.get("/rerank/stats")
+async def get_rerank_stats(reranker: Optional[CrossEncoderReranker] = Depends(get_reranker)):
+    """Reports rerank score cache usage and how often the per-request budget ran out."""
+    if reranker is None:
+        return {"enabled": False}
+    return reranker.stats()
+
+@app.get("/index/stats")
+async def get_vector_index_stats(db: WeaviateManager = Depends(get_db_manager)):
+    """Reports the collection's vector index quantization (PQ/BQ) settings."""
+    try:
+        return db.vector_index_stats()
+    except Exception as e:
+        logger.error(f"Error getting vector index stats: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to get vector index stats")
+
+@app.get("/dedup/stats")
+async def get_dedup_stats(index: Optional[MinHashLSH] = Depends(get_dedup_index)):
+    """Reports the size and bucket distribution of the near-duplicate (MinHash LSH) index."""
+    if index is None:
+        return {"enabled": False}
+    return index.stats()
+
+@app.get("/lanes/stats")
+async def get_lane_stats(lanes: Optional[ExecutorLanes] = Depends(get_executor_lanes)):
+    """Reports search/ingest executor lane budgets, queue lengths and how long ingest yielded to search."""
+    if lanes is None:
+        return {"enabled": False}
+    return lanes.stats()
+
+@app.get("/export")
+async def export_documents(
+    format: str = Query("ndjson", description="내보내기 포맷 (ndjson, arrow, parquet)"),
+    properties: Optional[str] = Query(None, description="쉼표로 구분한 내보낼 속성 목록 (기본값: 전체)"),
+    include_vector: bool = Query(False, description="임베딩 벡터 포함 여부"),
+    repository: DocumentRepository = Depends(get_repository)
+):
+    """
+    Streams the whole chunk collection with a cursor iterator (constant memory). Does not need the embedding model.
+    Document summaries (DocumentSummaries) are not part of this export; they are covered by scripts/snapshot_index.py.
+    """
+    property_list = [p.strip() for p in properties.split(",") if p.strip()] if properties else None
+    logger.info(f"Received export request: format={format}, properties={property_list or 'all'}, include_vector={include_vector}")
+    try:
+        stream = export_collection(repository, fmt=format, properties=property_list, include_vector=include_vector)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    except RuntimeError as rte:
+        logger.error(f"Runtime error preparing export: {rte}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(rte))
+    extension = {"ndjson": "ndjson", "arrow": "arrows", "parquet": "parquet"}[format]
+    return StreamingResponse(
+        stream,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{db_manager.collection_name}.{extension}"'}
+    )
+
 # main 실행 부분
 if __name__ == "__main__":
     import uvicorn
@@ -1,7 +1,7 @@
 # models/schemas.py
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Dict, Any, Literal
 from dataclasses import dataclass
 from core.config import settings
 
@@ -16,12 +16,39 @@ class SimilarityResult(BaseModel):
     distance: float = Field(..., description="쿼리 벡터와의 거리")
     chunk_index: Optional[int] = Field(None, description="문서 내 청크의 순서")
     vector: Optional[List[float]] = Field(None, description="청크의 임베딩 벡터")
+    rerank_score: Optional[float] = Field(None, description="크로스 인코더 재순위화 점수 (재순위화 시에만)")
+    merged_chunk_indexes: Optional[List[int]] = Field(None, description="인접 청크 병합 시 합쳐진 청크 순서 목록")
+    context: Optional[str] = Field(None, description="앞뒤 이웃 청크까지 겹침 제거 후 이어 붙인 본문 (context_window 지정 시)")
+    context_chunk_indexes: Optional[List[int]] = Field(None, description="context에 포함된 청크 순서 목록")
+    summary: Optional[str] = Field(None, description="원본 문서의 추출 요약 (summaries 지정 시)")
 
 class UploadResponse(BaseModel):
     """파일 업로드 성공 시 반환되는 응답 모델"""
     filename: str = Field(..., description="업로드된 파일의 원본 이름")
     message: str = Field(..., description="처리 결과 상태 메시지")
     upload_timestamp: datetime = Field(..., description="업로드 시점의 타임스탬프")
+    duplicate_of: Optional[str] = Field(None, description="근사 중복으로 판정된 기존 문서의 DOI")
+    duplicate_similarity: Optional[float] = Field(None, description="기존 문서와의 추정 Jaccard 유사도")
+    dedup_action: Optional[str] = Field(None, description="근사 중복 처리 방식 (link: 저장 후 연결, skip: 저장하지 않음)")
+
+class BatchUploadFileResult(BaseModel):
+    """배치 업로드에서 파일 하나의 처리 결과"""
+    filename: str = Field(..., description="업로드된 파일의 원본 이름")
+    status: str = Field(..., description="처리 상태 (success, skipped, failed)")
+    chunks_stored: int = Field(0, description="저장된 청크 수")
+    error: Optional[str] = Field(None, description="실패 또는 건너뛴 사유")
+    duplicate_of: Optional[str] = Field(None, description="근사 중복으로 판정된 기존 문서의 DOI")
+    duplicate_similarity: Optional[float] = Field(None, description="기존 문서와의 추정 Jaccard 유사도")
+    dedup_action: Optional[str] = Field(None, description="근사 중복 처리 방식 (link 또는 skip)")
+
+class BatchUploadResponse(BaseModel):
+    """다중 파일 배치 업로드 응답 모델 (부분 성공 허용)"""
+    total_files: int = Field(..., description="요청된 파일 수")
+    succeeded: int = Field(..., description="성공적으로 저장된 파일 수")
+    failed: int = Field(..., description="실패하거나 건너뛴 파일 수")
+    results: List[BatchUploadFileResult] = Field(..., description="요청 순서대로 정렬된 파일별 결과")
+    pipeline_metrics: Optional[Dict[str, Any]] = Field(None, description="수집 파이프라인 단계별 사용률 및 큐 깊이")
+    upload_timestamp: datetime = Field(..., description="업로드 시점의 타임스탬프")
 
 @dataclass
 class ProcessedDocument:
@@ -33,11 +60,62 @@ class ProcessedDocument:
     doi: str
     embedding: List[float]
 
+class SearchFilters(BaseModel):
+    """벡터 검색 시 ANN 탐색 단계에 사전 필터(pre-filter)로 함께 적용되는 메타데이터 조건"""
+    doi_in: Optional[List[str]] = Field(None, description="포함할 문서 DOI 목록")
+    published_from: Optional[datetime] = Field(None, description="발행일 하한 (포함)")
+    published_to: Optional[datetime] = Field(None, description="발행일 상한 (포함)")
+    title_contains: Optional[str] = Field(None, description="제목에 포함되어야 하는 값")
+    author_contains: Optional[str] = Field(None, description="저자 문자열에 포함되어야 하는 값")
+    chunk_index_min: Optional[int] = Field(None, ge=0, description="청크 순서 하한 (포함)")
+    chunk_index_max: Optional[int] = Field(None, ge=0, description="청크 순서 상한 (포함)")
+
 class SearchRequest(BaseModel):
     """RAG 서버의 텍스트 검색을 위한 요청 모델"""
     query_text: Optional[str] = Field(None, description="검색할 텍스트 쿼리")
     limit: int = Field(5, description="반환받을 최대 결과 수")
     similarity_threshold: float = Field(0.7, description="유사도 점수 임계값 (0.0 ~ 1.0)")
+    filters: Optional[SearchFilters] = Field(None, description="벡터 검색에 함께 적용할 메타데이터 필터")
+    rerank: bool = Field(False, description="크로스 인코더로 후보를 재순위화할지 여부")
+    rerank_candidates: Optional[int] = Field(None, ge=1, le=200, description="재순위화할 후보 수 (기본값: RERANK_CANDIDATES)")
+    rerank_budget_ms: Optional[float] = Field(None, gt=0, description="재순위화 시간 예산(ms) (기본값: RERANK_BUDGET_MS)")
+    mmr: bool = Field(False, description="MMR로 서로 비슷한 청크를 걸러 결과를 다양화할지 여부")
+    mmr_lambda: Optional[float] = Field(None, ge=0.0, le=1.0, description="MMR 관련도 가중치 (기본값: MMR_LAMBDA)")
+    merge_adjacent: bool = Field(False, description="같은 문서의 연속된 청크 결과를 겹침 제거 후 하나로 병합할지 여부")
+    context_window: int = Field(0, ge=0, le=settings.MAX_CONTEXT_WINDOW, description="결과마다 함께 가져올 앞뒤 이웃 청크 수 (0 = 사용 안 함)")
+    summaries: Literal["none", "attach", "replace"] = Field(
+        "none", description="문서 요약 포함 방식 (attach: 결과에 summary 추가, replace: 문서당 결과 하나로 묶고 청크 본문 대신 요약 반환)")
+
+class BatchSearchRequest(BaseModel):
+    """여러 텍스트 쿼리를 한 번에 검색하기 위한 요청 모델"""
+    queries: List[SearchRequest] = Field(..., min_length=1, description="검색할 쿼리 목록 (각 쿼리는 /search와 같은 옵션 사용)")
+
+class BatchSearchResultItem(BaseModel):
+    """배치 검색에서 쿼리 하나의 결과"""
+    index: int = Field(..., description="요청 내 쿼리 위치")
+    query_text: str = Field(..., description="검색한 텍스트 쿼리")
+    results: List[SimilarityResult] = Field(default_factory=list, description="검색 결과")
+    error: Optional[str] = Field(None, description="이 쿼리가 실패한 경우의 사유")
+    timings: Dict[str, float] = Field(default_factory=dict, description="embed_ms(배치 임베딩 분담분), queue_ms, search_ms, total_ms")
+
+class BatchSearchResponse(BaseModel):
+    """배치 검색 응답 모델 (입력 순서 유지, 부분 실패 허용)"""
+    total_queries: int = Field(..., description="요청된 쿼리 수")
+    failed: int = Field(..., description="실패한 쿼리 수")
+    embed_ms: float = Field(..., description="전체 쿼리 배치 임베딩 소요 시간")
+    total_ms: float = Field(..., description="전체 처리 시간")
+    results: List[BatchSearchResultItem] = Field(..., description="입력 순서대로 정렬된 쿼리별 결과")
+
+class DocumentSummary(BaseModel):
+    """수집 시 사전 계산된 문서의 추출 요약"""
+    doi: str = Field(..., description="문서 DOI")
+    title: str = Field("", description="문서 제목")
+    authors: str = Field("", description="문서 저자")
+    published: Optional[datetime] = Field(None, description="문서 발행일")
+    summary: str = Field(..., description="중심성이 높은 문장을 원문 순서로 이어 붙인 요약")
+    sentences: List[str] = Field(default_factory=list, description="요약에 선택된 문장 목록")
+    sentence_indexes: List[int] = Field(default_factory=list, description="선택된 문장의 후보 문장 내 위치")
+    total_sentences: int = Field(0, description="요약 후보 문장 수")
 
 class TitleSearchRequest(BaseModel):
     """제목 검색 요청 모델"""
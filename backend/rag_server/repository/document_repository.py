@@ -1,14 +1,52 @@
 # repository/document_repository.py
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Iterable, Tuple
 import logging
+from datetime import datetime, timezone
+from functools import reduce
 from weaviate.classes.query import Filter, MetadataQuery
-from models.schemas import SimilarityResult
+from weaviate.util import generate_uuid5
+from models.schemas import SimilarityResult, SearchFilters
 from database.weaviate_db import WeaviateManager, get_db_manager
 from core.config import settings
 from fastapi import Depends, HTTPException
 
 logger = logging.getLogger(__name__)
 
+# 컬렉션에 저장되는 청크 속성 목록 (export/snapshot 등에서 공통으로 사용)
+DOCUMENT_PROPERTIES = ["title", "content", "authors", "published", "doi", "chunk_index", "duplicate_of"]
+# 일부 청크에만 존재하는 속성 (값이 없을 때는 스냅샷 체크섬 등에서 제외)
+OPTIONAL_PROPERTIES = {"duplicate_of"}
+# 문서 요약 컬렉션 속성 목록
+SUMMARY_PROPERTIES = ["doi", "title", "authors", "published", "summary", "sentences", "sentence_indexes", "total_sentences"]
+
+def build_filter(filters: Optional[SearchFilters]) -> Optional[Filter]:
+    """SearchFilters를 Weaviate 필터로 변환 (조건이 없으면 None). 모든 조건은 AND로 결합됩니다."""
+    if filters is None:
+        return None
+
+    def as_utc(value: datetime) -> datetime:
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+    conditions = []
+    if filters.doi_in:
+        conditions.append(Filter.by_property("doi").contains_any(filters.doi_in))
+    if filters.published_from is not None:
+        conditions.append(Filter.by_property("published").greater_or_equal(as_utc(filters.published_from)))
+    if filters.published_to is not None:
+        conditions.append(Filter.by_property("published").less_or_equal(as_utc(filters.published_to)))
+    if filters.title_contains:
+        conditions.append(Filter.by_property("title").like(f"*{filters.title_contains}*"))
+    if filters.author_contains:
+        conditions.append(Filter.by_property("authors").like(f"*{filters.author_contains}*"))
+    # chunk_index는 스키마상 NUMBER(float) 속성이므로 필터 값도 float로 전송
+    if filters.chunk_index_min is not None:
+        conditions.append(Filter.by_property("chunk_index").greater_or_equal(float(filters.chunk_index_min)))
+    if filters.chunk_index_max is not None:
+        conditions.append(Filter.by_property("chunk_index").less_or_equal(float(filters.chunk_index_max)))
+    if not conditions:
+        return None
+    return reduce(lambda left, right: left & right, conditions)
+
 class DocumentRepository:
     def __init__(self, db_manager: WeaviateManager):
         if db_manager is None:
@@ -59,13 +97,19 @@ class DocumentRepository:
             logger.error(f"Failed to store processed data for document '{doc_title}': {str(e)}", exc_info=True)
             raise RuntimeError(f"Database storage failed for {doc_title}") from e
 
-    def search_by_vector(self, query_vector: List[float], limit: int = None, distance_threshold: float = None) -> List[SimilarityResult]:
+    def search_by_vector(self, query_vector: List[float], limit: int = None, distance_threshold: float = None,
+                         filters: Optional[SearchFilters] = None) -> List[SimilarityResult]:
+        """
+        벡터 유사도 검색. filters는 Weaviate에서 HNSW 탐색 시 허용 목록(allow-list)으로 적용되는
+        사전 필터이므로 결과를 가져온 뒤 걸러내는 후처리 필터와 달리 limit 개수가 보장됩니다.
+        """
         if limit is None: limit = settings.DEFAULT_SEARCH_LIMIT
         effective_distance = distance_threshold if distance_threshold is not None else (1.0 - settings.DEFAULT_SIMILARITY_THRESHOLD)
         try:
             collection = self.db_manager.get_collection()
             response = collection.query.near_vector(
                 near_vector=query_vector, limit=limit, distance=effective_distance,
+                filters=build_filter(filters),
                 return_metadata=MetadataQuery(distance=True),
                 return_properties=["title", "content", "authors", "published", "doi", "chunk_index"],
                 include_vector=True
@@ -158,6 +202,212 @@ class DocumentRepository:
             logger.error(f"Failed to fetch all documents: {str(e)}", exc_info=True)
             raise RuntimeError("Database fetch all documents failed") from e
 
+    def iter_documents(self, properties: Optional[List[str]] = None, include_vector: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Weaviate 커서 iterator(after=uuid 페이지네이션)로 컬렉션 전체를 순회하며 객체를 하나씩 반환합니다.
+        클라이언트가 한 페이지(100개)만 메모리에 유지하므로 컬렉션 크기와 무관하게 메모리 사용량이 일정합니다.
+        """
+        return_properties = properties or DOCUMENT_PROPERTIES
+        count = 0
+        try:
+            collection = self.db_manager.get_collection()
+            for obj in collection.iterator(
+                include_vector=include_vector,
+                return_properties=return_properties
+            ):
+                record = {"uuid": str(obj.uuid)}
+                for name in return_properties:
+                    record[name] = obj.properties.get(name)
+                if include_vector:
+                    record["vector"] = obj.vector.get("default") if obj.vector else None
+                count += 1
+                yield record
+            logger.info(f"Collection iteration completed: {count} objects streamed.")
+        except Exception as e:
+            logger.error(f"Collection iteration failed after {count} objects: {str(e)}", exc_info=True)
+            raise RuntimeError("Database collection iteration failed") from e
+
+    def count_documents(self) -> int:
+        """컬렉션에 저장된 전체 객체 수 반환"""
+        try:
+            collection = self.db_manager.get_collection()
+            result = collection.aggregate.over_all(total_count=True)
+            return result.total_count if result is not None and result.total_count is not None else 0
+        except Exception as e:
+            logger.error(f"Failed to count documents: {str(e)}", exc_info=True)
+            raise RuntimeError("Database count failed") from e
+
+    def fetch_by_ids(self, object_ids: List[str], include_vector: bool = False) -> Dict[str, Dict[str, Any]]:
+        """UUID 목록에 해당하는 객체들을 한 번의 필터 쿼리로 조회하여 {uuid: record} 형태로 반환"""
+        if not object_ids:
+            return {}
+        try:
+            collection = self.db_manager.get_collection()
+            response = collection.query.fetch_objects(
+                limit=len(object_ids), filters=Filter.by_id().contains_any(object_ids),
+                return_properties=DOCUMENT_PROPERTIES,
+                include_vector=include_vector
+            )
+            records = {}
+            for obj in response.objects:
+                record = {name: obj.properties.get(name) for name in DOCUMENT_PROPERTIES}
+                if include_vector:
+                    record["vector"] = obj.vector.get("default") if obj.vector else None
+                records[str(obj.uuid)] = record
+            return records
+        except Exception as e:
+            logger.error(f"Fetch by ids failed: {str(e)}", exc_info=True)
+            raise RuntimeError("Database fetch by ids failed") from e
+
+    def fetch_chunk_ranges(self, ranges: Dict[str, List[Tuple[int, int]]]) -> Dict[str, Dict[int, str]]:
+        """
+        DOI별 chunk_index 구간 [lo, hi] 목록을 (doi = d AND lo <= chunk_index <= hi) 조건의 OR로 묶어 한 번의 쿼리로 조회.
+        {doi: {chunk_index: content}} 형태로 반환합니다.
+        """
+        conditions, total = [], 0
+        for doi, spans in ranges.items():
+            for lo, hi in spans:
+                conditions.append(
+                    Filter.by_property("doi").equal(doi)
+                    & Filter.by_property("chunk_index").greater_or_equal(float(lo))
+                    & Filter.by_property("chunk_index").less_or_equal(float(hi))
+                )
+                total += hi - lo + 1
+        if not conditions:
+            return {}
+        try:
+            collection = self.db_manager.get_collection()
+            response = collection.query.fetch_objects(
+                limit=total, filters=Filter.any_of(conditions) if len(conditions) > 1 else conditions[0],
+                return_properties=["doi", "chunk_index", "content"]
+            )
+            chunks: Dict[str, Dict[int, str]] = {}
+            for obj in response.objects:
+                if obj.properties.get("chunk_index") is None:
+                    continue
+                chunks.setdefault(obj.properties.get("doi"), {})[int(obj.properties.get("chunk_index"))] = obj.properties.get("content", "")
+            return chunks
+        except Exception as e:
+            logger.error(f"Fetch chunk ranges failed: {str(e)}", exc_info=True)
+            raise RuntimeError("Database fetch of neighbouring chunks failed") from e
+
+    def delete_by_doi(self, doi: str) -> int:
+        """DOI의 모든 청크를 삭제 (수집 실패 시 이미 저장된 청크 되돌리기용). 삭제된 객체 수 반환"""
+        try:
+            collection = self.db_manager.get_collection()
+            result = collection.data.delete_many(where=Filter.by_property("doi").equal(doi))
+            if result.failed:
+                raise RuntimeError(f"{result.failed} of {result.matches} chunks could not be deleted")
+            logger.info(f"Deleted {result.successful} chunks of '{doi}'.")
+            return result.successful
+        except Exception as e:
+            logger.error(f"Failed to delete chunks of '{doi}': {str(e)}", exc_info=True)
+            raise RuntimeError("Database delete by doi failed") from e
+
+    def store_summaries(self, summaries: List[Dict[str, Any]]) -> List[str]:
+        """문서 요약을 DOI 기반 결정적 UUID로 저장 (같은 문서를 다시 수집하면 덮어씀). 저장에 실패한 DOI 목록 반환"""
+        if not summaries:
+            return []
+        doi_by_uuid = {str(generate_uuid5(summary["doi"])): summary["doi"] for summary in summaries}
+        try:
+            collection = self.db_manager.get_summary_collection()
+            with collection.batch.fixed_size(batch_size=100) as batch:
+                for summary in summaries:
+                    batch.add_object(
+                        properties={name: summary.get(name) for name in SUMMARY_PROPERTIES},
+                        uuid=generate_uuid5(summary["doi"])
+                    )
+            failed_objects = collection.batch.failed_objects
+            failed_dois = list(dict.fromkeys(doi_by_uuid[str(error.object_.uuid)] for error in failed_objects
+                                             if str(error.object_.uuid) in doi_by_uuid))
+            if failed_objects:
+                logger.warning(f"Summary storage finished with {len(failed_objects)} failed objects (first error: {failed_objects[0].message}).")
+            logger.info(f"Stored {len(doi_by_uuid) - len(failed_dois)} document summaries.")
+            return failed_dois
+        except Exception as e:
+            logger.error(f"Failed to store document summaries: {str(e)}", exc_info=True)
+            raise RuntimeError("Database summary storage failed") from e
+
+    def get_summary(self, doi: str) -> Optional[Dict[str, Any]]:
+        """DOI의 문서 요약 조회 (UUID 직접 조회, 없으면 None)"""
+        try:
+            collection = self.db_manager.get_summary_collection()
+            obj = collection.query.fetch_object_by_id(generate_uuid5(doi), return_properties=SUMMARY_PROPERTIES)
+            return {name: obj.properties.get(name) for name in SUMMARY_PROPERTIES} if obj is not None else None
+        except Exception as e:
+            logger.error(f"Fetch summary failed for '{doi}': {str(e)}", exc_info=True)
+            raise RuntimeError("Database summary fetch failed") from e
+
+    def fetch_summaries(self, dois: List[str]) -> Dict[str, Dict[str, Any]]:
+        """DOI 목록의 문서 요약을 한 번의 ID 필터 쿼리로 조회하여 {doi: record} 형태로 반환 (요약이 없는 DOI는 제외)"""
+        dois = list(dict.fromkeys(dois))
+        if not dois:
+            return {}
+        try:
+            collection = self.db_manager.get_summary_collection()
+            response = collection.query.fetch_objects(
+                limit=len(dois), filters=Filter.by_id().contains_any([generate_uuid5(doi) for doi in dois]),
+                return_properties=SUMMARY_PROPERTIES
+            )
+            return {obj.properties.get("doi"): {name: obj.properties.get(name) for name in SUMMARY_PROPERTIES}
+                    for obj in response.objects}
+        except Exception as e:
+            logger.error(f"Fetch summaries failed: {str(e)}", exc_info=True)
+            raise RuntimeError("Database summary fetch failed") from e
+
+    def iter_summaries(self) -> Iterator[Dict[str, Any]]:
+        """요약 컬렉션 전체를 커서 iterator로 순회하며 요약 레코드를 하나씩 반환 (스냅샷용)"""
+        count = 0
+        try:
+            collection = self.db_manager.get_summary_collection()
+            for obj in collection.iterator(return_properties=SUMMARY_PROPERTIES):
+                count += 1
+                yield {name: obj.properties.get(name) for name in SUMMARY_PROPERTIES}
+            logger.info(f"Summary iteration completed: {count} objects streamed.")
+        except Exception as e:
+            logger.error(f"Summary iteration failed after {count} objects: {str(e)}", exc_info=True)
+            raise RuntimeError("Database summary iteration failed") from e
+
+    def count_summaries(self) -> int:
+        """요약 컬렉션에 저장된 전체 객체 수 반환"""
+        try:
+            collection = self.db_manager.get_summary_collection()
+            result = collection.aggregate.over_all(total_count=True)
+            return result.total_count if result is not None and result.total_count is not None else 0
+        except Exception as e:
+            logger.error(f"Failed to count summaries: {str(e)}", exc_info=True)
+            raise RuntimeError("Database summary count failed") from e
+
+    def bulk_insert(self, objects: Iterable[Dict[str, Any]], batch_size: int = None,
+                    concurrent_requests: int = None) -> Tuple[int, int]:
+        """
+        {"uuid", "properties", "vector"} 형태의 객체 스트림을 고정 크기 배치 + 동시 요청으로 대량 적재합니다.
+        (적재 시도 수, 실패 수)를 반환합니다.
+        """
+        if batch_size is None: batch_size = settings.SNAPSHOT_BATCH_SIZE
+        if concurrent_requests is None: concurrent_requests = settings.SNAPSHOT_CONCURRENT_REQUESTS
+        added = 0
+        try:
+            collection = self.db_manager.get_collection()
+            with collection.batch.fixed_size(batch_size=batch_size, concurrent_requests=concurrent_requests) as batch:
+                for obj in objects:
+                    batch.add_object(
+                        properties=obj["properties"],
+                        vector=obj.get("vector"),
+                        uuid=obj.get("uuid")
+                    )
+                    added += 1
+                    if added % (batch_size * 20) == 0:
+                        logger.info(f"Bulk insert progress: {added} objects queued.")
+            failed = len(collection.batch.failed_objects)
+            if failed:
+                logger.warning(f"Bulk insert finished with {failed} failed objects (first error: {collection.batch.failed_objects[0].message}).")
+            logger.info(f"Bulk insert completed: {added} objects queued, {failed} failed.")
+            return added, failed
+        except Exception as e:
+            logger.error(f"Bulk insert failed after {added} objects: {str(e)}", exc_info=True)
+            raise RuntimeError("Database bulk insert failed") from e
+
 
 # --- 팩토리 함수 ---
 def get_repository(
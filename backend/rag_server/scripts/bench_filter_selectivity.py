@@ -0,0 +1,152 @@
+# scripts/bench_filter_selectivity.py
+"""
+메타데이터 필터 선택도(selectivity)에 따른 벡터 검색 지연 시간 벤치마크.
+같은 쿼리 벡터에 대해 (1) 필터 없음, (2) Weaviate 사전 필터(pushdown),
+(3) 과다 조회 후 클라이언트에서 거르는 사후 필터를 비교하여 p50/p95와 사후 필터의 결과 손실을 보고합니다.
+
+쿼리 벡터는 컬렉션에 저장된 청크 벡터에서 무작위로 추출하므로 임베딩 모델이 필요 없습니다.
+
+사용 예 (rag_server 디렉토리에서 실행):
+    python -m scripts.bench_filter_selectivity --queries 50 --limit 10 --selectivities 0.01 0.05 0.1 0.25 0.5
+"""
+import argparse
+import json
+import logging
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from database.weaviate_db import WeaviateManager
+from models.schemas import SearchFilters
+from repository.document_repository import DocumentRepository
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+NO_DISTANCE_LIMIT = 2.0  # 코사인 거리 최댓값: 임계값에 의한 결과 누락 없이 비교
+
+
+def sample_collection(repository: DocumentRepository, num_queries: int, rng: random.Random) -> Tuple[Counter, List[List[float]]]:
+    """한 번의 전체 순회로 DOI별 청크 수를 세고, 쿼리 벡터를 저수지 표본 추출"""
+    doi_counts: Counter = Counter()
+    queries: List[List[float]] = []
+    for seen, record in enumerate(repository.iter_documents(properties=["doi"], include_vector=True)):
+        doi_counts[record.get("doi")] += 1
+        vector = record.get("vector")
+        if vector is None:
+            continue
+        if len(queries) < num_queries:
+            queries.append(vector)
+        else:
+            slot = rng.randint(0, seen)
+            if slot < num_queries:
+                queries[slot] = vector
+    return doi_counts, queries
+
+
+def pick_dois(doi_counts: Counter, target: float, rng: random.Random) -> Tuple[List[str], float]:
+    """청크 비율이 target 이상이 될 때까지 DOI를 무작위로 선택, (DOI 목록, 실제 선택도) 반환"""
+    total = sum(doi_counts.values())
+    dois = [doi for doi in doi_counts if doi]
+    rng.shuffle(dois)
+    selected, covered = [], 0
+    for doi in dois:
+        if covered / total >= target:
+            break
+        selected.append(doi)
+        covered += doi_counts[doi]
+    return selected, covered / total
+
+
+def percentiles(samples_ms: List[float]) -> Dict[str, float]:
+    array = np.asarray(samples_ms, dtype=np.float64)
+    return {
+        "p50_ms": round(float(np.percentile(array, 50)), 2),
+        "p95_ms": round(float(np.percentile(array, 95)), 2),
+        "mean_ms": round(float(array.mean()), 2),
+    }
+
+
+def run_selectivity(repository: DocumentRepository, queries: List[List[float]], dois: List[str],
+                    limit: int, selectivity: float) -> Dict:
+    filters = SearchFilters(doi_in=dois)
+    allowed = set(dois)
+    # 사후 필터는 선택도만큼 결과가 줄어드는 것을 감안해 과다 조회 (최대 100배)
+    overfetch = min(limit * 100, max(limit, int(np.ceil(limit / max(selectivity, 1e-6)))))
+
+    unfiltered_ms, pushdown_ms, postfilter_ms = [], [], []
+    pushdown_counts, postfilter_counts = [], []
+    for vector in queries:
+        started = time.perf_counter()
+        repository.search_by_vector(vector, limit=limit, distance_threshold=NO_DISTANCE_LIMIT)
+        unfiltered_ms.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        pushed = repository.search_by_vector(vector, limit=limit, distance_threshold=NO_DISTANCE_LIMIT, filters=filters)
+        pushdown_ms.append((time.perf_counter() - started) * 1000)
+        pushdown_counts.append(len(pushed))
+
+        started = time.perf_counter()
+        candidates = repository.search_by_vector(vector, limit=overfetch, distance_threshold=NO_DISTANCE_LIMIT)
+        post = [r for r in candidates if r.doi in allowed][:limit]
+        postfilter_ms.append((time.perf_counter() - started) * 1000)
+        postfilter_counts.append(len(post))
+
+    return {
+        "selectivity": round(selectivity, 4),
+        "doi_count": len(dois),
+        "unfiltered": percentiles(unfiltered_ms),
+        "pushdown": {**percentiles(pushdown_ms), "avg_results": round(float(np.mean(pushdown_counts)), 2)},
+        "postfilter": {
+            **percentiles(postfilter_ms),
+            "overfetch_limit": overfetch,
+            "avg_results": round(float(np.mean(postfilter_counts)), 2),
+        },
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark vector search latency at varying filter selectivity.")
+    parser.add_argument("--queries", type=int, default=50, help="쿼리 벡터 수")
+    parser.add_argument("--limit", type=int, default=10, help="검색 결과 수 (k)")
+    parser.add_argument("--selectivities", type=float, nargs="+", default=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0],
+                        help="필터를 통과하는 청크 비율 목표값")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    manager = WeaviateManager()
+    manager.connect()
+    try:
+        manager.ensure_collection_exists()
+        repository = DocumentRepository(db_manager=manager)
+        doi_counts, queries = sample_collection(repository, args.queries, rng)
+        if not queries:
+            logger.error("Collection has no vectors to benchmark against.")
+            return 1
+        logger.info(f"Collection: {sum(doi_counts.values())} chunks across {len(doi_counts)} DOIs, {len(queries)} query vectors.")
+
+        # 워밍업 (연결/캐시 효과 제거)
+        for vector in queries[:5]:
+            repository.search_by_vector(vector, limit=args.limit, distance_threshold=NO_DISTANCE_LIMIT)
+
+        report = []
+        for target in sorted(args.selectivities):
+            dois, actual = pick_dois(doi_counts, target, rng)
+            if not dois:
+                continue
+            logger.info(f"Running selectivity target={target} (actual={actual:.4f}, {len(dois)} DOIs)...")
+            report.append(run_selectivity(repository, queries, dois, args.limit, actual))
+    finally:
+        manager.close()
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+# scripts/bench_quantization.py
+"""
+벡터 양자화(PQ/BQ) 설정별 검색 정확도와 벡터 메모리 벤치마크.
+컬렉션에서 청크 벡터를 표본 추출해 설정마다 임시 컬렉션(full precision / PQ segments x centroids / BQ rescore)을 만들고,
+같은 쿼리 표본에 대한 HNSW 결과를 numpy 전수 탐색 정답과 비교하여 recall@k, 지연 시간, 벡터 메모리(추정)를 보고합니다.
+
+쿼리 벡터는 적재하지 않은 별도 표본(held-out)이므로 자기 자신이 1위가 되어 recall이 부풀려지지 않습니다.
+메모리는 인덱스가 메모리에 유지하는 벡터 표현의 크기입니다 (full: float32, PQ: 세그먼트당 1바이트 코드 + 코드북,
+BQ: 차원당 1비트). 양자화 시에도 원본 벡터는 재점수화를 위해 디스크에 남으므로 디스크 사용량은 줄지 않습니다.
+
+사용 예 (rag_server 디렉토리에서 실행):
+    python -m scripts.bench_quantization --objects 20000 --queries 100 --k 10
+    python -m scripts.bench_quantization --pq 96x256 48x256 24x256 --bq-rescore 0 200 1000
+"""
+import argparse
+import json
+import logging
+import math
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from weaviate.classes.config import Configure, DataType, Property
+from weaviate.classes.query import MetadataQuery
+
+from database.weaviate_db import WeaviateManager
+from repository.document_repository import DocumentRepository
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+BENCH_COLLECTION_PREFIX = "BenchQuantization"
+FLOAT32_BYTES = 4
+
+
+def sample_vectors(repository: DocumentRepository, num_objects: int, num_queries: int,
+                   rng: random.Random) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """한 번의 전체 순회로 (적재용 + 쿼리용) 벡터를 저수지 표본 추출한 뒤 쿼리 몫을 떼어냄"""
+    total = num_objects + num_queries
+    sample: List[Tuple[str, List[float]]] = []
+    seen = 0
+    for record in repository.iter_documents(properties=["doi"], include_vector=True):
+        vector = record.get("vector")
+        if vector is None:
+            continue
+        if len(sample) < total:
+            sample.append((record["uuid"], vector))
+        else:
+            slot = rng.randint(0, seen)
+            if slot < total:
+                sample[slot] = (record["uuid"], vector)
+        seen += 1
+    rng.shuffle(sample)
+    queries = np.asarray([vector for _, vector in sample[:num_queries]], dtype=np.float32)
+    corpus = sample[num_queries:]
+    return [uuid for uuid, _ in corpus], np.asarray([vector for _, vector in corpus], dtype=np.float32), queries
+
+
+def exact_neighbors(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """코사인 유사도 전수 탐색 상위 k개 인덱스 (정답)"""
+    normed = corpus / np.maximum(np.linalg.norm(corpus, axis=1, keepdims=True), 1e-12)
+    q = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+    scores = q @ normed.T
+    top = np.argpartition(-scores, min(k, scores.shape[1] - 1), axis=1)[:, :k]
+    order = np.take_along_axis(scores, top, axis=1).argsort(axis=1)[:, ::-1]
+    return np.take_along_axis(top, order, axis=1)
+
+
+def vector_memory_bytes(mode: str, count: int, dim: int, segments: Optional[int] = None,
+                        centroids: Optional[int] = None) -> int:
+    """인덱스가 메모리에 유지하는 벡터 표현 크기 추정"""
+    if mode == "pq":
+        code_bytes = 1 if centroids <= 256 else 2
+        return count * segments * code_bytes + centroids * dim * FLOAT32_BYTES  # 코드 + 코드북
+    if mode == "bq":
+        return count * math.ceil(dim / 64) * 8  # 차원당 1비트 (uint64 단위)
+    return count * dim * FLOAT32_BYTES
+
+
+def build_settings(dim: int, pq_specs: Optional[List[str]], bq_rescores: List[int], count: int) -> List[Dict]:
+    """비교할 설정 목록. PQ 기본값은 차원의 1/2, 1/4, 1/8 세그먼트 x 256 centroids"""
+    settings_list = [{"label": "full", "mode": "none", "quantizer": None}]
+    if pq_specs is None:
+        pq_specs = [f"{dim // factor}x256" for factor in (2, 4, 8) if dim % factor == 0]
+    for spec in pq_specs:
+        segments, centroids = (int(part) for part in spec.lower().split("x"))
+        if dim % segments:
+            logger.warning(f"Skipping PQ {spec}: {segments} segments do not divide dimension {dim}.")
+            continue
+        settings_list.append({
+            "label": f"pq-{segments}x{centroids}", "mode": "pq", "segments": segments, "centroids": centroids,
+            # 표본 전체로 학습하도록 training_limit를 적재 수에 맞춤 (도달 시점에 자동 학습)
+            "quantizer": Configure.VectorIndex.Quantizer.pq(segments=segments, centroids=centroids, training_limit=count),
+        })
+    for rescore in bq_rescores:
+        settings_list.append({
+            "label": f"bq-rescore{rescore}", "mode": "bq", "rescore_limit": rescore,
+            "quantizer": Configure.VectorIndex.Quantizer.bq(rescore_limit=rescore),
+        })
+    return settings_list
+
+
+def load_collection(manager: WeaviateManager, name: str, quantizer, uuids: List[str], corpus: np.ndarray,
+                    batch_size: int):
+    """설정별 임시 컬렉션 생성 후 표본 벡터를 원래 UUID로 적재"""
+    if manager.client.collections.exists(name):
+        manager.client.collections.delete(name)
+    collection = manager.client.collections.create(
+        name=name,
+        vectorizer_config=Configure.Vectorizer.none(),
+        properties=[Property(name="doi", data_type=DataType.TEXT)],
+        vector_index_config=Configure.VectorIndex.hnsw(quantizer=quantizer),
+    )
+    with collection.batch.fixed_size(batch_size=batch_size) as batch:
+        for uuid, vector in zip(uuids, corpus):
+            batch.add_object(properties={}, vector=vector.tolist(), uuid=uuid)
+    failed = len(collection.batch.failed_objects)
+    if failed:
+        raise RuntimeError(f"{failed} objects failed to load into '{name}'.")
+    return collection
+
+
+def run_setting(collection, queries: np.ndarray, truth: List[set], k: int) -> Dict:
+    recalls, latencies_ms = [], []
+    for vector, expected in zip(queries, truth):
+        started = time.perf_counter()
+        response = collection.query.near_vector(near_vector=vector.tolist(), limit=k,
+                                                return_metadata=MetadataQuery(distance=True))
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+        found = {str(obj.uuid) for obj in response.objects}
+        recalls.append(len(found & expected) / k)
+    latencies = np.asarray(latencies_ms, dtype=np.float64)
+    return {
+        f"recall@{k}": round(float(np.mean(recalls)), 4),
+        "recall_min": round(float(np.min(recalls)), 4),
+        "p50_ms": round(float(np.percentile(latencies, 50)), 2),
+        "p95_ms": round(float(np.percentile(latencies, 95)), 2),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark recall@k and vector memory for PQ/BQ quantization settings.")
+    parser.add_argument("--objects", type=int, default=20000, help="임시 컬렉션에 적재할 표본 벡터 수")
+    parser.add_argument("--queries", type=int, default=100, help="쿼리 벡터 수 (적재 표본과 겹치지 않음)")
+    parser.add_argument("--k", type=int, default=10, help="recall@k의 k")
+    parser.add_argument("--pq", nargs="*", default=None, help="PQ 설정 목록 'segments x centroids' (예: 96x256)")
+    parser.add_argument("--bq-rescore", type=int, nargs="*", default=[0, 200], help="BQ rescore_limit 목록")
+    parser.add_argument("--batch-size", type=int, default=500, help="적재 배치 크기")
+    parser.add_argument("--keep", action="store_true", help="벤치마크 후 임시 컬렉션 유지")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    manager = WeaviateManager()
+    manager.connect()
+    created: List[str] = []
+    try:
+        manager.ensure_collection_exists()
+        repository = DocumentRepository(db_manager=manager)
+        uuids, corpus, queries = sample_vectors(repository, args.objects, args.queries, rng)
+        if len(queries) < args.queries or len(corpus) < args.k:
+            logger.error(f"Collection has too few vectors ({len(corpus) + len(queries)}) for this benchmark.")
+            return 1
+        count, dim = corpus.shape
+        logger.info(f"Sampled {count} corpus vectors and {len(queries)} held-out queries (dim={dim}).")
+
+        truth = [{uuids[i] for i in row} for row in exact_neighbors(corpus, queries, args.k)]
+        report = {"objects": count, "queries": len(queries), "dim": dim, "k": args.k, "settings": []}
+        for setting in build_settings(dim, args.pq, args.bq_rescore, count):
+            name = f"{BENCH_COLLECTION_PREFIX}_{setting['label'].replace('-', '_')}"
+            logger.info(f"Loading setting '{setting['label']}' into '{name}'...")
+            started = time.perf_counter()
+            collection = load_collection(manager, name, setting["quantizer"], uuids, corpus, args.batch_size)
+            created.append(name)
+            load_seconds = time.perf_counter() - started
+            for vector in queries[:5]:  # 워밍업
+                collection.query.near_vector(near_vector=vector.tolist(), limit=args.k)
+
+            memory = vector_memory_bytes(setting["mode"], count, dim, setting.get("segments"), setting.get("centroids"))
+            report["settings"].append({
+                "label": setting["label"],
+                "load_seconds": round(load_seconds, 1),
+                **run_setting(collection, queries, truth, args.k),
+                "vector_memory_bytes": memory,
+                "vector_memory_ratio": round(memory / vector_memory_bytes("none", count, dim), 4),
+            })
+    finally:
+        if not args.keep:
+            for name in created:
+                manager.client.collections.delete(name)
+        manager.close()
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
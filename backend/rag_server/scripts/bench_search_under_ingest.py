@@ -0,0 +1,162 @@
+# scripts/bench_search_under_ingest.py
+"""
+수집(ingest) 부하 중 검색 지연 시간 벤치마크.
+(1) 검색만 실행하는 기준 구간과 (2) 같은 검색 부하를 유지한 채 배치 수집을 실행하는 구간의
+p50/p95/p99 검색 지연과 수집 처리 시간을 비교합니다. --no-lanes로 실행 레인 없이(기존 방식) 같은 측정을 할 수 있습니다.
+
+주의: 수집 구간은 지정한 파일을 실제로 컬렉션에 저장하므로 테스트용 Weaviate 인스턴스에서 실행하세요.
+
+사용 예 (rag_server 디렉토리에서 실행):
+    python -m scripts.bench_search_under_ingest --files samples/*.pdf --query-file queries.txt --clients 4
+    python -m scripts.bench_search_under_ingest --files samples/*.pdf --query-file queries.txt --clients 4 --no-lanes
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from core.config import settings
+from database.weaviate_db import WeaviateManager
+from repository.document_repository import DocumentRepository
+from service.document_service import DocumentService
+from utils.document_loader import get_document_loader
+from utils.embedder import embedder_instance
+from utils.executors import ExecutorLanes, run_ingest, run_search
+from utils.summarizer import get_summarizer
+from utils.text_splitter import get_splitter_service
+
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("bench_search_under_ingest")
+logger.setLevel(logging.INFO)
+
+DEFAULT_QUERIES = [
+    "transformer attention mechanism for long documents",
+    "graph neural networks for citation prediction",
+    "contrastive learning of sentence embeddings",
+    "retrieval augmented generation evaluation",
+]
+
+
+def percentiles(latencies_ms: List[float]) -> Dict[str, float]:
+    if not latencies_ms:
+        return {"count": 0}
+    values = np.asarray(latencies_ms)
+    return {
+        "count": int(values.size),
+        "p50_ms": round(float(np.percentile(values, 50)), 2),
+        "p95_ms": round(float(np.percentile(values, 95)), 2),
+        "p99_ms": round(float(np.percentile(values, 99)), 2),
+        "max_ms": round(float(values.max()), 2),
+    }
+
+
+async def search_client(service: DocumentService, lanes, queries, stop: asyncio.Event, latencies: List[float], limit: int) -> None:
+    """stop이 설정될 때까지 쿼리를 순환하며 검색하고 요청별 지연(ms)을 기록"""
+    for query in itertools.cycle(queries):
+        if stop.is_set():
+            return
+        started = time.perf_counter()
+        await run_search(lanes, service.search_by_text, query_text=query, limit=limit)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+async def run_phase(service: DocumentService, lanes, queries: List[str], clients: int, limit: int, duration: float,
+                    files=None, rounds: int = 0) -> Dict:
+    """duration초 동안(수집 파일이 있으면 수집이 끝날 때까지) clients개의 동시 검색 부하를 유지"""
+    stop = asyncio.Event()
+    latencies: List[float] = []
+    tasks = [asyncio.create_task(search_client(service, lanes, queries[i:] + queries[:i], stop, latencies, limit))
+             for i in range(clients)]
+    phase: Dict = {}
+    started = time.perf_counter()
+    if files:
+        ingest_seconds = []
+        for _ in range(max(1, rounds)):
+            round_started = time.perf_counter()
+            _, metrics = await run_ingest(lanes, service.process_and_store_batch, files)
+            ingest_seconds.append(round(time.perf_counter() - round_started, 2))
+        phase["ingest_seconds"] = ingest_seconds
+        phase["ingest_embed_yielded_seconds"] = metrics["stages"]["embed"]["yielded_seconds"]
+    else:
+        await asyncio.sleep(duration)
+    stop.set()
+    await asyncio.gather(*tasks)
+    phase["wall_seconds"] = round(time.perf_counter() - started, 2)
+    phase["search"] = percentiles(latencies)
+    return phase
+
+
+async def main_async(args) -> Dict:
+    manager = WeaviateManager()
+    manager.connect()
+    manager.ensure_collection_exists()
+    try:
+        lanes = None if args.no_lanes else ExecutorLanes(
+            max(settings.SEARCH_LANE_WORKERS, args.clients), settings.SEARCH_TORCH_THREADS,
+            settings.INGEST_LANE_WORKERS, settings.INGEST_LANE_PROCESSES, settings.INGEST_TORCH_THREADS,
+            settings.INGEST_YIELD_MAX_MS)
+        # 캐시 적중이 지연 분포를 왜곡하지 않도록 시맨틱 캐시 없이 구성
+        service = DocumentService(
+            repository=DocumentRepository(manager), loader=get_document_loader(), splitter=get_splitter_service(),
+            embedder=embedder_instance, summarizer=get_summarizer(), lanes=lanes
+        )
+        queries = args.queries
+        await run_search(lanes, service.search_by_text, query_text=queries[0], limit=args.limit)  # 모델 워밍업
+        files = [(path, path.name) for path in args.files]
+        logger.info(f"Baseline: {args.clients} search clients for {args.duration}s (lanes={'off' if lanes is None else 'on'})...")
+        baseline = await run_phase(service, lanes, queries, args.clients, args.limit, args.duration)
+        logger.info(f"Under ingest: {len(files)} files x {args.rounds} rounds...")
+        under_ingest = await run_phase(service, lanes, queries, args.clients, args.limit, args.duration, files, args.rounds)
+        report = {
+            "lanes": lanes.stats() if lanes else {"enabled": False},
+            "clients": args.clients,
+            "baseline": baseline,
+            "under_ingest": under_ingest,
+        }
+        if baseline["search"].get("count") and under_ingest["search"].get("count"):
+            report["p99_ratio"] = round(under_ingest["search"]["p99_ms"] / baseline["search"]["p99_ms"], 2)
+        if lanes is not None:
+            lanes.shutdown()
+        return report
+    finally:
+        manager.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Measure search latency percentiles with and without a concurrent ingest.")
+    parser.add_argument("--files", type=Path, nargs="+", required=True, help="수집 부하로 사용할 문서 파일")
+    parser.add_argument("--query-file", type=Path, default=None, help="한 줄에 하나씩 검색 쿼리가 적힌 파일")
+    parser.add_argument("--clients", type=int, default=4, help="동시 검색 클라이언트 수")
+    parser.add_argument("--limit", type=int, default=settings.DEFAULT_SEARCH_LIMIT)
+    parser.add_argument("--duration", type=float, default=20.0, help="기준 구간 길이(초)")
+    parser.add_argument("--rounds", type=int, default=1, help="수집 구간에서 파일 목록을 반복 수집할 횟수")
+    parser.add_argument("--no-lanes", action="store_true", help="실행 레인 없이 측정 (비교용)")
+    args = parser.parse_args(argv)
+
+    if embedder_instance is None:
+        logger.error("Embedding model is unavailable.")
+        return 1
+    missing = [str(path) for path in args.files if not path.is_file()]
+    if missing:
+        logger.error(f"Files not found: {', '.join(missing)}")
+        return 1
+    args.queries = ([line.strip() for line in args.query_file.read_text(encoding="utf-8").splitlines() if line.strip()]
+                    if args.query_file else DEFAULT_QUERIES)
+    if not args.queries:
+        logger.error("No queries to run.")
+        return 1
+
+    report = asyncio.run(main_async(args))
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+# scripts/export_collection.py
+"""
+Weaviate 컬렉션 전체를 커서 기반으로 순회하여 NDJSON / Arrow IPC / Parquet 파일로 내보내는 CLI.
+한 번에 한 페이지/한 레코드 배치만 메모리에 유지하므로 컬렉션 크기와 무관하게 메모리 사용량이 일정합니다.
+
+사용 예 (rag_server 디렉토리에서 실행):
+    python -m scripts.export_collection --format ndjson --output export.ndjson
+    python -m scripts.export_collection --format parquet --output export.parquet --properties doi,title,chunk_index --include-vector
+"""
+import argparse
+import logging
+import sys
+import time
+
+from database.weaviate_db import WeaviateManager
+from repository.document_repository import DocumentRepository
+from utils.exporter import DocumentExporter, EXPORT_FORMATS, require_pyarrow
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Stream-export the RAG vector collection.")
+    parser.add_argument("--format", choices=list(EXPORT_FORMATS), default="ndjson", help="출력 포맷")
+    parser.add_argument("--output", default="-", help="출력 파일 경로 ('-'이면 stdout)")
+    parser.add_argument("--properties", default=None, help="쉼표로 구분한 내보낼 속성 목록 (기본값: 전체)")
+    parser.add_argument("--include-vector", action="store_true", help="임베딩 벡터 포함")
+    parser.add_argument("--batch-size", type=int, default=None, help="레코드 배치 크기 (기본값: EXPORT_BATCH_SIZE)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    properties = [p.strip() for p in args.properties.split(",") if p.strip()] if args.properties else None
+    exporter = DocumentExporter(properties=properties, include_vector=args.include_vector, batch_size=args.batch_size)
+    if args.format != "ndjson":
+        require_pyarrow()
+
+    manager = WeaviateManager()
+    manager.connect()
+    started = time.perf_counter()
+    written = 0
+    try:
+        repository = DocumentRepository(db_manager=manager)
+        records = repository.iter_documents(properties=exporter.properties, include_vector=args.include_vector)
+        out = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+        try:
+            for chunk in exporter.serialize(records, args.format):
+                out.write(chunk)
+                written += len(chunk)
+        finally:
+            if out is not sys.stdout.buffer:
+                out.close()
+    finally:
+        manager.close()
+
+    logger.info(f"Export finished: {written / (1024 * 1024):.1f}MB written to '{args.output}' in {time.perf_counter() - started:.1f}s.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
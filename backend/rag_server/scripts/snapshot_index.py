@@ -0,0 +1,69 @@
+# scripts/snapshot_index.py
+"""
+RAG 인덱스 스냅샷/복원/검증 CLI.
+재임베딩 없이 노드를 재구축할 수 있도록 청크 속성(Parquet)과 벡터(float32 원시 파일)를 저장/적재합니다.
+
+사용 예 (rag_server 디렉토리에서 실행):
+    python -m scripts.snapshot_index create --dir snapshots/2024-06-01
+    python -m scripts.snapshot_index restore --dir snapshots/2024-06-01 --batch-size 1000 --concurrent-requests 8
+    python -m scripts.snapshot_index verify --dir snapshots/2024-06-01 --sample-size 500
+"""
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+from database.weaviate_db import WeaviateManager
+from repository.document_repository import DocumentRepository
+from service.snapshot_service import SnapshotService
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Snapshot and restore the RAG vector index.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    create = subparsers.add_parser("create", help="컬렉션을 스냅샷 디렉토리로 덤프")
+    create.add_argument("--dir", required=True, type=Path, help="스냅샷 디렉토리")
+
+    restore = subparsers.add_parser("restore", help="스냅샷을 컬렉션으로 대량 적재")
+    restore.add_argument("--dir", required=True, type=Path, help="스냅샷 디렉토리")
+    restore.add_argument("--batch-size", type=int, default=None, help="배치 크기 (기본값: SNAPSHOT_BATCH_SIZE)")
+    restore.add_argument("--concurrent-requests", type=int, default=None, help="동시 배치 요청 수 (기본값: SNAPSHOT_CONCURRENT_REQUESTS)")
+    restore.add_argument("--no-verify", action="store_true", help="적재 후 검증 생략")
+
+    verify = subparsers.add_parser("verify", help="스냅샷과 컬렉션의 개수/표본 체크섬 비교")
+    verify.add_argument("--dir", required=True, type=Path, help="스냅샷 디렉토리")
+    verify.add_argument("--sample-size", type=int, default=None, help="표본 행 수 (기본값: SNAPSHOT_VERIFY_SAMPLE_SIZE)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    manager = WeaviateManager()
+    manager.connect()
+    try:
+        manager.ensure_collection_exists()
+        service = SnapshotService(DocumentRepository(db_manager=manager))
+
+        if args.command == "create":
+            result = service.create_snapshot(args.dir)
+        elif args.command == "restore":
+            result = service.restore_snapshot(args.dir, args.batch_size, args.concurrent_requests)
+            if not args.no_verify:
+                result["verification"] = service.verify_snapshot(args.dir)
+        else:
+            result = service.verify_snapshot(args.dir, args.sample_size)
+    finally:
+        manager.close()
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    verification = result.get("verification", result) if args.command != "create" else {"ok": True}
+    return 0 if verification.get("ok", True) and not result.get("failed") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
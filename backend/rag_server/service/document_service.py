@@ -1,16 +1,26 @@
 # service/document_service.py
+import json
 import logging
-from typing import List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from typing import List, Optional, Tuple, Dict, Any
 from fastapi import Depends, HTTPException
 from pathlib import Path
-from datetime import datetime, timezone
 
 # 필요한 모델, 리포지토리, 서비스 및 팩토리 함수 임포트
-from models.schemas import SimilarityResult
+from models.schemas import SimilarityResult, SearchFilters, SearchRequest
 from repository.document_repository import DocumentRepository, get_repository
+from service.ingest_pipeline import IngestPipeline, FileIngestResult
 from utils.document_loader import DocumentLoader, get_document_loader
 from utils.text_splitter import TextSplitter, get_splitter_service
 from utils.embedder import Embedder, get_embedder
+from utils.semantic_cache import SemanticCache, get_semantic_cache
+from utils.reranker import CrossEncoderReranker, get_reranker
+from utils.minhash import MinHashLSH, get_dedup_index
+from utils.diversify import mmr_select, merge_adjacent_chunks, stitch_texts
+from utils.summarizer import ExtractiveSummarizer, get_summarizer
+from utils.executors import ExecutorLanes, get_executor_lanes
 from core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -24,7 +34,12 @@ class DocumentService:
                  repository: DocumentRepository,
                  loader: DocumentLoader,
                  splitter: TextSplitter,
-                 embedder: Embedder):
+                 embedder: Embedder,
+                 cache: Optional[SemanticCache] = None,
+                 reranker: Optional[CrossEncoderReranker] = None,
+                 dedup_index: Optional[MinHashLSH] = None,
+                 summarizer: Optional[ExtractiveSummarizer] = None,
+                 lanes: Optional[ExecutorLanes] = None):
         
         if not all([repository, loader, splitter, embedder]):
              logger.critical("One or more dependencies are None during DocumentService init.")
@@ -33,68 +48,29 @@ class DocumentService:
         self.loader = loader
         self.splitter = splitter
         self.embedder = embedder
+        self.cache = cache  # 선택 의존성: None이면 시맨틱 캐시 미사용
+        self.reranker = reranker  # 선택 의존성: None이면 재순위화 요청 시 밀집 검색 순서 반환
+        self.dedup_index = dedup_index  # 선택 의존성: None이면 근사 중복 문서 검사 생략
+        self.summarizer = summarizer  # 선택 의존성: None이면 수집 시 문서 요약 생략
+        self.lanes = lanes  # 선택 의존성: None이면 검색/수집이 같은 기본 스레드 풀을 공유
         logger.info("DocumentService initialized with dependencies.")
 
     # --- 문서 처리 및 저장 파이프라인 ---
     def process_and_store_document(self, file_path: Path, original_filename: str) -> List[str]:
         """주어진 파일 경로의 문서를 로드, 분할, 임베딩하고 Repository를 통해 저장"""
+        return self.ingest_document(file_path, original_filename).stored_ids
+
+    def ingest_document(self, file_path: Path, original_filename: str) -> FileIngestResult:
+        """단일 문서 수집 후 상태/근사 중복 판정을 포함한 결과 반환 (건너뛴 경우 stored_ids는 빈 목록)"""
         logger.info(f"Starting processing pipeline for document: {original_filename} ({file_path.name})")
         try:
-            # 1. 문서 로드
-            content = self.loader.load_document(file_path)
-            if not content: 
-                 logger.warning(f"No content loaded from {original_filename}. Skipping further processing.")
-                 return []
-
-            # 2. 텍스트 분할
-            chunks = self.splitter.split_text(content)
-            if not chunks:
-                 logger.warning(f"No text chunks generated for {original_filename}. Skipping storage.")
-                 return []
-
-            # 3. 메타데이터 준비
-            metadata = {
-                "title": original_filename or file_path.stem,
-                "authors": "Unknown",
-                "published": datetime.now(timezone.utc),
-                "doi": f"uploaded_{file_path.stem}"
-            }
-            logger.debug(f"Prepared metadata for {original_filename}: {metadata}")
-
-            # 4. 청크별 임베딩 생성 및 데이터 객체 리스트 생성
-            processed_data_objects = []
-            logger.info(f"Generating embeddings for {len(chunks)} chunks...")
-            for i, chunk in enumerate(chunks):
-                try:
-                    # Format text specifically for the embedding model if needed
-                    text_to_embed = f"{metadata.get('title', '')} [SEP] {chunk}"
-                    embedding_vector = self.embedder.embed_text(text_to_embed)
-
-                    data_object = {
-                        "title": metadata.get("title", ""),
-                        "content": chunk,
-                        "authors": metadata.get("authors", ""),
-                        "published": metadata.get("published"),
-                        "doi": metadata.get('doi', f"uploaded_{metadata.get('title', 'unknown')}_{i}"),
-                        "chunk_index": i,
-                        "vector": embedding_vector
-                    }
-                    processed_data_objects.append(data_object)
-                    logger.debug(f"Processed chunk {i} for {original_filename}")
-
-                except Exception as e:
-                    logger.error(f"Failed to process chunk {i} for '{metadata.get('title')}': {str(e)}", exc_info=True)
-                    continue
-
-            if not processed_data_objects:
-                logger.error(f"No chunks were successfully processed for {original_filename}.")
-                raise ValueError("Failed to process any chunks for the document.")
-
-            # 5. Repository를 통해 데이터 저장
-            logger.info(f"Passing {len(processed_data_objects)} processed objects to repository for storage...")
-            stored_ids = self.repository.store_processed_data(processed_data_objects)
-            logger.info(f"Storage initiated for {len(stored_ids)} chunks from {original_filename}")
-            return stored_ids
+            results, _ = self._run_pipeline([(file_path, original_filename)])
+            result = results[0]
+            if result.exception is not None:
+                raise result.exception
+            if result.status != "skipped":
+                logger.info(f"Storage initiated for {len(result.stored_ids)} chunks from {original_filename}")
+            return result
 
         except ValueError as ve:
             logger.error(f"ValueError during document processing for {original_filename}: {ve}")
@@ -106,22 +82,51 @@ class DocumentService:
             logger.error(f"Unexpected error processing document {original_filename}: {e}", exc_info=True)
             raise HTTPException(status_code=500, detail="Unexpected internal error")
 
+    def process_and_store_batch(self, files: List[Tuple[Path, str]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        여러 문서를 한 번의 파이프라인 실행으로 처리합니다. 파싱은 여러 워커가 동시에 수행하고,
+        모든 파일의 청크를 공유 배치로 임베딩하며, 저장은 임베딩과 겹쳐서 진행됩니다.
+        (입력 순서대로의 파일별 결과(status: success / skipped / failed), 파이프라인 메트릭)을 반환하며 일부 실패를 허용합니다.
+        """
+        logger.info(f"Starting batch processing pipeline for {len(files)} documents...")
+        results, metrics = self._run_pipeline(files)
+        return [result.as_response() for result in results], metrics
+
+    def _run_pipeline(self, files: List[Tuple[Path, str]]):
+        pipeline = IngestPipeline(
+            repository=self.repository,
+            loader=self.loader,
+            splitter=self.splitter,
+            embedder=self.embedder,
+            dedup_index=self.dedup_index,
+            summarizer=self.summarizer,
+            lanes=self.lanes
+        )
+        results, metrics = pipeline.run(files)
+        if any(result.chunks_stored for result in results):
+            self._invalidate_cache()
+        return results, metrics
+
     # --- 검색 관련 메소드들 (쿼리 임베딩 포함) ---
-    def search_by_text(self, query_text: str, limit: Optional[int] = None, similarity_threshold: Optional[float] = None) -> List[SimilarityResult]:
+    @staticmethod
+    def _query_embedding_text(query_text: str) -> str:
+        return f"user's question [SEP] {query_text}"
+
+    def search_by_text(self, query_text: str, limit: Optional[int] = None, similarity_threshold: Optional[float] = None,
+                       filters: Optional[SearchFilters] = None, rerank: bool = False,
+                       rerank_candidates: Optional[int] = None, rerank_budget_ms: Optional[float] = None,
+                       mmr: bool = False, mmr_lambda: Optional[float] = None, merge_adjacent: bool = False,
+                       context_window: int = 0, summaries: str = "none") -> List[SimilarityResult]:
         logger.info(f"Performing text search for: '{query_text[:50]}...'")
         if not query_text:
              raise ValueError("Query text cannot be empty.")
         try:
-            text_to_embed = f"user's question [SEP] {query_text}"
-            query_vector = self.embedder.embed_text(text_to_embed)
-
-            distance_threshold_value = (1.0 - similarity_threshold) if similarity_threshold is not None else None
-            logger.debug(f"Calculated distance threshold: {distance_threshold_value}")
-
-            return self.repository.search_by_vector(
-                query_vector=query_vector,
-                limit=limit,
-                distance_threshold=distance_threshold_value
+            query_vector = self.embedder.embed_text(self._query_embedding_text(query_text))
+            return self._search_with_vector(
+                query_text, query_vector, limit=limit, similarity_threshold=similarity_threshold, filters=filters,
+                rerank=rerank, rerank_candidates=rerank_candidates, rerank_budget_ms=rerank_budget_ms,
+                mmr=mmr, mmr_lambda=mmr_lambda, merge_adjacent=merge_adjacent, context_window=context_window,
+                summaries=summaries
             )
         except ValueError as ve:
              logger.error(f"ValueError during text search: {ve}")
@@ -133,6 +138,215 @@ class DocumentService:
             logger.error(f"Unexpected error during text search: {e}", exc_info=True)
             raise HTTPException(status_code=500, detail="Unexpected internal error during search")
 
+    def search_batch(self, requests: List[SearchRequest]) -> Tuple[List[Dict[str, Any]], float]:
+        """
+        여러 쿼리를 한 번의 배치 임베딩으로 벡터화한 뒤, 벡터 검색을 스레드 풀에서 동시에 실행.
+        쿼리별 실패는 해당 항목의 error로 기록하고, 결과는 입력 순서대로 반환합니다.
+        반환값: (쿼리별 결과 dict 목록, 배치 임베딩 소요 시간 ms)
+        """
+        logger.info(f"Performing batch search for {len(requests)} queries...")
+        if not requests:
+            raise ValueError("At least one query is required.")
+        if any(not request.query_text for request in requests):
+            raise ValueError("query_text is required for every query in the batch.")
+        started = time.perf_counter()
+        try:
+            vectors = self.embedder.embed_documents([self._query_embedding_text(r.query_text) for r in requests])
+        except ValueError as ve: raise HTTPException(status_code=400, detail=str(ve))
+        except RuntimeError as rte: logger.error(f"Runtime error during batch query embedding: {rte}", exc_info=True); raise HTTPException(status_code=500, detail="Internal error during query embedding")
+        embed_ms = (time.perf_counter() - started) * 1000
+        embed_share_ms = embed_ms / len(requests)  # 배치 임베딩 시간을 쿼리 수로 나눈 값
+
+        def run(index: int, request: SearchRequest, vector: List[float]) -> Dict[str, Any]:
+            search_started = time.perf_counter()
+            item: Dict[str, Any] = {"index": index, "query_text": request.query_text, "results": [], "error": None}
+            try:
+                item["results"] = self._search_with_vector(
+                    request.query_text, vector, limit=request.limit, similarity_threshold=request.similarity_threshold,
+                    filters=request.filters, rerank=request.rerank, rerank_candidates=request.rerank_candidates,
+                    rerank_budget_ms=request.rerank_budget_ms, mmr=request.mmr, mmr_lambda=request.mmr_lambda,
+                    merge_adjacent=request.merge_adjacent, context_window=request.context_window,
+                    summaries=request.summaries
+                )
+            except Exception as e:
+                logger.error(f"Batch search query #{index} failed: {e}", exc_info=not isinstance(e, ValueError))
+                item["error"] = str(e)
+            finished = time.perf_counter()
+            item["timings"] = {
+                "embed_ms": round(embed_share_ms, 2),
+                "queue_ms": round((search_started - started) * 1000 - embed_ms, 2),
+                "search_ms": round((finished - search_started) * 1000, 2),
+                "total_ms": round((finished - started) * 1000, 2),
+            }
+            return item
+
+        workers = max(1, min(settings.SEARCH_FANOUT_WORKERS, len(requests)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search-fanout") as executor:
+            items = list(executor.map(run, range(len(requests)), requests, vectors))
+        failed = sum(item["error"] is not None for item in items)
+        logger.info(f"Batch search finished: {len(items)} queries ({failed} failed), embedding {embed_ms:.1f}ms, total {(time.perf_counter() - started) * 1000:.1f}ms")
+        return items, embed_ms
+
+    def _search_with_vector(self, query_text: str, query_vector: List[float], limit: Optional[int] = None,
+                            similarity_threshold: Optional[float] = None, filters: Optional[SearchFilters] = None,
+                            rerank: bool = False, rerank_candidates: Optional[int] = None,
+                            rerank_budget_ms: Optional[float] = None, mmr: bool = False,
+                            mmr_lambda: Optional[float] = None, merge_adjacent: bool = False,
+                            context_window: int = 0, summaries: str = "none") -> List[SimilarityResult]:
+        """
+        임베딩된 쿼리 벡터로 캐시 조회 → 벡터 검색 → (선택) 재순위화 → (선택) 인접 청크 병합 → (선택) MMR 다양화
+        → (선택) 문서당 하나로 묶기 → (선택) 이웃 청크 문맥 확장 → (선택) 문서 요약 첨부 → 캐시 저장
+        """
+        if summaries not in ("none", "attach", "replace"):
+            raise ValueError(f"Unsupported summaries mode: {summaries}. Allowed: none, attach, replace")
+        if rerank and self.reranker is None:
+            logger.warning("Rerank requested but reranker is disabled; returning dense order.")
+            rerank = False
+        if limit is None: limit = settings.DEFAULT_SEARCH_LIMIT
+        cache_namespace = self._cache_namespace(
+            limit=limit, similarity_threshold=similarity_threshold,
+            filters=filters.model_dump(exclude_none=True) if filters else None,
+            rerank=rerank, rerank_candidates=rerank_candidates if rerank else None,
+            mmr_lambda=(mmr_lambda if mmr_lambda is not None else settings.MMR_LAMBDA) if mmr else None,
+            merge_adjacent=merge_adjacent, context_window=context_window, summaries=summaries
+        )
+        cache_generation = None
+        if self.cache:
+            cache_generation = self.cache.generation  # 검색 도중 수집이 끝나 clear되면 이 결과는 저장하지 않음
+            cached = self.cache.get(query_vector, cache_namespace)
+            if cached is not None:
+                logger.info(f"Semantic cache hit for: '{query_text[:50]}...'")
+                return [result.model_copy() for result in cached]
+
+        distance_threshold_value = (1.0 - similarity_threshold) if similarity_threshold is not None else None
+        logger.debug(f"Calculated distance threshold: {distance_threshold_value}")
+
+        # 재순위화 시에는 밀집 검색 하위 순위의 관련 청크도 후보에 포함되도록 과다 조회
+        fetch_limit = max(limit, rerank_candidates or settings.RERANK_CANDIDATES) if rerank else limit
+        # 다양화/병합 후에도 limit개가 남도록 과다 조회
+        if mmr or merge_adjacent or summaries == "replace":
+            fetch_limit = max(fetch_limit, limit * settings.MMR_FETCH_FACTOR)
+        results = self.repository.search_by_vector(
+            query_vector=query_vector,
+            limit=fetch_limit,
+            distance_threshold=distance_threshold_value,
+            filters=filters
+        )
+        complete = True
+        if rerank:
+            budget_ms = rerank_budget_ms if rerank_budget_ms is not None else settings.RERANK_BUDGET_MS
+            results, rerank_info = self.reranker.rerank(query_text, results, budget_ms)
+            complete = rerank_info["complete"]
+            if not complete:
+                logger.info(f"Rerank incomplete (budget {budget_ms}ms or model unavailable): {rerank_info}")
+        if merge_adjacent:
+            results = merge_adjacent_chunks(results, max_overlap=settings.CHUNK_OVERLAP * 2)
+        if mmr:
+            results = self._diversify(query_vector, results, limit, mmr_lambda if mmr_lambda is not None else settings.MMR_LAMBDA)
+        if summaries == "replace":
+            seen_dois = set()
+            results = [r for r in results if r.doi not in seen_dois and not seen_dois.add(r.doi)]  # 문서별 최상위 결과만 유지
+        results = results[:limit]
+        if context_window > 0 and summaries != "replace":
+            results = self._expand_context(results, context_window)
+        if summaries != "none":
+            results = self._attach_summaries(results, replace=summaries == "replace")
+        # 예산 초과로 일부만 재순위화된 결과는 캐시하지 않음 (다음 요청에서 점수 캐시로 완성 가능)
+        if self.cache and complete:
+            self.cache.put(query_vector, [result.model_copy() for result in results], cache_namespace, cache_generation)
+        return results
+
+
+    @staticmethod
+    def _diversify(query_vector: List[float], results: List[SimilarityResult], limit: int, lambda_mult: float) -> List[SimilarityResult]:
+        """후보 벡터에 대한 MMR 선택. 재순위화 점수가 모두 있으면 그것을 [0, 1]로 정규화해 관련도로 사용"""
+        if len(results) <= 1:
+            return results
+        if any(result.vector is None for result in results):
+            logger.warning("MMR skipped: some candidates have no vector.")
+            return results
+        relevance = None
+        if all(result.rerank_score is not None for result in results):
+            scores = np.array([result.rerank_score for result in results], dtype=np.float32)
+            spread = scores.max() - scores.min()
+            relevance = (scores - scores.min()) / spread if spread > 0 else np.ones_like(scores)
+        selected = mmr_select(query_vector, np.array([result.vector for result in results], dtype=np.float32),
+                              limit, lambda_mult, relevance=relevance)
+        return [results[i] for i in selected]
+
+    def _expand_context(self, results: List[SimilarityResult], window: int) -> List[SimilarityResult]:
+        """
+        모든 결과의 chunk_index ± window 구간을 DOI별로 합친 뒤 한 번의 필터 쿼리로 가져와,
+        결과마다 구간 내 청크를 겹침 제거 후 이어 붙여 context로 설정
+        """
+        spans: Dict[str, List[Tuple[int, int]]] = {}
+        for result in results:
+            if result.chunk_index is None:
+                continue
+            indexes = result.merged_chunk_indexes or [result.chunk_index]
+            spans.setdefault(result.doi, []).append((max(0, min(indexes) - window), max(indexes) + window))
+        ranges: Dict[str, List[Tuple[int, int]]] = {}
+        for doi, doi_spans in spans.items():
+            merged: List[List[int]] = []
+            for lo, hi in sorted(doi_spans):
+                if merged and lo <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], hi)
+                else:
+                    merged.append([lo, hi])
+            ranges[doi] = [(lo, hi) for lo, hi in merged]
+        if not ranges:
+            return results
+
+        chunks = self.repository.fetch_chunk_ranges(ranges)
+        expanded = []
+        for result in results:
+            doi_chunks = chunks.get(result.doi)
+            if result.chunk_index is None or not doi_chunks:
+                expanded.append(result)
+                continue
+            indexes = result.merged_chunk_indexes or [result.chunk_index]
+            # 히트 청크와 끊기지 않고 이어지는 이웃까지만 포함 (중간 청크가 없으면 거기서 멈춤)
+            lo = min(indexes)
+            while lo - 1 >= min(indexes) - window and lo - 1 in doi_chunks:
+                lo -= 1
+            hi = max(indexes)
+            while hi + 1 <= max(indexes) + window and hi + 1 in doi_chunks:
+                hi += 1
+            # 히트 본문(병합 결과라면 이미 이어 붙인 본문)을 가운데 두고 앞뒤 이웃만 붙임
+            texts = ([doi_chunks[i] for i in range(lo, min(indexes))] + [result.content]
+                     + [doi_chunks[i] for i in range(max(indexes) + 1, hi + 1)])
+            expanded.append(result.model_copy(update={
+                "context": stitch_texts(texts, max_overlap=settings.CHUNK_OVERLAP * 2),
+                "context_chunk_indexes": list(range(lo, hi + 1)),
+            }))
+        logger.debug(f"Expanded context for {len(results)} results with {sum(len(c) for c in chunks.values())} fetched chunks.")
+        return expanded
+
+    def _attach_summaries(self, results: List[SimilarityResult], replace: bool) -> List[SimilarityResult]:
+        """결과 문서들의 요약을 한 번의 쿼리로 가져와 summary에 설정. replace면 본문(content)도 요약으로 대체 (요약 없는 문서는 청크 유지)"""
+        records = self.repository.fetch_summaries([result.doi for result in results])
+        attached = []
+        for result in results:
+            record = records.get(result.doi)
+            if record is None or not record.get("summary"):
+                attached.append(result)
+                continue
+            update = {"summary": record["summary"]}
+            if replace:
+                update["content"] = record["summary"]
+            attached.append(result.model_copy(update=update))
+        logger.debug(f"Attached summaries to {len(records)} of {len(results)} results (replace={replace}).")
+        return attached
+
+    def get_document_summary(self, doi: str) -> Dict[str, Any]:
+        """수집 시 저장된 문서 요약 조회 (없으면 404)"""
+        if not doi: raise HTTPException(status_code=400, detail="doi is required.")
+        try:
+            record = self.repository.get_summary(doi)
+        except RuntimeError as rte: logger.error(f"Runtime error fetching summary for '{doi}': {rte}", exc_info=True); raise HTTPException(status_code=500, detail="Internal error fetching document summary")
+        if record is None:
+            raise HTTPException(status_code=404, detail=f"No summary found for document '{doi}'.")
+        return record
 
     def search_by_title(self, title_query: str, limit: Optional[int] = None) -> List[SimilarityResult]:
         logger.info(f"Performing title search for: '{title_query}'")
@@ -159,13 +373,29 @@ class DocumentService:
         except RuntimeError as rte: logger.error(f"Runtime error fetching all documents: {rte}", exc_info=True); raise HTTPException(status_code=500, detail="Internal error fetching documents")
         except Exception as e: logger.error(f"Unexpected error fetching all documents: {e}", exc_info=True); raise HTTPException(status_code=500, detail="Unexpected internal error fetching documents")
 
+    # --- 시맨틱 캐시 헬퍼 ---
+    @staticmethod
+    def _cache_namespace(**params) -> str:
+        """결과에 영향을 주는 검색 파라미터를 직렬화하여 캐시 네임스페이스로 사용"""
+        return json.dumps(params, sort_keys=True, default=str)
+
+    def _invalidate_cache(self) -> None:
+        """새 문서가 저장되면 캐시된 검색 결과가 낡으므로 비움"""
+        if self.cache:
+            self.cache.clear()
+
 
 # --- 팩토리 함수 ---
 def get_document_service(
     repo: DocumentRepository = Depends(get_repository),
     loader: DocumentLoader = Depends(get_document_loader),
     splitter: TextSplitter = Depends(get_splitter_service),
-    embedder: Embedder = Depends(get_embedder)
+    embedder: Embedder = Depends(get_embedder),
+    cache: Optional[SemanticCache] = Depends(get_semantic_cache),
+    reranker: Optional[CrossEncoderReranker] = Depends(get_reranker),
+    dedup_index: Optional[MinHashLSH] = Depends(get_dedup_index),
+    summarizer: Optional[ExtractiveSummarizer] = Depends(get_summarizer),
+    lanes: Optional[ExecutorLanes] = Depends(get_executor_lanes)
 ) -> DocumentService:
     """FastAPI Depends를 위한 DocumentService 인스턴스 반환 함수"""
     if not all([repo, loader, splitter, embedder]):
@@ -175,5 +405,10 @@ def get_document_service(
         repository=repo,
         loader=loader,
         splitter=splitter,
-        embedder=embedder
+        embedder=embedder,
+        cache=cache,
+        reranker=reranker,
+        dedup_index=dedup_index,
+        summarizer=summarizer,
+        lanes=lanes
     )
\ No newline at end of file
@@ -0,0 +1,526 @@
+# service/ingest_pipeline.py
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple
+
+from core.config import settings
+from repository.document_repository import DocumentRepository
+from utils.document_loader import DocumentLoader
+from utils.text_splitter import TextSplitter
+from utils.embedder import Embedder
+from utils.minhash import MinHashLSH
+from utils.summarizer import ExtractiveSummarizer
+from utils.executors import ExecutorLanes
+
+logger = logging.getLogger(__name__)
+
+_END = object()  # 단계 종료 신호 (sentinel)
+_POLL_SECONDS = 0.1
+
+
+# --- 데이터 객체 헬퍼 ---
+def build_metadata(file_path: Path, original_filename: str) -> Dict[str, Any]:
+    return {
+        "title": original_filename or file_path.stem,
+        "authors": "Unknown",
+        "published": datetime.now(timezone.utc),
+        "doi": f"uploaded_{file_path.stem}"
+    }
+
+def chunk_embedding_text(metadata: Dict[str, Any], chunk: str) -> str:
+    # Format text specifically for the embedding model if needed
+    return f"{metadata.get('title', '')} [SEP] {chunk}"
+
+def build_data_object(metadata: Dict[str, Any], chunk_index: int, chunk: str, vector: List[float]) -> Dict[str, Any]:
+    data_object = {
+        "title": metadata.get("title", ""),
+        "content": chunk,
+        "authors": metadata.get("authors", ""),
+        "published": metadata.get("published"),
+        "doi": metadata.get('doi', f"uploaded_{metadata.get('title', 'unknown')}_{chunk_index}"),
+        "chunk_index": chunk_index,
+        "vector": vector
+    }
+    if metadata.get("duplicate_of"):
+        data_object["duplicate_of"] = metadata["duplicate_of"]
+    return data_object
+
+
+@dataclass
+class FileIngestResult:
+    """파이프라인에서 파일 하나의 처리 상태"""
+    filename: str
+    status: str = "pending"
+    chunks_total: int = 0
+    chunks_stored: int = 0
+    stored_ids: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    exception: Optional[BaseException] = None
+    doi: Optional[str] = None
+    duplicate_of: Optional[str] = None
+    duplicate_similarity: Optional[float] = None
+    dedup_action: Optional[str] = None  # 근사 중복으로 판정된 경우 link 또는 skip
+    summary_stored: bool = False
+
+    def fail(self, exc: BaseException, message: Optional[str] = None) -> None:
+        if self.exception is None:
+            self.exception = exc
+            self.error = message or str(exc) or exc.__class__.__name__
+        self.status = "failed"
+
+    def as_response(self) -> Dict[str, Any]:
+        return {
+            "filename": self.filename, "status": self.status, "chunks_stored": self.chunks_stored, "error": self.error,
+            "duplicate_of": self.duplicate_of, "duplicate_similarity": self.duplicate_similarity, "dedup_action": self.dedup_action,
+        }
+
+
+@dataclass
+class _SummaryJob:
+    """split → embed → store 큐를 청크 배치와 함께 흐르는 문서 하나의 요약 작업"""
+    i: int
+    metadata: Dict[str, Any]
+    sentences: List[str]
+    summary: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class StageMetrics:
+    """단계별 처리량 및 사용률 (busy: 실제 작업, starved: 입력 대기, blocked: 출력 큐가 가득 차서 대기, yielded: 검색에 양보)"""
+    name: str
+    workers: int = 1
+    items: int = 0
+    busy_seconds: float = 0.0
+    starved_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+    yielded_seconds: float = 0.0
+
+    def as_dict(self, wall_seconds: float) -> Dict[str, Any]:
+        capacity = wall_seconds * self.workers
+        return {
+            "workers": self.workers,
+            "items": self.items,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "starved_seconds": round(self.starved_seconds, 3),
+            "blocked_seconds": round(self.blocked_seconds, 3),
+            "yielded_seconds": round(self.yielded_seconds, 3),
+            "utilization": round(self.busy_seconds / capacity, 3) if capacity else 0.0,
+        }
+
+
+class _MonitoredQueue(queue.Queue):
+    """put/get 시점의 큐 깊이를 샘플링하는 bounded queue"""
+    def __init__(self, name: str, maxsize: int):
+        super().__init__(maxsize=maxsize)
+        self.name = name
+        self.max_depth = 0
+        self._depth_sum = 0
+        self._samples = 0
+
+    def _sample(self) -> None:
+        depth = self._qsize()
+        self.max_depth = max(self.max_depth, depth)
+        self._depth_sum += depth
+        self._samples += 1
+
+    def _put(self, item) -> None:
+        super()._put(item)
+        self._sample()
+
+    def _get(self):
+        item = super()._get()
+        self._sample()
+        return item
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.maxsize,
+            "max_depth": self.max_depth,
+            "mean_depth": round(self._depth_sum / self._samples, 2) if self._samples else 0.0,
+        }
+
+
+class IngestPipeline:
+    """
+    load → split → embed → store 단계를 bounded queue로 연결한 생산자/소비자 수집 파이프라인.
+    각 단계는 별도 스레드에서 동시에 실행되며, 큐가 가득 차면 상위 단계가 대기(backpressure)하므로
+    배치 N의 저장(네트워크 I/O)과 배치 N+1의 임베딩(CPU)이 겹쳐서 진행됩니다.
+    """
+
+    def __init__(self,
+                 repository: DocumentRepository,
+                 loader: DocumentLoader,
+                 splitter: TextSplitter,
+                 embedder: Embedder,
+                 load_workers: Optional[int] = None,
+                 queue_size: Optional[int] = None,
+                 embed_batch_size: Optional[int] = None,
+                 dedup_index: Optional[MinHashLSH] = None,
+                 dedup_action: Optional[str] = None,
+                 summarizer: Optional[ExtractiveSummarizer] = None,
+                 lanes: Optional[ExecutorLanes] = None):
+        self.repository = repository
+        self.loader = loader
+        self.splitter = splitter
+        # 레인이 있으면 수집 임베딩을 자체 torch 스레드 예산을 가진 워커 프로세스에서 실행 (INGEST_LANE_PROCESSES=0이면 그대로)
+        self.embedder = lanes.ingest_embedder(embedder) if lanes is not None else embedder
+        self.load_workers = max(1, load_workers or settings.INGEST_PARSE_WORKERS)
+        self.queue_size = max(1, queue_size or settings.INGEST_QUEUE_SIZE)
+        self.embed_batch_size = max(1, embed_batch_size or settings.EMBEDDING_BATCH_SIZE)
+        self.dedup_index = dedup_index  # None이면 근사 중복 검사 생략
+        self.dedup_action = dedup_action or settings.DEDUP_ACTION
+        if self.dedup_action not in ("link", "skip"):
+            raise ValueError(f"Unsupported dedup action: {self.dedup_action}. Allowed: link, skip")
+        self.summarizer = summarizer  # None이면 문서 요약 생략
+        self.lanes = lanes  # None이면 수집 레인 동시성 제한 및 검색 양보 없이 실행
+
+    def run(self, files: List[Tuple[Path, str]]) -> Tuple[List[FileIngestResult], Dict[str, Any]]:
+        """파일 목록을 처리하고 (입력 순서대로의 파일별 결과, 파이프라인 메트릭)을 반환"""
+        self._results = [FileIngestResult(filename=name) for _, name in files]
+        self._lock = threading.Lock()
+        self._abort = threading.Event()
+        self._inputs: queue.Queue = queue.Queue()
+        for item in enumerate(files):
+            self._inputs.put(item)
+        self._queues = {
+            "split": _MonitoredQueue("load->split", self.queue_size * self.load_workers),
+            "embed": _MonitoredQueue("split->embed", self.queue_size),
+            "store": _MonitoredQueue("embed->store", self.queue_size),
+        }
+        self._metrics = {
+            "load": StageMetrics("load", workers=min(self.load_workers, len(files)) or 1),
+            "split": StageMetrics("split"),
+            "embed": StageMetrics("embed"),
+            "store": StageMetrics("store"),
+        }
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=self._guard, args=("load", self._load_stage), name=f"ingest-load-{n}")
+                   for n in range(self._metrics["load"].workers)]
+        threads += [
+            threading.Thread(target=self._guard, args=("split", self._split_stage), name="ingest-split"),
+            threading.Thread(target=self._guard, args=("embed", self._embed_stage), name="ingest-embed"),
+            threading.Thread(target=self._guard, args=("store", self._store_stage), name="ingest-store"),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - started
+
+        for result in self._results:
+            if result.status == "pending":
+                if result.chunks_total and result.chunks_stored == result.chunks_total:
+                    result.status = "success"
+                else:
+                    result.fail(RuntimeError("Ingest pipeline aborted before the document was stored."))
+            if result.status == "failed" and result.chunks_stored:
+                self._rollback(result)
+        if self.dedup_index is not None:
+            # 저장되지 않은 문서의 서명은 제거해야 이후 재업로드가 존재하지 않는 문서의 중복으로 판정되지 않음
+            for result in self._results:
+                if result.doi and result.chunks_stored == 0 and result.dedup_action != "skip":
+                    self.dedup_index.remove(result.doi)
+            self.dedup_index.save()
+
+        stages = {name: m.as_dict(wall) for name, m in self._metrics.items()}
+        metrics = {
+            "files": len(files),
+            "wall_seconds": round(wall, 3),
+            "stages": stages,
+            "queues": {q.name: q.as_dict() for q in self._queues.values()},
+            "bottleneck": max(stages, key=lambda name: stages[name]["utilization"]) if files else None,
+        }
+        utilization = ", ".join(f"{name}={stage['utilization']:.0%}" for name, stage in stages.items())
+        logger.info(f"Ingest pipeline finished {len(files)} files in {wall:.2f}s. Utilization: {utilization}; bottleneck={metrics['bottleneck']}")
+        global last_pipeline_metrics
+        last_pipeline_metrics = metrics
+        return self._results, metrics
+
+    def _rollback(self, result: FileIngestResult) -> None:
+        """실패한 문서의 이미 저장된 청크를 DOI 기준으로 삭제해 부분 저장을 남기지 않음"""
+        try:
+            self.repository.delete_by_doi(result.doi)
+        except Exception as e:
+            logger.error(f"Rollback of '{result.filename}' failed: {e}")
+            result.error = f"{result.error} ({result.chunks_stored}/{result.chunks_total} stored chunks could not be removed)"
+            return
+        logger.info(f"Rolled back {result.chunks_stored} stored chunks of failed document '{result.filename}'.")
+        result.chunks_stored = 0
+        result.stored_ids.clear()
+
+    # --- 큐 헬퍼 (중단 신호를 주기적으로 확인) ---
+    def _guard(self, stage: str, target) -> None:
+        """단계에서 예상치 못한 예외가 나면 파이프라인 전체를 중단시켜 다른 단계가 멈춰 있지 않도록 함"""
+        try:
+            target()
+        except Exception as e:
+            logger.critical(f"Ingest stage '{stage}' crashed: {e}", exc_info=True)
+            self._abort.set()
+
+    def _put(self, stage: str, q: queue.Queue, item) -> bool:
+        waited = time.perf_counter()
+        try:
+            while not self._abort.is_set():
+                try:
+                    q.put(item, timeout=_POLL_SECONDS)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            with self._lock:
+                self._metrics[stage].blocked_seconds += time.perf_counter() - waited
+
+    def _get(self, stage: str, q: queue.Queue):
+        waited = time.perf_counter()
+        try:
+            while not self._abort.is_set():
+                try:
+                    return q.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    continue
+            return _END
+        finally:
+            with self._lock:
+                self._metrics[stage].starved_seconds += time.perf_counter() - waited
+
+    def _yield_to_search(self) -> None:
+        """임베딩 배치 사이에서 진행 중인 검색이 끝날 때까지 양보"""
+        if self.lanes is None:
+            return
+        waited = self.lanes.yield_to_search()
+        if waited:
+            with self._lock:
+                self._metrics["embed"].yielded_seconds += waited
+
+    def _record_busy(self, stage: str, started: float, items: int = 1) -> None:
+        with self._lock:
+            self._metrics[stage].busy_seconds += time.perf_counter() - started
+            self._metrics[stage].items += items
+
+    # --- 단계 구현 ---
+    def _load_stage(self) -> None:
+        """파일 파싱 (여러 워커). 모든 워커가 끝날 때마다 종료 신호를 하나씩 보냄"""
+        try:
+            while not self._abort.is_set():
+                try:
+                    i, (file_path, original_filename) = self._inputs.get_nowait()
+                except queue.Empty:
+                    break
+                started = time.perf_counter()
+                try:
+                    content = self.loader.load_document(file_path)
+                except Exception as e:
+                    logger.error(f"Ingest load failed for '{original_filename}': {e}")
+                    with self._lock:
+                        self._results[i].fail(e)
+                    continue
+                finally:
+                    self._record_busy("load", started)
+                if not content:
+                    logger.warning(f"No content loaded from {original_filename}. Skipping further processing.")
+                    with self._lock:
+                        self._results[i].status = "skipped"
+                        self._results[i].error = "No text content could be extracted."
+                    continue
+                if self.dedup_index is not None and self._check_duplicate(i, file_path, original_filename, content):
+                    continue
+                if not self._put("load", self._queues["split"], (i, file_path, original_filename, content)):
+                    return
+        finally:
+            self._put("load", self._queues["split"], _END)
+
+    def _check_duplicate(self, i: int, file_path: Path, original_filename: str, content: str) -> bool:
+        """MinHash LSH로 기존 문서와의 근사 중복 여부를 판정. 건너뛰어야 하면 True"""
+        started = time.perf_counter()
+        doi = build_metadata(file_path, original_filename)["doi"]
+        try:
+            signature = self.dedup_index.signature(content)
+            if signature is None:
+                return False
+            duplicate_of, similarity = self.dedup_index.check_and_add(doi, signature, add_if_duplicate=self.dedup_action == "link")
+        finally:
+            self._record_busy("load", started, items=0)
+        with self._lock:
+            result = self._results[i]
+            result.doi = doi
+            if duplicate_of is None:
+                return False
+            result.duplicate_of = duplicate_of
+            result.duplicate_similarity = round(similarity, 4)
+            result.dedup_action = self.dedup_action
+            logger.info(f"'{original_filename}' is a near-duplicate of '{duplicate_of}' (estimated Jaccard {similarity:.2f}); action={self.dedup_action}.")
+            if self.dedup_action == "skip":
+                result.status = "skipped"
+                result.error = f"Near-duplicate of '{duplicate_of}' (estimated Jaccard {similarity:.2f})."
+                return True
+        return False
+
+    def _split_stage(self) -> None:
+        """청크 분할 후 여러 파일의 청크를 embed_batch_size 크기의 배치로 묶어 전달"""
+        finished_loaders = 0
+        pending: List[Tuple[int, int, str, Dict[str, Any]]] = []
+        try:
+            while finished_loaders < self._metrics["load"].workers:
+                item = self._get("split", self._queues["split"])
+                if item is _END:
+                    if self._abort.is_set():
+                        return
+                    finished_loaders += 1
+                    continue
+                i, file_path, original_filename, content = item
+                started = time.perf_counter()
+                try:
+                    chunks = self.splitter.split_text(content)
+                except Exception as e:
+                    logger.error(f"Ingest split failed for '{original_filename}': {e}")
+                    with self._lock:
+                        self._results[i].fail(e)
+                    continue
+                finally:
+                    self._record_busy("split", started)
+                if not chunks:
+                    logger.warning(f"No text chunks generated for {original_filename}. Skipping storage.")
+                    with self._lock:
+                        self._results[i].status = "skipped"
+                        self._results[i].error = "No text chunks could be generated."
+                    continue
+                metadata = build_metadata(file_path, original_filename)
+                with self._lock:
+                    self._results[i].chunks_total = len(chunks)
+                    self._results[i].doi = metadata["doi"]  # 실패 시 되돌릴 저장 단위
+                    metadata["duplicate_of"] = self._results[i].duplicate_of
+                pending.extend((i, chunk_index, chunk, metadata) for chunk_index, chunk in enumerate(chunks))
+                while len(pending) >= self.embed_batch_size:
+                    batch, pending = pending[:self.embed_batch_size], pending[self.embed_batch_size:]
+                    if not self._put("split", self._queues["embed"], batch):
+                        return
+                if self.summarizer is not None:
+                    started = time.perf_counter()
+                    sentences = self.summarizer.split_sentences(content)
+                    self._record_busy("split", started, items=0)
+                    if sentences and not self._put("split", self._queues["embed"], _SummaryJob(i, metadata, sentences)):
+                        return
+            if pending:
+                self._put("split", self._queues["embed"], pending)
+        finally:
+            self._put("split", self._queues["embed"], _END)
+
+    def _embed_stage(self) -> None:
+        """배치 단위 임베딩 (forward pass 1회 / 배치)"""
+        try:
+            while True:
+                batch = self._get("embed", self._queues["embed"])
+                if batch is _END:
+                    return
+                if isinstance(batch, _SummaryJob):
+                    if not self._summarize(batch):
+                        return
+                    continue
+                live = [item for item in batch if self._results[item[0]].status != "failed"]
+                if not live:
+                    continue
+                self._yield_to_search()
+                started = time.perf_counter()
+                try:
+                    vectors = self.embedder.embed_documents([chunk_embedding_text(metadata, chunk) for _, _, chunk, metadata in live])
+                except Exception as e:
+                    logger.error(f"Ingest embedding failed for a batch of {len(live)} chunks: {e}")
+                    with self._lock:
+                        for i in {item[0] for item in live}:
+                            self._results[i].fail(e, "Embedding generation failed for one or more chunks.")
+                    continue
+                finally:
+                    self._record_busy("embed", started, len(live))
+                objects = [(i, build_data_object(metadata, chunk_index, chunk, vector))
+                           for (i, chunk_index, chunk, metadata), vector in zip(live, vectors)]
+                if not self._put("embed", self._queues["store"], objects):
+                    return
+        finally:
+            self._put("embed", self._queues["store"], _END)
+
+    def _summarize(self, job: _SummaryJob) -> bool:
+        """문장 임베딩 + TextRank로 요약을 계산해 저장 단계로 전달. 요약 실패는 문서 저장을 실패시키지 않음"""
+        if self._results[job.i].status == "failed":
+            return True
+        self._yield_to_search()
+        started = time.perf_counter()
+        try:
+            vectors = self.embedder.embed_documents(job.sentences)
+            job.summary = self.summarizer.select(job.sentences, vectors)
+        except Exception as e:
+            logger.warning(f"Summary generation failed for '{self._results[job.i].filename}': {e}")
+            return True
+        finally:
+            self._record_busy("embed", started, items=0)
+        return job.summary is None or self._put("embed", self._queues["store"], job)
+
+    def _store_stage(self) -> None:
+        """배치 단위 저장. 저장 중에도 임베딩 단계는 다음 배치를 계속 처리"""
+        summaries: List[_SummaryJob] = []
+        while True:
+            batch = self._get("store", self._queues["store"])
+            if batch is _END:
+                if not self._abort.is_set():
+                    self._store_summaries(summaries)
+                return
+            if isinstance(batch, _SummaryJob):
+                summaries.append(batch)  # 문서의 모든 청크가 저장된 뒤에만 저장하도록 마지막까지 보류
+                continue
+            live = [(i, obj) for i, obj in batch if self._results[i].status != "failed"]
+            if not live:
+                continue
+            started = time.perf_counter()
+            try:
+                stored_ids = self.repository.store_processed_data([obj for _, obj in live])
+            except Exception as e:
+                logger.error(f"Ingest storage failed for a batch of {len(live)} chunks: {e}")
+                with self._lock:
+                    for i in {i for i, _ in live}:
+                        self._results[i].fail(e, "Database storage failed.")
+                continue
+            finally:
+                self._record_busy("store", started, len(live))
+            stored = set(stored_ids)
+            with self._lock:
+                for i, obj in live:
+                    object_id = f"{obj['doi']}_{obj['chunk_index']}"
+                    if object_id in stored:
+                        self._results[i].chunks_stored += 1
+                        self._results[i].stored_ids.append(object_id)
+
+    def _store_summaries(self, jobs: List[_SummaryJob]) -> None:
+        """청크가 모두 저장된 문서의 요약만 한 번의 배치로 저장"""
+        complete = [job for job in jobs
+                    if self._results[job.i].status != "failed" and self._results[job.i].chunks_total
+                    and self._results[job.i].chunks_stored == self._results[job.i].chunks_total]
+        if not complete:
+            return
+        started = time.perf_counter()
+        try:
+            failed_dois = set(self.repository.store_summaries([{
+                "doi": job.metadata.get("doi"), "title": job.metadata.get("title", ""),
+                "authors": job.metadata.get("authors", ""), "published": job.metadata.get("published"),
+                **job.summary,
+            } for job in complete]))
+        except Exception as e:
+            logger.error(f"Summary storage failed for {len(complete)} documents: {e}")
+            return
+        finally:
+            self._record_busy("store", started, items=0)
+        with self._lock:
+            for job in complete:
+                self._results[job.i].summary_stored = job.metadata.get("doi") not in failed_dois
+
+
+# 가장 최근 파이프라인 실행 메트릭 (/ingest/metrics에서 조회)
+last_pipeline_metrics: Optional[Dict[str, Any]] = None
+
+def get_last_pipeline_metrics() -> Optional[Dict[str, Any]]:
+    return last_pipeline_metrics
@@ -0,0 +1,266 @@
+# service/snapshot_service.py
+import hashlib
+import json
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+
+import numpy as np
+
+from core.config import settings
+from repository.document_repository import DocumentRepository, DOCUMENT_PROPERTIES, OPTIONAL_PROPERTIES, SUMMARY_PROPERTIES
+from utils.exporter import DocumentExporter, require_pyarrow, pa, pq
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+METADATA_FILE = "chunks.parquet"
+VECTORS_FILE = "vectors.f32"  # 행 우선(row-major) float32 원시 배열, np.memmap으로 로드
+SUMMARIES_FILE = "summaries.parquet"  # 문서 요약 컬렉션 (벡터 없음)
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def row_checksum(properties: Dict[str, Any], vector: Optional[np.ndarray]) -> str:
+    """속성 + float32 벡터에 대한 짧은 체크섬 (스냅샷과 복원 결과 비교용)"""
+    canonical = {}
+    for name in DOCUMENT_PROPERTIES:
+        value = properties.get(name)
+        if isinstance(value, datetime):
+            value = value.astimezone(timezone.utc).isoformat(timespec="milliseconds")
+        elif name == "chunk_index" and value is not None:
+            value = int(value)
+        elif value is None and name in OPTIONAL_PROPERTIES:
+            continue
+        canonical[name] = value
+    digest = hashlib.blake2b(json.dumps(canonical, sort_keys=True, ensure_ascii=False).encode("utf-8"), digest_size=8)
+    if vector is not None:
+        digest.update(np.asarray(vector, dtype=np.float32).tobytes())
+    return digest.hexdigest()
+
+
+def summary_arrow_schema():
+    """문서 요약 컬렉션(SUMMARY_PROPERTIES)의 Arrow 스키마"""
+    require_pyarrow()
+    return pa.schema([
+        pa.field("doi", pa.string()),
+        pa.field("title", pa.string()),
+        pa.field("authors", pa.string()),
+        pa.field("published", pa.timestamp("us", tz="UTC")),
+        pa.field("summary", pa.string()),
+        pa.field("sentences", pa.list_(pa.string())),
+        pa.field("sentence_indexes", pa.list_(pa.int64())),
+        pa.field("total_sentences", pa.int64()),
+    ])
+
+
+class SnapshotService:
+    """
+    RAG 인덱스를 컬럼 파일로 스냅샷/복원하는 서비스.
+    청크 속성은 Parquet(zstd), 벡터는 float32 원시 파일로 저장하여 재임베딩 없이 노드를 재구축합니다.
+    문서 요약 컬렉션(DocumentSummaries)도 별도 Parquet 파일로 함께 저장/복원합니다.
+    """
+    def __init__(self, repository: DocumentRepository):
+        if repository is None:
+            raise ValueError("DocumentRepository instance is required.")
+        require_pyarrow()
+        self.repository = repository
+
+    # --- 스냅샷 생성 ---
+    def create_snapshot(self, target_dir: Path) -> Dict[str, Any]:
+        """컬렉션 전체를 커서로 순회하며 속성과 벡터를 스트리밍으로 기록하고 manifest를 반환"""
+        target_dir = Path(target_dir)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        logger.info(f"Creating snapshot in '{target_dir}'...")
+
+        exporter = DocumentExporter(properties=DOCUMENT_PROPERTIES, include_vector=False)
+        schema = exporter.arrow_schema().append(pa.field("has_vector", pa.bool_())).append(pa.field("checksum", pa.string()))
+        state = {"rows": 0, "dim": None}
+
+        with open(target_dir / VECTORS_FILE, "wb") as vector_file, \
+                pq.ParquetWriter(target_dir / METADATA_FILE, schema, compression="zstd") as writer:
+            records = self.repository.iter_documents(properties=DOCUMENT_PROPERTIES, include_vector=True)
+            for batch in exporter.iter_record_batches(self._split_vectors(records, vector_file, state), schema):
+                writer.write_batch(batch)
+        summary_rows = self._write_summaries(target_dir / SUMMARIES_FILE)
+
+        manifest = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "collection": self.repository.db_manager.collection_name,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "rows": state["rows"],
+            "vector_dim": state["dim"] or 0,
+            "summary_rows": summary_rows,
+            "vector_dtype": "float32",
+            "embedding_model": settings.EMBEDDING_MODEL_NAME,
+            "files": {"metadata": METADATA_FILE, "vectors": VECTORS_FILE, "summaries": SUMMARIES_FILE},
+        }
+        (target_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        logger.info(f"Snapshot created: {state['rows']} rows (dim={state['dim']}), {summary_rows} summaries "
+                    f"in {time.perf_counter() - started:.1f}s.")
+        return manifest
+
+    def _write_summaries(self, path: Path) -> int:
+        """요약 컬렉션을 커서로 순회하며 SNAPSHOT_BATCH_SIZE 단위 row group으로 기록하고 행 수를 반환"""
+        rows = 0
+        batch: List[Dict[str, Any]] = []
+        with pq.ParquetWriter(path, summary_arrow_schema(), compression="zstd") as writer:
+            for record in self.repository.iter_summaries():
+                batch.append(record)
+                if len(batch) >= settings.SNAPSHOT_BATCH_SIZE:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=summary_arrow_schema()))
+                    rows += len(batch)
+                    batch.clear()
+            if batch:
+                writer.write_table(pa.Table.from_pylist(batch, schema=summary_arrow_schema()))
+                rows += len(batch)
+        return rows
+
+    def _split_vectors(self, records: Iterator[Dict[str, Any]], vector_file, state: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """벡터는 원시 파일에 바로 기록하고, 나머지 속성 + 체크섬만 Parquet 배치 쪽으로 넘김"""
+        for record in records:
+            vector = record.pop("vector", None)
+            array = np.asarray(vector, dtype=np.float32) if vector else None
+            if array is not None and state["dim"] is None:
+                state["dim"] = array.shape[0]
+            if state["dim"] is None:
+                raise ValueError("The first streamed object has no vector; cannot determine vector dimension.")
+            if array is None or array.shape[0] != state["dim"]:
+                logger.warning(f"Object {record.get('uuid')} has a missing or mismatched vector; stored as NaN row.")
+                record["has_vector"] = False
+                array = np.full(state["dim"], np.nan, dtype=np.float32)
+            else:
+                record["has_vector"] = True
+            vector_file.write(array.tobytes())
+            record["checksum"] = row_checksum(record, array if record["has_vector"] else None)
+            state["rows"] += 1
+            yield record
+
+    # --- 복원 ---
+    def restore_snapshot(self, source_dir: Path, batch_size: Optional[int] = None,
+                         concurrent_requests: Optional[int] = None) -> Dict[str, Any]:
+        """스냅샷을 읽어 Weaviate에 원래 UUID 그대로 대량 적재"""
+        source_dir = Path(source_dir)
+        manifest = self.read_manifest(source_dir)
+        started = time.perf_counter()
+        logger.info(f"Restoring snapshot '{source_dir}' ({manifest['rows']} rows)...")
+
+        added, failed = self.repository.bulk_insert(
+            self._iter_snapshot_objects(source_dir, manifest),
+            batch_size=batch_size,
+            concurrent_requests=concurrent_requests
+        )
+        summaries_inserted, summaries_failed = self._restore_summaries(source_dir, manifest)
+        elapsed = time.perf_counter() - started
+        logger.info(f"Snapshot restored: {added} objects ({failed} failed), {summaries_inserted} summaries "
+                    f"({summaries_failed} failed) in {elapsed:.1f}s ({added / elapsed if elapsed else 0:.0f} obj/s).")
+        return {"rows": manifest["rows"], "inserted": added - failed, "failed": failed + summaries_failed,
+                "summaries_inserted": summaries_inserted, "summaries_failed": summaries_failed,
+                "elapsed_seconds": round(elapsed, 2)}
+
+    def _restore_summaries(self, source_dir: Path, manifest: Dict[str, Any]) -> Tuple[int, int]:
+        """요약 Parquet을 배치 단위로 읽어 DOI 기반 UUID로 다시 저장. 요약 파일이 없는 이전 스냅샷은 건너뜀"""
+        summaries_file = manifest["files"].get("summaries")
+        if not summaries_file or not (source_dir / summaries_file).exists():
+            return 0, 0
+        inserted = failed = 0
+        parquet_file = pq.ParquetFile(source_dir / summaries_file)
+        for batch in parquet_file.iter_batches(batch_size=settings.SNAPSHOT_BATCH_SIZE):
+            rows = batch.to_pylist()
+            failed_dois = self.repository.store_summaries(rows)
+            inserted += len(rows) - len(failed_dois)
+            failed += len(failed_dois)
+        return inserted, failed
+
+    def _iter_snapshot_objects(self, source_dir: Path, manifest: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        vectors = self.open_vectors(source_dir, manifest)
+        offset = 0
+        parquet_file = pq.ParquetFile(source_dir / METADATA_FILE)
+        for batch in parquet_file.iter_batches(batch_size=settings.SNAPSHOT_BATCH_SIZE):
+            rows = batch.to_pylist()
+            block = vectors[offset:offset + len(rows)] if vectors is not None else None
+            for i, row in enumerate(rows):
+                properties = {name: row.get(name) for name in DOCUMENT_PROPERTIES if row.get(name) is not None}
+                vector = block[i].tolist() if block is not None and row.get("has_vector") else None
+                yield {"uuid": row["uuid"], "properties": properties, "vector": vector}
+            offset += len(rows)
+
+    # --- 검증 ---
+    def verify_snapshot(self, source_dir: Path, sample_size: Optional[int] = None) -> Dict[str, Any]:
+        """객체 수 비교 + 무작위 표본 행의 체크섬을 컬렉션에서 다시 계산해 비교"""
+        source_dir = Path(source_dir)
+        manifest = self.read_manifest(source_dir)
+        if sample_size is None: sample_size = settings.SNAPSHOT_VERIFY_SAMPLE_SIZE
+
+        live_count = self.repository.count_documents()
+        live_summaries = self.repository.count_summaries() if "summary_rows" in manifest else None
+        sample = self._reservoir_sample(source_dir, sample_size)
+        live = self.repository.fetch_by_ids([row["uuid"] for row in sample], include_vector=True)
+
+        mismatched: List[str] = []
+        missing: List[str] = []
+        for row in sample:
+            record = live.get(row["uuid"])
+            if record is None:
+                missing.append(row["uuid"])
+                continue
+            vector = record.pop("vector", None)
+            checksum = row_checksum(record, np.asarray(vector, dtype=np.float32) if vector and row["has_vector"] else None)
+            if checksum != row["checksum"]:
+                mismatched.append(row["uuid"])
+
+        report = {
+            "snapshot_rows": manifest["rows"],
+            "collection_rows": live_count,
+            "count_match": live_count == manifest["rows"],
+            "snapshot_summary_rows": manifest.get("summary_rows"),
+            "collection_summary_rows": live_summaries,
+            "summary_count_match": live_summaries == manifest.get("summary_rows"),
+            "sampled": len(sample),
+            "missing": missing,
+            "checksum_mismatches": mismatched,
+        }
+        report["ok"] = report["count_match"] and report["summary_count_match"] and not missing and not mismatched
+        log = logger.info if report["ok"] else logger.warning
+        log(f"Snapshot verification: ok={report['ok']} (rows {manifest['rows']} vs {live_count}, "
+            f"{len(missing)} missing, {len(mismatched)} mismatched of {len(sample)} sampled)")
+        return report
+
+    def _reservoir_sample(self, source_dir: Path, sample_size: int) -> List[Dict[str, Any]]:
+        """uuid/checksum 컬럼만 배치로 읽으며 크기 고정 표본 추출"""
+        rng = random.Random()
+        sample: List[Dict[str, Any]] = []
+        seen = 0
+        parquet_file = pq.ParquetFile(source_dir / METADATA_FILE)
+        for batch in parquet_file.iter_batches(columns=["uuid", "has_vector", "checksum"]):
+            for row in batch.to_pylist():
+                seen += 1
+                if len(sample) < sample_size:
+                    sample.append(row)
+                else:
+                    j = rng.randrange(seen)
+                    if j < sample_size:
+                        sample[j] = row
+        return sample
+
+    # --- 파일 헬퍼 ---
+    @staticmethod
+    def read_manifest(source_dir: Path) -> Dict[str, Any]:
+        manifest_path = Path(source_dir) / MANIFEST_FILE
+        if not manifest_path.exists():
+            raise ValueError(f"Snapshot manifest not found: {manifest_path}")
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format version: {manifest.get('format_version')}")
+        return manifest
+
+    @staticmethod
+    def open_vectors(source_dir: Path, manifest: Dict[str, Any]) -> Optional[np.memmap]:
+        """벡터 파일을 (rows, dim) 형태의 읽기 전용 memmap으로 열기 (필요한 페이지만 로드)"""
+        if not manifest["rows"] or not manifest["vector_dim"]:
+            return None
+        return np.memmap(Path(source_dir) / manifest["files"]["vectors"], dtype=np.float32, mode="r",
+                         shape=(manifest["rows"], manifest["vector_dim"]))
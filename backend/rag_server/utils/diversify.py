@@ -0,0 +1,116 @@
+# utils/diversify.py
+import logging
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from models.schemas import SimilarityResult
+
+logger = logging.getLogger(__name__)
+
+
+def mmr_select(query_vector: Sequence[float], candidate_vectors: np.ndarray, k: int, lambda_mult: float,
+               relevance: Optional[np.ndarray] = None) -> List[int]:
+    """
+    Maximal Marginal Relevance: lambda * 관련도 - (1 - lambda) * 이미 선택된 항목과의 최대 유사도가 가장 큰 후보를 차례로 선택.
+    후보 간 코사인 유사도 행렬을 한 번 계산하고, 선택할 때마다 '선택 집합과의 최대 유사도' 벡터만 갱신하므로 O(k * n)입니다.
+    relevance를 주지 않으면 쿼리와의 코사인 유사도를 사용합니다. 선택된 후보의 인덱스를 선택 순서대로 반환합니다.
+    """
+    vectors = np.asarray(candidate_vectors, dtype=np.float32)
+    n = vectors.shape[0]
+    if n == 0 or k <= 0:
+        return []
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    vectors = vectors / norms
+    if relevance is None:
+        query = np.asarray(query_vector, dtype=np.float32)
+        relevance = vectors @ (query / (np.linalg.norm(query) or 1.0))
+    relevance = np.asarray(relevance, dtype=np.float32)
+    similarity = vectors @ vectors.T
+
+    selected: List[int] = []
+    max_similarity = np.full(n, -np.inf, dtype=np.float32)  # 선택 집합과의 최대 유사도 (첫 선택 전에는 패널티 없음)
+    available = np.ones(n, dtype=bool)
+    for _ in range(min(k, n)):
+        penalty = np.where(np.isfinite(max_similarity), max_similarity, 0.0)
+        scores = lambda_mult * relevance - (1.0 - lambda_mult) * penalty
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        max_similarity = np.maximum(max_similarity, similarity[best])
+    return selected
+
+
+def _overlap_length(left: str, right: str, max_overlap: int) -> int:
+    """left의 접미사 == right의 접두사인 최장 길이 (KMP 실패 함수로 O(max_overlap))"""
+    m = min(len(left), len(right), max_overlap)
+    if m == 0:
+        return 0
+    pattern = right[:m] + "\x00" + left[-m:]
+    failure = [0] * len(pattern)
+    for i in range(1, len(pattern)):
+        j = failure[i - 1]
+        while j and pattern[i] != pattern[j]:
+            j = failure[j - 1]
+        if pattern[i] == pattern[j]:
+            j += 1
+        failure[i] = j
+    return failure[-1]
+
+
+def stitch_texts(texts: Sequence[str], max_overlap: int, min_overlap: int = 20) -> str:
+    """
+    chunk_index 순서의 인접 청크 텍스트를 이어 붙이면서 청크 간 겹치는 부분(CHUNK_OVERLAP)을 한 번만 남김.
+    min_overlap보다 짧은 일치는 우연으로 보고 줄바꿈으로 연결합니다.
+    """
+    stitched = ""
+    for text in texts:
+        if not stitched:
+            stitched = text
+            continue
+        overlap = _overlap_length(stitched, text, max_overlap)
+        stitched = stitched + text[overlap:] if overlap >= min_overlap else f"{stitched}\n{text}"
+    return stitched
+
+
+def merge_adjacent_chunks(results: List[SimilarityResult], max_overlap: int) -> List[SimilarityResult]:
+    """
+    같은 doi에서 chunk_index가 연속인 검색 결과를 하나로 병합 (겹침 제거 후 텍스트 연결).
+    병합된 결과는 가장 높은 점수의 청크 점수/벡터를 유지하고, 그 청크의 순위 위치에 놓입니다.
+    """
+    groups: dict = {}
+    for position, result in enumerate(results):
+        groups.setdefault(result.doi, []).append((position, result))
+
+    merged: List[tuple] = []  # (순위 위치, 결과)
+    for doi, items in groups.items():
+        indexed = sorted((item for item in items if item[1].chunk_index is not None), key=lambda item: item[1].chunk_index)
+        merged.extend(item for item in items if item[1].chunk_index is None)
+        run: List[tuple] = []
+        for item in indexed:
+            if run and item[1].chunk_index > run[-1][1].chunk_index + 1:
+                merged.append(_merge_run(run, max_overlap))
+                run = []
+            if not run or item[1].chunk_index != run[-1][1].chunk_index:  # 같은 청크 중복은 건너뜀
+                run.append(item)
+        if run:
+            merged.append(_merge_run(run, max_overlap))
+
+    merged.sort(key=lambda item: item[0])
+    if len(merged) < len(results):
+        logger.debug(f"Merged adjacent chunks: {len(results)} -> {len(merged)} results.")
+    return [result for _, result in merged]
+
+
+def _merge_run(run: List[tuple], max_overlap: int) -> tuple:
+    if len(run) == 1:
+        return run[0]
+    best_position, best = min(run, key=lambda item: item[0])  # 순위가 가장 높은(점수 최대) 청크
+    result = best.model_copy(update={
+        "content": stitch_texts([r.content for _, r in run], max_overlap),
+        "chunk_index": run[0][1].chunk_index,
+        "merged_chunk_indexes": [r.chunk_index for _, r in run],
+    })
+    return best_position, result
@@ -1,17 +1,58 @@
 # utils/document_loader.py
 import logging
 from pathlib import Path
+from typing import List, Optional
 from langchain_community.document_loaders import (
     TextLoader, PyPDFLoader, UnstructuredWordDocumentLoader
 )
 
+from utils.text_cache import ParsedTextCache, get_text_cache
+
 logger = logging.getLogger(__name__)
 
+# 추출 로직(로더 종류/옵션)이 바뀌면 올려서 기존 캐시 항목을 무효화
+LOADER_VERSION = "1"
+
 class DocumentLoader:
     """파일 경로를 받아 내용을 텍스트로 로드하는 컴포넌트"""
 
+    def __init__(self, cache: Optional[ParsedTextCache] = None):
+        self.cache = cache  # 선택 의존성: None이면 매번 파싱
+
     def load_document(self, file_path: Path) -> str:
         """파일 확장자에 따라 적절한 로더를 사용하여 문서 내용을 로드"""
+        pages = self.load_pages(file_path)
+        content = "\n".join(pages).strip()
+
+        if not content:
+             logger.warning(f"No content extracted from {file_path.name}. The file might be empty or unreadable.")
+             return ""
+        return content
+
+    def load_pages(self, file_path: Path) -> List[str]:
+        """페이지(로더 Document) 단위 텍스트 목록 반환. 캐시에 있으면 파싱을 건너뜀"""
+        cache_key = None
+        if self.cache:
+            try:
+                cache_key = self.cache.make_key(self.cache.file_digest(file_path), file_path.suffix, LOADER_VERSION)
+                pages = self.cache.get(cache_key)
+                if pages is not None:
+                    logger.info(f"Parsed text cache hit for: {file_path.name} ({len(pages)} pages)")
+                    return pages
+            except FileNotFoundError:
+                 logger.error(f"File not found: {file_path}")
+                 raise
+            except OSError as e:
+                 logger.warning(f"Parsed text cache lookup failed for {file_path.name}: {e}")
+                 cache_key = None
+
+        pages = self._parse_pages(file_path)
+        if self.cache and cache_key and pages:
+            self.cache.put(cache_key, pages, {"source_name": file_path.name})
+        return pages
+
+    def _parse_pages(self, file_path: Path) -> List[str]:
+        """확장자에 맞는 LangChain 로더로 파일을 파싱"""
         file_extension = file_path.suffix.lower()
         logger.info(f"Loading document: {file_path.name} (type: {file_extension})")
 
@@ -29,14 +70,10 @@ class DocumentLoader:
 
             docs = loader.load()
 
-            content = "\n".join([doc.page_content for doc in docs if doc.page_content and isinstance(doc.page_content, str)]).strip()
-
-            if not content:
-                 logger.warning(f"No content extracted from {file_path.name}. The file might be empty or unreadable.")
-                 return ""
+            pages = [doc.page_content for doc in docs if doc.page_content and isinstance(doc.page_content, str)]
 
             logger.info(f"Successfully loaded content from: {file_path.name}")
-            return content
+            return pages
 
         except FileNotFoundError:
              logger.error(f"File not found: {file_path}")
@@ -54,4 +91,4 @@ class DocumentLoader:
 # --- 팩토리 함수 추가 ---
 def get_document_loader() -> DocumentLoader:
     """FastAPI Depends를 위한 DocumentLoader 인스턴스 반환 함수"""
-    return DocumentLoader()
\ No newline at end of file
+    return DocumentLoader(cache=get_text_cache())
\ No newline at end of file
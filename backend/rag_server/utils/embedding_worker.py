@@ -0,0 +1,36 @@
+# utils/embedding_worker.py
+"""
+수집 임베딩 워커 프로세스에서 실행되는 함수들.
+spawn된 워커가 이 모듈만 import하도록 executors(전역 레인 생성)와 분리했습니다.
+"""
+import logging
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+try:
+    import torch
+except ImportError:  # torch가 없으면 스레드 수 설정만 생략
+    torch = None
+
+_worker_embedder = None
+
+
+def set_torch_threads(num_threads: int) -> None:
+    """torch intra-op 스레드 수 설정 (프로세스 전역 설정이므로 프로세스당 한 번만 호출)"""
+    if torch is not None and num_threads > 0:
+        torch.set_num_threads(num_threads)
+
+
+def init_embedding_worker(torch_threads: int) -> None:
+    """워커 프로세스 initializer: 이 프로세스의 torch 스레드 수를 정한 뒤 임베딩 모델 로드"""
+    global _worker_embedder
+    set_torch_threads(torch_threads)
+    from utils.embedder import embedder_instance  # import 시 워커 프로세스마다 모델 한 벌을 로드
+    if embedder_instance is None:
+        raise RuntimeError("Embedding model could not be loaded in the ingest worker process.")
+    _worker_embedder = embedder_instance
+
+
+def embed_documents(documents: List[str]) -> List[List[float]]:
+    return _worker_embedder.embed_documents(documents)
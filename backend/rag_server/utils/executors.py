@@ -0,0 +1,202 @@
+# utils/executors.py
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+from core.config import settings
+from utils import embedding_worker
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessEmbedder:
+    """
+    수집 임베딩을 워커 프로세스 풀에서 실행하는 embed_documents 호환 래퍼.
+    워커 프로세스를 시작할 수 없으면(모델 로드 실패 등) 한 번 경고를 남기고 이후 메인 프로세스 임베더로 처리합니다.
+    """
+
+    def __init__(self, fallback, pool_factory: Callable[[], Optional[ProcessPoolExecutor]]):
+        self.fallback = fallback
+        self._pool_factory = pool_factory
+        self._broken = False
+
+    def embed_documents(self, documents: List[str]) -> List[List[float]]:
+        if not documents:
+            return []
+        pool = None if self._broken else self._pool_factory()
+        if pool is None:
+            return self.fallback.embed_documents(documents)
+        try:
+            return pool.submit(embedding_worker.embed_documents, documents).result()
+        except BrokenProcessPool as e:
+            self._broken = True
+            logger.warning(f"Ingest embedding worker pool is unavailable ({e}); embedding in the main process.")
+            return self.fallback.embed_documents(documents)
+
+
+class SearchPriorityGate:
+    """
+    처리 중(대기 포함)인 검색 요청 수를 세고, 수집 작업이 임베딩 배치 사이에서 검색이 모두 끝날 때까지 양보하게 하는 게이트.
+    수집이 무한정 멈추지 않도록 배치당 대기 시간은 max_yield_ms로 제한합니다.
+    """
+
+    def __init__(self, max_yield_ms: float):
+        self.max_yield_ms = max_yield_ms
+        self._condition = threading.Condition()
+        self._active = 0
+        self._searches = 0
+        self._yields = 0
+        self._yield_seconds = 0.0
+
+    def enter_search(self) -> None:
+        with self._condition:
+            self._active += 1
+            self._searches += 1
+
+    def exit_search(self) -> None:
+        with self._condition:
+            self._active -= 1
+            if self._active == 0:
+                self._condition.notify_all()
+
+    def yield_to_search(self) -> float:
+        """검색이 진행 중이면 끝날 때까지(최대 max_yield_ms) 대기하고 대기한 초를 반환"""
+        with self._condition:
+            if self._active == 0:
+                return 0.0
+            started = time.perf_counter()
+            self._condition.wait_for(lambda: self._active == 0, timeout=self.max_yield_ms / 1000)
+            waited = time.perf_counter() - started
+            self._yields += 1
+            self._yield_seconds += waited
+            return waited
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "active_searches": self._active,
+                "searches_total": self._searches,
+                "ingest_yields": self._yields,
+                "ingest_yield_seconds": round(self._yield_seconds, 3),
+            }
+
+
+class ExecutorLanes:
+    """
+    검색과 수집을 서로 다른 스레드 풀(레인)에서 실행.
+    큰 업로드의 임베딩이 모든 코어를 점유해 대화형 검색 지연이 늘어나는 것을 막기 위해,
+    수집 레인은 동시에 실행할 파이프라인 수를 제한하고 검색이 들어오면 임베딩 배치 사이에서 양보합니다.
+    torch 스레드 수는 프로세스 전역이므로, ingest_processes > 0이면 수집 임베딩을 별도 워커 프로세스에서 실행해
+    메인 프로세스(검색)는 search_torch_threads, 워커 프로세스는 각자 ingest_torch_threads로 예산을 분리합니다.
+    0이면 임베딩이 메인 프로세스에서 torch 스레드 풀을 공유하므로 스레드 수를 바꾸지 않습니다.
+    """
+
+    def __init__(self, search_workers: int, search_torch_threads: int, ingest_workers: int, ingest_processes: int,
+                 ingest_torch_threads: int, max_yield_ms: float):
+        cpu_count = os.cpu_count() or 1
+        self.search_torch_threads = max(1, search_torch_threads)
+        self.ingest_processes = max(0, ingest_processes)
+        # 0이면 검색 몫을 뺀 나머지 코어를 수집 워커 프로세스들에 나눠 배정
+        self.ingest_torch_threads = ingest_torch_threads if ingest_torch_threads > 0 else \
+            max(1, (cpu_count - self.search_torch_threads) // max(1, self.ingest_processes))
+        self.gate = SearchPriorityGate(max_yield_ms)
+        self._search_pool = ThreadPoolExecutor(max_workers=max(1, search_workers), thread_name_prefix="lane-search")
+        self._ingest_pool = ThreadPoolExecutor(max_workers=max(1, ingest_workers), thread_name_prefix="lane-ingest")
+        self._embed_pool: Optional[ProcessPoolExecutor] = None
+        self._embed_pool_lock = threading.Lock()
+        self._search_workers = max(1, search_workers)
+        self._ingest_workers = max(1, ingest_workers)
+        if self.ingest_processes:
+            embedding_worker.set_torch_threads(self.search_torch_threads)
+            logger.info(f"ExecutorLanes initialized: search={self._search_workers} workers x {self.search_torch_threads} torch threads, "
+                        f"ingest={self._ingest_workers} workers -> {self.ingest_processes} embedding processes x "
+                        f"{self.ingest_torch_threads} torch threads (cpu_count={cpu_count}, torch={'yes' if embedding_worker.torch else 'no'}).")
+        else:
+            logger.info(f"ExecutorLanes initialized: search={self._search_workers} workers, ingest={self._ingest_workers} workers, "
+                        f"in-process embedding with shared torch threads (cpu_count={cpu_count}).")
+
+    def _embedding_pool(self) -> Optional[ProcessPoolExecutor]:
+        """수집 임베딩 프로세스 풀 (첫 수집 시 생성, 비활성화 시 None)"""
+        if not self.ingest_processes:
+            return None
+        with self._embed_pool_lock:
+            if self._embed_pool is None:
+                # fork는 부모의 torch 스레드 풀 상태를 복제하므로 spawn으로 새 프로세스를 시작
+                self._embed_pool = ProcessPoolExecutor(max_workers=self.ingest_processes,
+                                                       mp_context=multiprocessing.get_context("spawn"),
+                                                       initializer=embedding_worker.init_embedding_worker,
+                                                       initargs=(self.ingest_torch_threads,))
+            return self._embed_pool
+
+    def ingest_embedder(self, embedder):
+        """수집 파이프라인이 사용할 임베더 (워커 프로세스를 쓰지 않으면 그대로 반환)"""
+        if not self.ingest_processes:
+            return embedder
+        return ProcessEmbedder(embedder, self._embedding_pool)
+
+    def yield_to_search(self) -> float:
+        return self.gate.yield_to_search()
+
+    async def run_search(self, fn: Callable, *args, **kwargs):
+        """검색 레인에서 실행. 대기열에 들어간 시점부터 수집이 양보하도록 제출 전에 게이트에 등록"""
+        self.gate.enter_search()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._search_pool, functools.partial(fn, *args, **kwargs))
+        finally:
+            self.gate.exit_search()
+
+    async def run_ingest(self, fn: Callable, *args, **kwargs):
+        """수집 레인에서 실행 (레인 워커 수를 넘는 업로드는 대기열에서 순서를 기다림)"""
+        return await asyncio.get_running_loop().run_in_executor(self._ingest_pool, functools.partial(fn, *args, **kwargs))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": True,
+            "search": {"workers": self._search_workers,
+                       "torch_threads": self.search_torch_threads if self.ingest_processes else None,
+                       "queued": self._search_pool._work_queue.qsize()},
+            "ingest": {"workers": self._ingest_workers, "embedding_processes": self.ingest_processes,
+                       "torch_threads": self.ingest_torch_threads if self.ingest_processes else None,
+                       "embedding_pool_started": self._embed_pool is not None,
+                       "queued": self._ingest_pool._work_queue.qsize()},
+            **self.gate.stats(),
+        }
+
+    def shutdown(self) -> None:
+        self._search_pool.shutdown(wait=False, cancel_futures=True)
+        self._ingest_pool.shutdown(wait=True)
+        if self._embed_pool is not None:
+            self._embed_pool.shutdown(wait=True)
+
+
+async def run_search(lanes: Optional[ExecutorLanes], fn: Callable, *args, **kwargs):
+    """레인이 비활성화되어 있으면 FastAPI 기본 스레드 풀에서 실행"""
+    if lanes is None:
+        return await run_in_threadpool(fn, *args, **kwargs)
+    return await lanes.run_search(fn, *args, **kwargs)
+
+async def run_ingest(lanes: Optional[ExecutorLanes], fn: Callable, *args, **kwargs):
+    if lanes is None:
+        return await run_in_threadpool(fn, *args, **kwargs)
+    return await lanes.run_ingest(fn, *args, **kwargs)
+
+
+# --- 전역 인스턴스 생성 및 팩토리 함수 ---
+executor_lanes_instance: Optional[ExecutorLanes] = None
+if settings.EXECUTOR_LANES_ENABLED:
+    executor_lanes_instance = ExecutorLanes(settings.SEARCH_LANE_WORKERS, settings.SEARCH_TORCH_THREADS,
+                                            settings.INGEST_LANE_WORKERS, settings.INGEST_LANE_PROCESSES,
+                                            settings.INGEST_TORCH_THREADS, settings.INGEST_YIELD_MAX_MS)
+
+def get_executor_lanes() -> Optional[ExecutorLanes]:
+    """검색/수집 실행 레인 반환 (비활성화 시 None)"""
+    return executor_lanes_instance
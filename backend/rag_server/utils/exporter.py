@@ -0,0 +1,174 @@
+# utils/exporter.py
+import io
+import json
+import logging
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Iterable, Iterator
+from core.config import settings
+from repository.document_repository import DOCUMENT_PROPERTIES, DocumentRepository
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Arrow/Parquet 내보내기에서만 필요한 선택 의존성
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def require_pyarrow() -> None:
+    """pyarrow가 설치되어 있지 않으면 RuntimeError 발생"""
+    if pa is None:
+        raise RuntimeError("pyarrow is required for Arrow/Parquet export. Install it with 'pip install pyarrow'.")
+
+
+def export_collection(repository: DocumentRepository, fmt: str = "ndjson", properties: Optional[List[str]] = None,
+                      include_vector: bool = False) -> Iterator[bytes]:
+    """
+    컬렉션 전체를 커서로 순회하며 지정한 포맷의 바이트 스트림으로 직렬화 (스트리밍 시작 전 입력 검증).
+    임베딩 모델 없이 저장소만 사용합니다. 잘못된 포맷/속성은 ValueError, pyarrow 미설치는 RuntimeError.
+    청크 컬렉션만 대상이며 문서 요약(DocumentSummaries)은 스키마가 달라 제외합니다 (스냅샷에는 포함).
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}. Allowed: {', '.join(EXPORT_FORMATS)}")
+    exporter = DocumentExporter(properties=properties, include_vector=include_vector)
+    if fmt != "ndjson":
+        require_pyarrow()
+    records = repository.iter_documents(properties=exporter.properties, include_vector=include_vector)
+    return exporter.serialize(records, fmt)
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    pyarrow writer가 쓴 바이트를 모아두었다가 drain() 시점에 꺼내주는 쓰기 전용 스트림.
+    위치(tell)는 직접 관리하므로 버퍼를 비워도 Parquet 오프셋이 깨지지 않습니다.
+    """
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class DocumentExporter:
+    """컬렉션 레코드 스트림을 NDJSON / Arrow IPC / Parquet 바이트 스트림으로 직렬화하는 컴포넌트"""
+
+    def __init__(self, properties: Optional[List[str]] = None, include_vector: bool = False,
+                 batch_size: Optional[int] = None):
+        self.properties = list(properties) if properties else list(DOCUMENT_PROPERTIES)
+        invalid = [name for name in self.properties if name not in DOCUMENT_PROPERTIES]
+        if invalid:
+            raise ValueError(f"Unknown properties: {', '.join(invalid)}. Allowed: {', '.join(DOCUMENT_PROPERTIES)}")
+        self.include_vector = include_vector
+        self.batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+
+    def serialize(self, records: Iterable[Dict[str, Any]], fmt: str) -> Iterator[bytes]:
+        """지정한 포맷으로 레코드를 직렬화하여 바이트 청크를 순차적으로 반환"""
+        if fmt == "ndjson":
+            return self.iter_ndjson(records)
+        if fmt == "arrow":
+            return self.iter_arrow(records)
+        if fmt == "parquet":
+            return self.iter_parquet(records)
+        raise ValueError(f"Unsupported export format: {fmt}. Allowed: {', '.join(EXPORT_FORMATS)}")
+
+    def iter_ndjson(self, records: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        """레코드 1개당 JSON 한 줄. batch_size 줄 단위로 묶어서 내보냅니다."""
+        lines: List[str] = []
+        for record in records:
+            if record.get("chunk_index") is not None:
+                record = {**record, "chunk_index": int(record["chunk_index"])}  # NUMBER 속성(float)을 Parquet과 같은 정수로
+            lines.append(json.dumps(record, ensure_ascii=False, default=self._json_default))
+            if len(lines) >= self.batch_size:
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+                lines.clear()
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+    def iter_arrow(self, records: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        """Arrow IPC 스트림 포맷. 레코드 배치 단위로 내보냅니다."""
+        require_pyarrow()
+        schema = self.arrow_schema()
+        sink = _ChunkSink()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            for batch in self.iter_record_batches(records, schema):
+                writer.write_batch(batch)
+                yield sink.drain()
+        yield sink.drain()
+
+    def iter_parquet(self, records: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        """Parquet 포맷. 레코드 배치마다 row group 하나를 기록합니다."""
+        require_pyarrow()
+        schema = self.arrow_schema()
+        sink = _ChunkSink()
+        with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+            for batch in self.iter_record_batches(records, schema):
+                writer.write_batch(batch)
+                yield sink.drain()
+        yield sink.drain()
+
+    def arrow_schema(self):
+        """선택된 속성에 맞는 Arrow 스키마 생성"""
+        require_pyarrow()
+        types = {
+            "title": pa.string(),
+            "content": pa.string(),
+            "authors": pa.string(),
+            "published": pa.timestamp("us", tz="UTC"),
+            "doi": pa.string(),
+            "chunk_index": pa.int64(),
+        }
+        fields = [pa.field("uuid", pa.string())]
+        fields += [pa.field(name, types.get(name, pa.string())) for name in self.properties]
+        if self.include_vector:
+            fields.append(pa.field("vector", pa.list_(pa.float32())))
+        return pa.schema(fields)
+
+    def iter_record_batches(self, records: Iterable[Dict[str, Any]], schema=None) -> Iterator["pa.RecordBatch"]:
+        """레코드를 batch_size 단위의 Arrow RecordBatch로 묶어 반환 (한 번에 한 배치만 메모리에 유지)"""
+        require_pyarrow()
+        schema = schema or self.arrow_schema()
+        columns: Dict[str, list] = {name: [] for name in schema.names}
+        rows = 0
+        for record in records:
+            for name in schema.names:
+                value = record.get(name)
+                if name == "chunk_index" and value is not None:
+                    value = int(value)
+                columns[name].append(value)
+            rows += 1
+            if rows >= self.batch_size:
+                yield pa.RecordBatch.from_pydict(columns, schema=schema)
+                columns = {name: [] for name in schema.names}
+                rows = 0
+        if rows:
+            yield pa.RecordBatch.from_pydict(columns, schema=schema)
+
+    @staticmethod
+    def _json_default(value: Any):
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return str(value)
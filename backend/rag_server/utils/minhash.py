@@ -0,0 +1,213 @@
+# utils/minhash.py
+import json
+import logging
+import os
+import re
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+SHINGLE_BLOCK = 8192  # 서명 계산 시 한 번에 처리할 shingle 수 (num_perm x block 임시 행렬 크기 제한)
+_WORD_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+
+SIGNATURES_FILE = "signatures.npy"
+DOC_IDS_FILE = "doc_ids.json"
+
+
+def shingle_hashes(text: str, shingle_size: int) -> np.ndarray:
+    """
+    소문자 단어 단위 shingle의 31비트 해시 집합.
+    단어 해시(crc32)를 한 번만 계산하고, shingle 해시는 단어 해시의 다항식 결합으로 벡터화하여 계산합니다.
+    """
+    words = _WORD_PATTERN.findall(text.lower())
+    if not words:
+        return np.zeros(0, dtype=np.uint64)
+    word_hashes = np.fromiter((zlib.crc32(w.encode("utf-8")) for w in words), dtype=np.uint64, count=len(words))
+    if len(words) < shingle_size:
+        shingle_size = len(words)
+    count = len(words) - shingle_size + 1
+    combined = np.zeros(count, dtype=np.uint64)
+    with np.errstate(over="ignore"):  # uint64 오버플로는 2^64 모듈러 연산으로 의도된 동작
+        for offset in range(shingle_size):
+            combined = combined * np.uint64(1000003) + word_hashes[offset:offset + count]
+    folded = (combined ^ (combined >> np.uint64(31))) % MERSENNE_PRIME
+    return np.unique(folded)
+
+
+class MinHasher:
+    """(a * x + b) mod (2^31 - 1) 형태의 num_perm개 해시 순열로 MinHash 서명을 계산"""
+
+    def __init__(self, num_perm: int, shingle_size: int, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.a = rng.integers(1, int(MERSENNE_PRIME), size=num_perm, dtype=np.uint64)[:, None]
+        self.b = rng.integers(0, int(MERSENNE_PRIME), size=num_perm, dtype=np.uint64)[:, None]
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """텍스트의 MinHash 서명 (uint32, 길이 num_perm). shingle이 없으면 None"""
+        hashes = shingle_hashes(text, self.shingle_size)
+        if hashes.size == 0:
+            return None
+        signature = np.full(self.num_perm, int(MERSENNE_PRIME), dtype=np.uint64)
+        for start in range(0, hashes.size, SHINGLE_BLOCK):
+            block = hashes[start:start + SHINGLE_BLOCK][None, :]
+            # a, x < 2^31 이므로 a * x + b < 2^63: uint64 범위 내에서 정확히 계산됨
+            signature = np.minimum(signature, ((self.a * block + self.b) % MERSENNE_PRIME).min(axis=1))
+        return signature.astype(np.uint32)
+
+    @staticmethod
+    def jaccard(left: np.ndarray, right: np.ndarray) -> float:
+        """두 서명이 일치하는 비율 = Jaccard 유사도 추정치"""
+        return float(np.mean(left == right))
+
+
+class MinHashLSH:
+    """
+    MinHash 서명의 밴드(band) LSH 인덱스. 서명을 bands x rows로 나눠 밴드별 버킷에 넣고,
+    같은 버킷을 공유하는 문서만 후보로 비교하므로 조회 비용이 전체 문서 수가 아니라 버킷 크기에 비례합니다.
+    서명은 디렉토리에 저장되며, 버킷은 로드 시 메모리에서 재구성합니다.
+    """
+
+    def __init__(self, index_dir: Path, num_perm: int, bands: int, threshold: float, shingle_size: int):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands}).")
+        self.index_dir = Path(index_dir)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm, shingle_size)  # 시드 고정: 저장된 서명과 같은 순열을 사용해야 함
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._buckets: List[Dict[bytes, set]] = [dict() for _ in range(bands)]
+        self._dirty = False
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self._load()
+        logger.info(f"MinHashLSH initialized at '{self.index_dir}' ({len(self._signatures)} documents, "
+                    f"{bands} bands x {self.rows} rows, candidate threshold ~{(1 / bands) ** (1 / self.rows):.2f}).")
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        return self.hasher.signature(text)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def _insert(self, doc_id: str, signature: np.ndarray) -> None:
+        self._signatures[doc_id] = signature
+        for band, key in zip(self._buckets, self._band_keys(signature)):
+            band.setdefault(key, set()).add(doc_id)
+
+    def _best_match(self, signature: np.ndarray, exclude: Optional[str] = None) -> Tuple[Optional[str], float]:
+        candidates = set()
+        for band, key in zip(self._buckets, self._band_keys(signature)):
+            candidates |= band.get(key, set())
+        candidates.discard(exclude)  # 같은 문서를 다시 수집하는 경우 자기 자신과는 비교하지 않음
+        best_id, best_similarity = None, 0.0
+        for doc_id in candidates:
+            similarity = MinHasher.jaccard(signature, self._signatures[doc_id])
+            if similarity > best_similarity:
+                best_id, best_similarity = doc_id, similarity
+        return best_id, best_similarity
+
+    def query(self, signature: np.ndarray) -> Tuple[Optional[str], float]:
+        """threshold 이상인 가장 유사한 기존 문서 (doc_id, 추정 Jaccard), 없으면 (None, 최고 유사도)"""
+        with self._lock:
+            best_id, similarity = self._best_match(signature)
+        return (best_id, similarity) if similarity >= self.threshold else (None, similarity)
+
+    def check_and_add(self, doc_id: str, signature: np.ndarray, add_if_duplicate: bool) -> Tuple[Optional[str], float]:
+        """
+        조회와 삽입을 하나의 잠금 안에서 수행 (같은 배치의 중복 파일끼리도 서로를 찾도록).
+        중복이 아니면 항상 추가하고, 중복이면 add_if_duplicate일 때만 추가합니다.
+        """
+        with self._lock:
+            best_id, similarity = self._best_match(signature, exclude=doc_id)
+            duplicate_of = best_id if similarity >= self.threshold else None
+            if duplicate_of is None or add_if_duplicate:
+                self._insert(doc_id, signature)
+                self._dirty = True
+        return duplicate_of, similarity
+
+    def remove(self, doc_id: str) -> None:
+        """저장에 실패한 문서를 인덱스에서 제거"""
+        with self._lock:
+            signature = self._signatures.pop(doc_id, None)
+            if signature is None:
+                return
+            for band, key in zip(self._buckets, self._band_keys(signature)):
+                members = band.get(key)
+                if members is not None:
+                    members.discard(doc_id)
+                    if not members:
+                        del band[key]
+            self._dirty = True
+
+    def save(self) -> None:
+        """변경이 있을 때만 서명 행렬과 문서 ID 목록을 임시 파일에 쓴 뒤 원자적으로 교체"""
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                doc_ids = list(self._signatures)
+                matrix = np.stack([self._signatures[d] for d in doc_ids]) if doc_ids else np.zeros((0, self.num_perm), dtype=np.uint32)
+                self._dirty = False
+            tmp_signatures = self.index_dir / f".{SIGNATURES_FILE}.tmp"
+            tmp_ids = self.index_dir / f".{DOC_IDS_FILE}.tmp"
+            try:
+                with open(tmp_signatures, "wb") as f:
+                    np.save(f, matrix)
+                tmp_ids.write_text(json.dumps({"num_perm": self.num_perm, "doc_ids": doc_ids}), encoding="utf-8")
+                os.replace(tmp_signatures, self.index_dir / SIGNATURES_FILE)
+                os.replace(tmp_ids, self.index_dir / DOC_IDS_FILE)
+            except OSError as e:
+                logger.error(f"Failed to persist MinHash LSH index: {e}")
+                with self._lock:
+                    self._dirty = True
+
+    def _load(self) -> None:
+        ids_path, signatures_path = self.index_dir / DOC_IDS_FILE, self.index_dir / SIGNATURES_FILE
+        if not ids_path.exists() or not signatures_path.exists():
+            return
+        meta = json.loads(ids_path.read_text(encoding="utf-8"))
+        if meta.get("num_perm") != self.num_perm:
+            logger.warning(f"MinHash index at '{self.index_dir}' uses num_perm={meta.get('num_perm')}; ignoring it (rebuild required).")
+            return
+        matrix = np.load(signatures_path)
+        for doc_id, signature in zip(meta["doc_ids"], matrix):
+            self._insert(doc_id, signature)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            bucket_sizes = [len(members) for band in self._buckets for members in band.values()]
+            return {
+                "enabled": True,
+                "documents": len(self._signatures),
+                "bands": self.bands,
+                "rows": self.rows,
+                "threshold": self.threshold,
+                "max_bucket_size": max(bucket_sizes, default=0),
+            }
+
+
+# --- 전역 인스턴스 생성 및 팩토리 함수 ---
+dedup_index_instance: Optional[MinHashLSH] = None
+if settings.DEDUP_ENABLED:
+    try:
+        dedup_index_instance = MinHashLSH(settings.DEDUP_INDEX_DIR, settings.DEDUP_NUM_PERM, settings.DEDUP_BANDS,
+                                          settings.DEDUP_JACCARD_THRESHOLD, settings.DEDUP_SHINGLE_SIZE)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not initialize near-duplicate detection at '{settings.DEDUP_INDEX_DIR}': {e}. Dedup disabled.")
+
+def get_dedup_index() -> Optional[MinHashLSH]:
+    """근사 중복 문서 LSH 인덱스 반환 (비활성화 시 None)"""
+    return dedup_index_instance
@@ -0,0 +1,171 @@
+# utils/reranker.py
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.config import settings
+from models.schemas import SimilarityResult
+
+logger = logging.getLogger(__name__)
+
+
+class CrossEncoderReranker:
+    """
+    밀집 검색(dense retrieval) 후보를 (쿼리, 청크) 쌍 단위로 다시 점수화하는 CPU 크로스 인코더 재순위화 컴포넌트.
+    요청별 시간 예산(budget) 안에서 배치 단위로 점수를 계산하고, 예산이 소진되면 남은 후보는 밀집 검색 순서를 유지합니다.
+    점수는 (쿼리 해시, 청크 ID) 키의 LRU 캐시에 저장됩니다.
+    """
+
+    def __init__(self, model_name: str, device: str, batch_size: int, max_length: int, cache_size: int):
+        self.model_name = model_name
+        self.device = device
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.cache_size = cache_size
+        self.model = None  # 서버 시작 시 load()로 로드
+        self._model_lock = threading.Lock()
+        self._load_error: Optional[str] = None
+        self._cache: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._budget_exhausted = 0
+        logger.info(f"CrossEncoderReranker configured (model={model_name}, batch_size={batch_size}, cache_size={cache_size}).")
+
+    def load(self) -> bool:
+        """
+        크로스 인코더 모델 로드 (서버 시작 시 호출, 이미 로드되었으면 즉시 반환).
+        재순위화는 선택 단계이므로 실패해도 예외 없이 경고만 남기고 False를 반환하며, 이후 요청은 밀집 검색 순서를 사용합니다.
+        """
+        if self.model is not None:
+            return True
+        if self._load_error is not None:
+            return False
+        with self._model_lock:
+            if self.model is not None:
+                return True
+            if self._load_error is not None:
+                return False
+            logger.info(f"Loading cross-encoder model: {self.model_name} on device: {self.device}")
+            try:
+                from sentence_transformers import CrossEncoder
+                self.model = CrossEncoder(self.model_name, device=self.device, max_length=self.max_length)
+            except Exception as e:
+                self._load_error = str(e)
+                logger.warning(f"Cross-encoder model '{self.model_name}' could not be loaded; rerank requests will return dense order: {e}")
+                return False
+            logger.info(f"Cross-encoder model '{self.model_name}' loaded successfully.")
+            return True
+
+    @staticmethod
+    def query_key(query_text: str) -> str:
+        return hashlib.blake2b(query_text.strip().encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def chunk_id(result: SimilarityResult) -> str:
+        return f"{result.doi}_{result.chunk_index}"
+
+    def _cache_get(self, key: Tuple[str, str]) -> Optional[float]:
+        with self._cache_lock:
+            score = self._cache.get(key)
+            if score is None:
+                self._cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._cache_hits += 1
+            return score
+
+    def _cache_put(self, key: Tuple[str, str], score: float) -> None:
+        with self._cache_lock:
+            self._cache[key] = score
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def rerank(self, query_text: str, candidates: List[SimilarityResult], budget_ms: float) -> Tuple[List[SimilarityResult], Dict[str, Any]]:
+        """
+        밀집 검색 순서의 후보를 재순위화. 점수는 밀집 순서대로 배치 단위로 계산되며,
+        다음 배치가 남은 예산 안에 끝나지 않을 것으로 예상되면 중단합니다.
+        점수가 매겨진 앞부분(prefix)만 rerank_score 기준으로 정렬하고, 나머지는 밀집 순서 그대로 뒤에 붙입니다.
+        """
+        info: Dict[str, Any] = {"candidates": len(candidates), "cached": 0, "scored": 0, "complete": True, "elapsed_ms": 0.0}
+        if not candidates:
+            return candidates, info
+        started = time.perf_counter()
+        deadline = started + budget_ms / 1000.0
+        if not self.load():  # 시작 시 로드되지 않았다면 로드 시간도 요청 예산에 포함
+            info.update(complete=False, reranked=0, model_unavailable=True,
+                        elapsed_ms=round((time.perf_counter() - started) * 1000, 2))
+            return candidates, info
+        query_hash = self.query_key(query_text)
+        scores: List[Optional[float]] = [self._cache_get((query_hash, self.chunk_id(c))) for c in candidates]
+        info["cached"] = sum(score is not None for score in scores)
+
+        pending = [i for i, score in enumerate(scores) if score is None]
+        batch_seconds = 0.0  # 직전 배치 소요 시간 (다음 배치 소요 시간 추정치)
+        for offset in range(0, len(pending), self.batch_size):
+            now = time.perf_counter()
+            if now + batch_seconds > deadline:
+                info["complete"] = False
+                break
+            batch = pending[offset:offset + self.batch_size]
+            try:
+                batch_scores = self.model.predict(
+                    [(query_text, candidates[i].content) for i in batch],
+                    batch_size=self.batch_size, show_progress_bar=False
+                )
+            except Exception as e:
+                logger.error(f"Cross-encoder scoring failed: {e}", exc_info=True)
+                info["complete"] = False
+                break
+            for i, score in zip(batch, batch_scores):
+                scores[i] = float(score)
+                self._cache_put((query_hash, self.chunk_id(candidates[i])), float(score))
+            info["scored"] += len(batch)
+            batch_seconds = time.perf_counter() - now
+
+        if not info["complete"]:
+            self._budget_exhausted += 1
+        for candidate, score in zip(candidates, scores):
+            candidate.rerank_score = score
+
+        # 밀집 순서상 연속으로 점수가 있는 앞부분만 재정렬
+        prefix = 0
+        while prefix < len(scores) and scores[prefix] is not None:
+            prefix += 1
+        reranked = sorted(candidates[:prefix], key=lambda c: c.rerank_score, reverse=True) + candidates[prefix:]
+        info["reranked"] = prefix
+        info["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        logger.debug(f"Rerank finished: {info}")
+        return reranked, info
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cache_lock:
+            lookups = self._cache_hits + self._cache_misses
+            return {
+                "enabled": True,
+                "model_loaded": self.model is not None,
+                "model_error": self._load_error,
+                "cache_size": len(self._cache),
+                "cache_capacity": self.cache_size,
+                "cache_hit_rate": round(self._cache_hits / lookups, 4) if lookups else 0.0,
+                "budget_exhausted": self._budget_exhausted,
+            }
+
+
+# --- 전역 인스턴스 생성 및 팩토리 함수 ---
+# 점수 캐시와 모델은 요청 간에 공유되어야 하므로 싱글톤으로 관리
+reranker_instance = CrossEncoderReranker(
+    model_name=settings.RERANK_MODEL_NAME,
+    device=settings.RERANK_DEVICE,
+    batch_size=settings.RERANK_BATCH_SIZE,
+    max_length=settings.RERANK_MAX_LENGTH,
+    cache_size=settings.RERANK_CACHE_SIZE
+) if settings.RERANK_ENABLED else None
+
+def get_reranker() -> Optional[CrossEncoderReranker]:
+    """FastAPI Depends를 위한 CrossEncoderReranker 인스턴스 반환 함수 (비활성화 시 None)"""
+    return reranker_instance
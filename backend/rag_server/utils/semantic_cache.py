@@ -0,0 +1,167 @@
+# utils/semantic_cache.py
+import hashlib
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    쿼리 임베딩을 키로 사용하는 근사 중복(near-duplicate) 쿼리 캐시.
+    새 쿼리 벡터가 캐시된 쿼리와 코사인 거리 radius 이내이면 캐시된 결과를 반환합니다.
+    조회는 (capacity, dim) 행렬에 대한 단일 행렬-벡터 곱으로 벡터화되어 있고, TTL 만료 및 LRU 방식으로 제거합니다.
+    clear()마다 세대(generation)가 증가하며, 검색 시작 시점의 세대를 넘긴 put은 그 사이 clear가 있었으면 버려집니다.
+    """
+
+    def __init__(self, capacity: int, radius: float, ttl_seconds: float, similarity_history: int = 10000):
+        if capacity <= 0:
+            raise ValueError("Semantic cache capacity must be positive.")
+        self.capacity = capacity
+        self.radius = radius
+        self.ttl_seconds = ttl_seconds
+        self._keys: Optional[np.ndarray] = None  # 첫 put 시점에 임베딩 차원에 맞춰 할당
+        self._namespaces = np.zeros(capacity, dtype=np.int64)
+        self._expires_at = np.zeros(capacity, dtype=np.float64)  # 0 이하 = 빈 슬롯
+        self._last_access = np.zeros(capacity, dtype=np.float64)
+        self._values: List[Any] = [None] * capacity
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._stale_puts = 0
+        self._generation = 0
+        self._hit_similarities: deque = deque(maxlen=similarity_history)
+        logger.info(f"SemanticCache initialized (capacity={capacity}, radius={radius}, ttl={ttl_seconds}s).")
+
+    @staticmethod
+    def namespace_key(namespace: str) -> int:
+        """검색 파라미터 문자열을 int64 키로 변환 (같은 파라미터의 쿼리끼리만 매칭)"""
+        return int.from_bytes(hashlib.blake2b(namespace.encode("utf-8"), digest_size=8).digest(), "little", signed=True)
+
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm > 0 else array
+
+    def get(self, vector, namespace: str = "") -> Optional[Any]:
+        """radius 이내의 가장 가까운 유효 항목 값을 반환, 없으면 None"""
+        query = self._normalize(vector)
+        ns = self.namespace_key(namespace)
+        now = time.monotonic()
+        with self._lock:
+            if self._keys is None or self._keys.shape[1] != query.shape[0]:
+                self._misses += 1
+                return None
+            valid = (self._expires_at > now) & (self._namespaces == ns)
+            if not valid.any():
+                self._misses += 1
+                return None
+            similarities = self._keys @ query
+            similarities[~valid] = -np.inf
+            slot = int(np.argmax(similarities))
+            similarity = float(similarities[slot])
+            if similarity < 1.0 - self.radius:
+                self._misses += 1
+                return None
+            self._last_access[slot] = now
+            self._hits += 1
+            self._hit_similarities.append(similarity)
+            return self._values[slot]
+
+    @property
+    def generation(self) -> int:
+        """현재 세대 (검색 시작 전에 읽어 두었다가 put에 전달)"""
+        with self._lock:
+            return self._generation
+
+    def put(self, vector, value: Any, namespace: str = "", generation: Optional[int] = None) -> None:
+        """
+        빈/만료 슬롯에 저장하고, 가득 찼으면 가장 오래 사용되지 않은 항목을 제거.
+        generation이 현재 세대와 다르면 (검색 도중 clear됨) 낡은 결과이므로 저장하지 않습니다.
+        """
+        key = self._normalize(vector)
+        now = time.monotonic()
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                self._stale_puts += 1
+                return
+            if self._keys is None or self._keys.shape[1] != key.shape[0]:
+                self._keys = np.zeros((self.capacity, key.shape[0]), dtype=np.float32)
+                self._expires_at[:] = 0.0
+                self._values = [None] * self.capacity
+            free = np.flatnonzero(self._expires_at <= now)
+            if free.size:
+                slot = int(free[0])
+            else:
+                slot = int(np.argmin(self._last_access))
+                self._evictions += 1
+            self._keys[slot] = key
+            self._namespaces[slot] = self.namespace_key(namespace)
+            self._expires_at[slot] = now + self.ttl_seconds
+            self._last_access[slot] = now
+            self._values[slot] = value
+
+    def clear(self) -> None:
+        """모든 항목 무효화 (컬렉션 내용이 바뀌었을 때 호출)"""
+        with self._lock:
+            self._expires_at[:] = 0.0
+            self._values = [None] * self.capacity
+            self._generation += 1
+        logger.info("SemanticCache cleared.")
+
+    def stats(self) -> Dict[str, Any]:
+        """적중률 및 적중 시 유사도 분포"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            size = int((self._expires_at > time.monotonic()).sum())
+            similarities = np.fromiter(self._hit_similarities, dtype=np.float64)
+            hits, misses, evictions = self._hits, self._misses, self._evictions
+            stale_puts, generation = self._stale_puts, self._generation
+
+        distribution: Dict[str, Any] = {"count": int(similarities.size)}
+        if similarities.size:
+            lower = min(1.0 - self.radius, float(similarities.min()))
+            counts, edges = np.histogram(similarities, bins=10, range=(lower, 1.0))
+            distribution.update({
+                "min": round(float(similarities.min()), 4),
+                "mean": round(float(similarities.mean()), 4),
+                "p50": round(float(np.percentile(similarities, 50)), 4),
+                "p90": round(float(np.percentile(similarities, 90)), 4),
+                "histogram": {"bin_edges": [round(float(e), 4) for e in edges], "counts": counts.tolist()},
+            })
+        return {
+            "enabled": True,
+            "size": size,
+            "capacity": self.capacity,
+            "radius": self.radius,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "stale_puts_skipped": stale_puts,
+            "generation": generation,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "hit_similarity": distribution,
+        }
+
+
+# --- 전역 인스턴스 생성 및 팩토리 함수 ---
+# 캐시는 요청 간에 공유되어야 하므로 싱글톤으로 관리
+semantic_cache_instance = SemanticCache(
+    capacity=settings.SEMANTIC_CACHE_CAPACITY,
+    radius=settings.SEMANTIC_CACHE_RADIUS,
+    ttl_seconds=settings.SEMANTIC_CACHE_TTL_SECONDS
+) if settings.SEMANTIC_CACHE_ENABLED else None
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """FastAPI Depends를 위한 SemanticCache 인스턴스 반환 함수 (비활성화 시 None)"""
+    return semantic_cache_instance
@@ -0,0 +1,108 @@
+# utils/summarizer.py
+import logging
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_PARAGRAPH_PATTERN = re.compile(r"\n\s*\n")
+_SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?。])\s+")
+_HYPHEN_BREAK_PATTERN = re.compile(r"(\w)-\n(\w)")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+MAX_SENTENCE_CHARS = 600  # 이보다 긴 '문장'은 표/수식/참고문헌 목록이 뭉친 경우가 대부분이라 제외
+
+
+def textrank_scores(vectors: np.ndarray, damping: float = 0.85, max_iter: int = 100, tol: float = 1e-6) -> np.ndarray:
+    """
+    문장 임베딩의 코사인 유사도 그래프에서 TextRank(PageRank) 중심성을 계산.
+    음수 유사도와 자기 루프는 0으로 두고 행 정규화한 전이 행렬로 거듭제곱 반복(power iteration)합니다.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    n = vectors.shape[0]
+    if n == 0:
+        return np.zeros(0, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    unit = vectors / norms
+    weights = np.clip(unit @ unit.T, 0.0, None)
+    np.fill_diagonal(weights, 0.0)
+    row_sums = weights.sum(axis=1, keepdims=True)
+    # 다른 문장과 전혀 닮지 않은 문장(dangling node)은 모든 문장으로 균등하게 전이
+    transition = np.where(row_sums > 0, weights / np.where(row_sums > 0, row_sums, 1.0), 1.0 / n)
+
+    scores = np.full(n, 1.0 / n, dtype=np.float32)
+    teleport = (1.0 - damping) / n
+    for _ in range(max_iter):
+        updated = teleport + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < tol:
+            return updated
+        scores = updated
+    return scores
+
+
+class ExtractiveSummarizer:
+    """
+    문서 텍스트를 문장으로 나누고, 문장 임베딩의 TextRank 중심성이 높은 문장을 원문 순서대로 골라 추출 요약을 만드는 컴포넌트.
+    임베딩은 호출 측(수집 파이프라인의 임베딩 단계)이 수행하므로 이 클래스는 모델을 직접 로드하지 않습니다.
+    """
+
+    def __init__(self, num_sentences: int, max_input_sentences: int, min_sentence_chars: int, damping: float):
+        self.num_sentences = max(1, num_sentences)
+        self.max_input_sentences = max(self.num_sentences, max_input_sentences)
+        self.min_sentence_chars = min_sentence_chars
+        self.damping = damping
+        logger.info(f"ExtractiveSummarizer initialized ({self.num_sentences} sentences, up to {self.max_input_sentences} candidates).")
+
+    def split_sentences(self, text: str) -> List[str]:
+        """
+        요약 후보 문장 목록. 문단 경계와 문장 부호 기준으로 나누고 너무 짧거나 긴 조각, 중복 문장은 제외합니다.
+        후보가 max_input_sentences를 넘으면 문서 전체에서 균등 간격으로 표본을 뽑아 O(n^2) 유사도 행렬 크기를 제한합니다.
+        """
+        text = _HYPHEN_BREAK_PATTERN.sub(r"\1\2", text)  # PDF 줄바꿈 하이픈 복원
+        sentences: List[str] = []
+        seen = set()
+        for paragraph in _PARAGRAPH_PATTERN.split(text):
+            paragraph = _WHITESPACE_PATTERN.sub(" ", paragraph).strip()
+            for sentence in _SENTENCE_END_PATTERN.split(paragraph):
+                sentence = sentence.strip()
+                if not self.min_sentence_chars <= len(sentence) <= MAX_SENTENCE_CHARS or sentence in seen:
+                    continue
+                seen.add(sentence)
+                sentences.append(sentence)
+        if len(sentences) > self.max_input_sentences:
+            picks = np.linspace(0, len(sentences) - 1, self.max_input_sentences).round().astype(int)
+            sentences = [sentences[i] for i in np.unique(picks)]
+        return sentences
+
+    def select(self, sentences: Sequence[str], vectors: Sequence[Sequence[float]]) -> Optional[Dict[str, Any]]:
+        """중심성 상위 num_sentences개 문장을 원문 순서로 이어 붙인 요약과 선택된 문장 위치를 반환 (문장이 없으면 None)"""
+        if not sentences:
+            return None
+        if len(sentences) <= self.num_sentences:
+            chosen = list(range(len(sentences)))
+        else:
+            scores = textrank_scores(np.asarray(vectors, dtype=np.float32), damping=self.damping)
+            top = np.argpartition(-scores, self.num_sentences - 1)[:self.num_sentences]
+            chosen = sorted(int(i) for i in top)
+        selected = [sentences[i] for i in chosen]
+        return {
+            "summary": " ".join(selected),
+            "sentences": selected,
+            "sentence_indexes": chosen,
+            "total_sentences": len(sentences),
+        }
+
+
+# --- 전역 인스턴스 생성 및 팩토리 함수 ---
+summarizer_instance: Optional[ExtractiveSummarizer] = None
+if settings.SUMMARY_ENABLED:
+    summarizer_instance = ExtractiveSummarizer(settings.SUMMARY_SENTENCES, settings.SUMMARY_MAX_INPUT_SENTENCES,
+                                               settings.SUMMARY_MIN_SENTENCE_CHARS, settings.SUMMARY_DAMPING)
+
+def get_summarizer() -> Optional[ExtractiveSummarizer]:
+    """추출 요약 컴포넌트 반환 (비활성화 시 None)"""
+    return summarizer_instance
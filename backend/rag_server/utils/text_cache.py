@@ -0,0 +1,131 @@
+# utils/text_cache.py
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import List, Optional, Dict, Any
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ParsedTextCache:
+    """
+    원본 파일에서 추출한 텍스트를 저장하는 내용 주소 기반(content-addressed) 캐시.
+    키는 파일 sha256 + 확장자 + 로더 버전이며, 페이지 단위 텍스트를 gzip 압축 JSON으로 저장합니다.
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은(mtime 기준) 항목부터 제거합니다.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None  # 첫 put 시점에 디렉토리를 스캔하여 계산
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        logger.info(f"ParsedTextCache initialized at '{self.cache_dir}' (max {max_bytes / (1024 * 1024):.0f}MB).")
+
+    @staticmethod
+    def file_digest(file_path: Path) -> str:
+        """파일 내용의 sha256 (스트리밍 계산)"""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(digest: str, extension: str, loader_version: str) -> str:
+        return f"{digest}.{extension.lstrip('.').lower()}.v{loader_version}"
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json.gz"
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """캐시된 페이지 텍스트 목록 반환, 없으면 None. 적중 시 mtime을 갱신해 LRU 순서를 유지"""
+        path = self._entry_path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)
+            return entry["pages"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Corrupted text cache entry '{path.name}' removed: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, key: str, pages: List[str], metadata: Optional[Dict[str, Any]] = None) -> None:
+        """임시 파일에 쓴 뒤 원자적으로 교체하고, 필요 시 크기 제한에 맞춰 제거"""
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{uuid.uuid4().hex}.tmp")
+        try:
+            with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+                json.dump({"pages": pages, **(metadata or {})}, f, ensure_ascii=False)
+            previous = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)
+            size = path.stat().st_size
+        except OSError as e:
+            logger.error(f"Failed to write text cache entry '{path.name}': {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += size - previous
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _iter_entries(self):
+        return self.cache_dir.glob("*/*.json.gz")
+
+    def _scan_size(self) -> int:
+        return sum(p.stat().st_size for p in self._iter_entries())
+
+    def _evict(self) -> None:
+        """mtime이 오래된 항목부터 삭제하여 max_bytes의 90% 이하로 줄임"""
+        target = int(self.max_bytes * 0.9)
+        entries = []
+        for p in self._iter_entries():
+            try:
+                stat = p.stat()
+                entries.append((stat.st_mtime, stat.st_size, p))
+            except FileNotFoundError:
+                continue
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, p in entries:
+            if total <= target:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        self._total_bytes = total
+        logger.info(f"Text cache eviction removed {removed} entries (now {total / (1024 * 1024):.1f}MB).")
+
+    def stats(self) -> Dict[str, Any]:
+        entries = list(self._iter_entries())
+        total = sum(p.stat().st_size for p in entries)
+        return {"entries": len(entries), "total_bytes": total, "max_bytes": self.max_bytes}
+
+
+# --- 전역 인스턴스 생성 및 팩토리 함수 ---
+text_cache_instance: Optional[ParsedTextCache] = None
+if settings.TEXT_CACHE_ENABLED:
+    try:
+        text_cache_instance = ParsedTextCache(settings.TEXT_CACHE_DIR, settings.TEXT_CACHE_MAX_BYTES)
+    except OSError as e:
+        logger.error(f"Could not create parsed text cache at '{settings.TEXT_CACHE_DIR}': {e}. Caching disabled.")
+
+def get_text_cache() -> Optional[ParsedTextCache]:
+    """추출 텍스트 캐시 인스턴스 반환 (비활성화 시 None)"""
+    return text_cache_instance